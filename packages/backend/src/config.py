@@ -11,16 +11,23 @@ from dataclasses import dataclass, field
 from pathlib import Path
 
 import yaml
-from dotenv import load_dotenv
 
 # ── Load root config ─────────────────────────
 
 _ROOT_DIR = Path(__file__).resolve().parents[3]
 _CONFIG_PATH = _ROOT_DIR / "newsletter.config.yaml"
-_RAW: dict = yaml.safe_load(_CONFIG_PATH.read_text(encoding="utf-8"))
+# libyaml's loader parses an order of magnitude faster when available.
+_RAW: dict = yaml.load(
+    _CONFIG_PATH.read_text(encoding="utf-8"),
+    Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader),
+)
 
-# Load .env from the project root.
-load_dotenv(_ROOT_DIR / ".env")
+# Load .env from the project root (python-dotenv is only imported if there is one).
+_ENV_PATH = _ROOT_DIR / ".env"
+if _ENV_PATH.exists():
+    from dotenv import load_dotenv
+
+    load_dotenv(_ENV_PATH)
 
 
 def _csv(val: str) -> list[str]:
@@ -28,6 +35,15 @@ def _csv(val: str) -> list[str]:
     return [s.strip() for s in val.split(",") if s.strip()]
 
 
+@dataclass(frozen=True)
+class Location:
+    """A named point used for weather and astronomy lookups."""
+
+    latitude: float
+    longitude: float
+    name: str
+
+
 @dataclass(frozen=True)
 class Config:
     """Immutable configuration for the newsletter backend.
@@ -55,6 +71,7 @@ class Config:
     weather_location_name: str = os.getenv(
         "WEATHER_LOCATION", _RAW.get("weather", {}).get("location", "圣尼维尔，加州")
     )
+    weather_grid_degrees: float = float(_RAW.get("weather", {}).get("gridDegrees", 0.1))
 
     # ── News (RSS feeds) ─────────────────────
     news_feeds: list[str] = field(
@@ -64,6 +81,8 @@ class Config:
     news_max_items: int = int(
         os.getenv("NEWS_MAX_ITEMS", str(_RAW.get("news", {}).get("maxItems", 5)))
     )
+    news_feed_timeout: float = float(_RAW.get("news", {}).get("feedTimeoutSeconds", 8))
+    news_dedup_threshold: float = float(_RAW.get("news", {}).get("dedupThreshold", 0.3))
 
     # ── Stocks (yfinance, no API key) ────────
     stock_symbols: list[str] = field(
@@ -84,6 +103,10 @@ class Config:
     hn_max_stories: int = int(
         os.getenv("HN_MAX_STORIES", str(_RAW.get("hackerNews", {}).get("maxStories", 5)))
     )
+    hn_max_concurrency: int = int(
+        os.getenv("HN_MAX_CONCURRENCY", str(_RAW.get("hackerNews", {}).get("maxConcurrency", 8)))
+    )
+    hn_score_ttl: float = float(_RAW.get("hackerNews", {}).get("scoreTtlSeconds", 900))
 
     # ── Schedule / Timezone ──────────────────
     timezone: str = os.getenv(
@@ -111,6 +134,13 @@ class Config:
         )
     )
     gemini_model: str = _RAW.get("arxiv", {}).get("geminiModel", "gemini-2.0-flash")
+    arxiv_summary_chunk_tokens: int = int(
+        _RAW.get("arxiv", {}).get("summaryChunkTokens", 2000)
+    )
+    gemini_min_call_gap: float = float(_RAW.get("gemini", {}).get("minCallGapSeconds", 1.0))
+    gemini_max_concurrency: int = int(_RAW.get("gemini", {}).get("maxConcurrentCalls", 2))
+    gemini_stream_timeout: float = float(_RAW.get("gemini", {}).get("streamTimeoutSeconds", 60))
+    arxiv_merge_queries: bool = bool(_RAW.get("arxiv", {}).get("mergeQueries", False))
 
     # ── LLM Ranking ─────────────────────────
     ranking_enabled: bool = (
@@ -123,6 +153,13 @@ class Config:
             str(_RAW.get("ranking", {}).get("fetchMultiplier", 3)),
         )
     )
+    ranking_shortlist_multiplier: int = int(
+        _RAW.get("ranking", {}).get("shortlistMultiplier", 2)
+    )
+    ranking_interests: list[str] = field(
+        default_factory=lambda: _csv(os.getenv("RANKING_INTERESTS", ""))
+        or _RAW.get("ranking", {}).get("interests", [])
+    )
 
     # ── Exchange Rates ───────────────────────
     exchange_rate_pairs: list[str] = field(
@@ -136,10 +173,68 @@ class Config:
         )
     )
 
+    # ── Fetch engine ─────────────────────────
+    fetch_mode: str = os.getenv(
+        "FETCH_MODE", _RAW.get("fetch", {}).get("mode", "threads")
+    ).lower()
+    fetch_max_workers: int = int(
+        os.getenv("FETCH_MAX_WORKERS", str(_RAW.get("fetch", {}).get("maxWorkers", 10)))
+    )
+    http_max_connections: int = int(_RAW.get("fetch", {}).get("maxConnections", 20))
+    http_max_per_host: int = int(_RAW.get("fetch", {}).get("maxConnectionsPerHost", 6))
+
+    # ── Run budget ───────────────────────────
+    run_budget: float = float(
+        os.getenv("RUN_BUDGET_SECONDS", str(_RAW.get("budget", {}).get("runSeconds", 240)))
+    )
+    section_budgets: dict[str, float] = field(
+        default_factory=lambda: {
+            name: float(seconds)
+            for name, seconds in _RAW.get("budget", {}).get("sections", {}).items()
+        }
+    )
+
+    # ── On-disk caches ───────────────────────
+    cache_dir: Path = Path(
+        os.getenv("CACHE_DIR", str(Path(__file__).resolve().parents[1] / ".cache"))
+    )
+    section_cache_enabled: bool = (
+        os.getenv(
+            "SECTION_CACHE_ENABLED", str(_RAW.get("sectionCache", {}).get("enabled", True))
+        ).lower()
+        in ("true", "1", "yes")
+    )
+    section_cache_ttls: dict[str, float] = field(
+        default_factory=lambda: {
+            name: float(seconds)
+            for name, seconds in _RAW.get("sectionCache", {}).get("ttlSeconds", {}).items()
+        }
+    )
+    section_cache_max_stale: float = float(
+        _RAW.get("sectionCache", {}).get("maxStaleSeconds", 172800)
+    )
+
+    # ── Fan-out recipient profiles ───────────
+    recipients: list[dict] = field(default_factory=lambda: _RAW.get("recipients", []))
+
     # ── Todo Tasks (daily.ziyixi.science) ────
     todo_api_user: str = os.getenv("TODO_API_USER", "")
     todo_api_password: str = os.getenv("TODO_API_PASSWORD", "")
 
+    @property
+    def weather_location(self) -> Location:
+        """The configured weather / astronomy location."""
+        return Location(self.weather_lat, self.weather_lon, self.weather_location_name)
+
+    def section_budget(self, name: str) -> float:
+        """Seconds *name* may run, capped by the run budget.
+
+        Keyed tasks such as ``astronomy@37.37,-122.04`` share their base
+        section's budget.
+        """
+        budget = self.section_budgets.get(name.split("@")[0], self.run_budget)
+        return min(budget, self.run_budget)
+
 
 # Singleton instance.
 cfg = Config()
@@ -0,0 +1,193 @@
+"""Multi-recipient fan-out — fetch each distinct source once, then assemble per person.
+
+Profiles come from the ``recipients`` list in ``newsletter.config.yaml``.
+The run fetches the union of the sections they enable: weather for every
+location in one batched request, astronomy once per distinct location,
+stocks once for the union of all watchlists, and everything else exactly
+once.  Each profile's payload is
+then cut from those shared results, so the cost scales with the number
+of distinct sources rather than the number of recipients.
+
+Output: one ``<slug>.json`` per recipient plus a ``recipients.json``
+manifest (name, email, file) for the sender, and the shared
+``run-trace.json``.
+"""
+
+from __future__ import annotations
+
+import functools
+import json
+import re
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from .config import Location, cfg
+from .models import build_newsletter, encode
+from .pipeline import default_tasks, empty_section, fetch_all, lazy, write_trace
+
+# Sections a profile can enable; astronomy always follows weather.
+SECTION_NAMES = (
+    "weather", "news", "stocks", "hn", "github_trending",
+    "arxiv", "exchange_rates", "todo_tasks",
+)
+
+# todo_tasks comes from the single TODO_API account, so profiles only
+# get it when they ask for it explicitly.
+_DEFAULT_SECTIONS = frozenset(SECTION_NAMES) - {"todo_tasks"}
+
+
+@dataclass(frozen=True)
+class RecipientProfile:
+    """One newsletter recipient and the sources their issue needs."""
+
+    name: str
+    email: str
+    sections: frozenset[str]
+    location: Location
+    stock_symbols: tuple[str, ...]
+
+    @property
+    def slug(self) -> str:
+        """A filesystem-safe identifier derived from the email address."""
+        return re.sub(r"[^a-z0-9]+", "-", self.email.lower()).strip("-") or "recipient"
+
+
+def load_profiles(raw: list[dict] | None = None) -> list[RecipientProfile]:
+    """Build recipient profiles from config.
+
+    Omitted fields inherit the top-level settings.  With no ``recipients``
+    list, the single configured recipient is used.
+
+    Raises:
+        ValueError: A profile lists an unknown section, or two profiles
+            would write to the same ``<slug>.json``.
+    """
+    raw = cfg.recipients if raw is None else raw
+    if not raw:
+        return [
+            RecipientProfile(
+                name=cfg.recipient_name,
+                email=cfg.recipient_email,
+                sections=frozenset(SECTION_NAMES),
+                location=cfg.weather_location,
+                stock_symbols=tuple(cfg.stock_symbols),
+            )
+        ]
+
+    profiles: list[RecipientProfile] = []
+    for entry in raw:
+        unknown = set(entry.get("sections", [])) - set(SECTION_NAMES)
+        if unknown:
+            raise ValueError(f"Unknown sections for {entry.get('email')}: {sorted(unknown)}")
+
+        weather = entry.get("weather", {})
+        profiles.append(
+            RecipientProfile(
+                name=entry.get("name", cfg.recipient_name),
+                email=entry["email"],
+                sections=frozenset(entry.get("sections", _DEFAULT_SECTIONS)),
+                location=Location(
+                    float(weather.get("latitude", cfg.weather_lat)),
+                    float(weather.get("longitude", cfg.weather_lon)),
+                    weather.get("location", cfg.weather_location_name),
+                ),
+                stock_symbols=tuple(entry.get("stocks", {}).get("symbols", cfg.stock_symbols)),
+            )
+        )
+
+    by_slug: dict[str, RecipientProfile] = {}
+    for profile in profiles:
+        other = by_slug.setdefault(profile.slug, profile)
+        if other is not profile:
+            raise ValueError(
+                f"Recipients {other.email} and {profile.email} would both be "
+                f"written to {profile.slug}.json"
+            )
+    return profiles
+
+
+def fetch_shared(profiles: list[RecipientProfile]) -> dict[str, Any]:
+    """Fetch every distinct source the profiles need, once."""
+    needed = frozenset().union(*(p.sections for p in profiles))
+    tasks: dict[str, Callable[[], Any]] = {
+        name: fn
+        for name, fn in default_tasks().items()
+        if name in needed and name not in ("weather", "astronomy", "stocks")
+    }
+
+    if "weather" in needed:
+        locations = {
+            _location_key(p.location): p.location for p in profiles if "weather" in p.sections
+        }
+        # One batched Open-Meteo request covers every location.
+        tasks["weather@all"] = functools.partial(
+            _fetch_weather_by_key, lazy("fetch_weather_many"), locations
+        )
+        for key, loc in locations.items():
+            tasks[f"astronomy@{key}"] = functools.partial(lazy("fetch_astronomy"), loc)
+
+    if "stocks" in needed:
+        symbols = list(
+            dict.fromkeys(s for p in profiles if "stocks" in p.sections for s in p.stock_symbols)
+        )
+        tasks["stocks"] = functools.partial(lazy("fetch_stocks"), symbols)
+
+    return fetch_all(tasks)
+
+
+def sections_for(profile: RecipientProfile, shared: dict[str, Any]) -> dict[str, Any]:
+    """Cut one recipient's sections out of the shared results."""
+    sections: dict[str, Any] = {
+        name: shared.get(name, empty_section(name))
+        for name in profile.sections
+    }
+
+    if "weather" in profile.sections:
+        key = _location_key(profile.location)
+        sections["weather"] = shared.get("weather@all", {}).get(key, {})
+        sections["astronomy"] = shared.get(f"astronomy@{key}", {})
+
+    if "stocks" in profile.sections:
+        by_symbol = {s["symbol"]: s for s in shared.get("stocks", [])}
+        sections["stocks"] = [by_symbol[s] for s in profile.stock_symbols if s in by_symbol]
+
+    return sections
+
+
+def run_fanout(output_dir: Path, date_str: str) -> Path:
+    """Fetch shared sources, write one payload per recipient, return the manifest path."""
+    profiles = load_profiles()
+    print(f"📬  Fan-out: {len(profiles)} recipient(s)")
+    print()
+
+    print("🔄  Fetching shared content…")
+    shared = fetch_shared(profiles)
+    print()
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    manifest: list[dict[str, str]] = []
+    for profile in profiles:
+        payload = build_newsletter(sections_for(profile, shared), date_str, profile.name)
+        path = output_dir / f"{profile.slug}.json"
+        path.write_bytes(encode(payload))
+        manifest.append({"name": profile.name, "email": profile.email, "file": path.name})
+        print(f"💾  {profile.name} → {path}")
+
+    manifest_path = output_dir / "recipients.json"
+    manifest_path.write_text(json.dumps(manifest, ensure_ascii=False, indent=2), encoding="utf-8")
+    print(f"🗂️  Manifest written to {manifest_path}")
+    write_trace(output_dir)
+    return manifest_path
+
+
+def _location_key(loc: Location) -> str:
+    return f"{loc.latitude:.4f},{loc.longitude:.4f}"
+
+
+def _fetch_weather_by_key(
+    fetch_many: Callable[[list[Location]], list[dict]], locations: dict[str, Location]
+) -> dict[str, dict]:
+    """Fetch every location's weather in one request, keyed like the locations."""
+    return dict(zip(locations, fetch_many(list(locations.values())), strict=True))
@@ -0,0 +1,254 @@
+"""Typed section models — the payload contract with the email-service.
+
+One slotted dataclass per item type, mirroring the interfaces in
+``packages/email-service/emails/types.ts``.  Services still hand back
+plain dicts (ranking and fan-out edit them in place); the orchestrator
+turns them into models once, in :func:`build_newsletter`.
+
+Each model's camelCase JSON keys are computed when the class is
+defined, so :func:`encode` writes compact JSON bytes without rebuilding
+or re-keying the payload.  ``orjson`` is used when installed
+(``pip install newsletter-backend[fast]``); otherwise the stdlib
+encoder produces the same bytes, only slower.
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, fields
+from typing import Any, ClassVar, Self, TypeVar, dataclass_transform
+
+_M = TypeVar("_M", bound="Model")
+
+
+class Model:
+    """Base for section models; see :func:`model`."""
+
+    __slots__ = ()
+
+    # (attribute, JSON key) pairs, filled in by @model.
+    _json_keys: ClassVar[tuple[tuple[str, str], ...]] = ()
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> Self:
+        """Build from a service dict, ignoring keys the model does not define."""
+        return cls(**{name: data[name] for name, _ in cls._json_keys if name in data})
+
+    def to_json(self) -> dict[str, Any]:
+        """Return a shallow camelCase dict; ``None`` fields are left out."""
+        out: dict[str, Any] = {}
+        for name, key in self._json_keys:
+            value = getattr(self, name)
+            if value is not None:
+                out[key] = value
+        return out
+
+
+@dataclass_transform()
+def model(cls: type[_M]) -> type[_M]:
+    """Make *cls* a slotted dataclass and precompute its camelCase keys."""
+    cls = dataclass(slots=True)(cls)
+    cls._json_keys = tuple((f.name, _snake_to_camel(f.name)) for f in fields(cls))  # type: ignore[arg-type]
+    return cls
+
+
+def _snake_to_camel(name: str) -> str:
+    """Convert a snake_case string to camelCase.
+
+    Already-camelCase strings are returned unchanged.
+    """
+    if "_" not in name:
+        return name
+    parts = name.split("_")
+    return parts[0] + "".join(p.capitalize() for p in parts[1:])
+
+
+# ── Section items ─────────────────────────────
+
+
+@model
+class ForecastDay(Model):
+    label: str
+    icon: str
+    condition: str
+    high: int
+    low: int
+
+
+@model
+class Weather(Model):
+    location: str
+    condition: str
+    icon: str
+    temp_current: int
+    temp_high: int
+    temp_low: int
+    summary: str
+    forecasts: list[ForecastDay]
+    # Astronomy, merged in when that section succeeded.
+    sunrise: str | None = None
+    sunset: str | None = None
+    day_length: str | None = None
+    golden_hour: str | None = None
+    astro_note: str | None = None
+
+    @classmethod
+    def from_sections(cls, weather: dict[str, Any], astro: dict[str, Any]) -> Weather:
+        """Build from the weather and astronomy section dicts."""
+        merged = {**weather, "forecasts": _build(ForecastDay, weather.get("forecasts", []))}
+        if astro:
+            merged.update(
+                sunrise=astro.get("sunrise", ""),
+                sunset=astro.get("sunset", ""),
+                day_length=astro.get("day_length", ""),
+                golden_hour=astro.get("golden_hour", ""),
+                astro_note=astro.get("note", ""),
+            )
+        return cls.from_dict(merged)
+
+
+@model
+class NewsSource(Model):
+    source: str
+    url: str
+
+
+@model
+class NewsItem(Model):
+    headline: str
+    summary: str
+    source: str
+    url: str
+    category: str
+    # Other outlets that ran the same story, when feeds overlapped.
+    alternate_sources: list[NewsSource] | None = None
+
+    @classmethod
+    def from_story(cls, item: dict[str, Any]) -> NewsItem:
+        """Build from a news section dict, typing its alternate sources."""
+        alternates = item.get("alternate_sources")
+        if alternates is None:
+            return cls.from_dict(item)
+        return cls.from_dict({**item, "alternate_sources": _build(NewsSource, alternates)})
+
+
+@model
+class Stock(Model):
+    symbol: str
+    company_name: str
+    price: float
+    change: float
+    change_percent: float
+
+
+@model
+class HNStory(Model):
+    title: str
+    title_cn: str
+    url: str
+    points: int
+    comment_count: int
+    hn_url: str
+
+
+@model
+class Repo(Model):
+    name: str
+    description: str
+    description_cn: str
+    language: str
+    stars: int
+    today_stars: int
+    url: str
+
+
+@model
+class Paper(Model):
+    title: str
+    title_cn: str
+    summary: str
+    authors: str
+    url: str
+    category: str
+
+
+@model
+class ExchangeRate(Model):
+    pair: str
+    rate: float
+    change: float
+    change_percent: float
+    display_name: str
+
+
+@model
+class TodoTask(Model):
+    rank: int
+    title: str
+    reason: str
+
+
+@model
+class Newsletter(Model):
+    """Top-level payload (``NewsletterProps`` on the TypeScript side)."""
+
+    recipient_name: str
+    date: str
+    # An empty dict when the weather section failed; the template hides it.
+    weather: Weather | dict[str, Any]
+    top_news: list[NewsItem]
+    stocks: list[Stock]
+    hn_stories: list[HNStory]
+    github_trending: list[Repo]
+    arxiv_papers: list[Paper]
+    exchange_rates: list[ExchangeRate]
+    todo_tasks: list[TodoTask]
+
+
+def build_newsletter(
+    sections: dict[str, Any], date_str: str, recipient_name: str
+) -> Newsletter:
+    """Turn fetched section dicts into the typed payload."""
+    weather = sections.get("weather", {})
+    return Newsletter(
+        recipient_name=recipient_name,
+        date=date_str,
+        weather=Weather.from_sections(weather, sections.get("astronomy", {})) if weather else {},
+        top_news=[NewsItem.from_story(item) for item in sections.get("news", [])],
+        stocks=_build(Stock, sections.get("stocks", [])),
+        hn_stories=_build(HNStory, sections.get("hn", [])),
+        github_trending=_build(Repo, sections.get("github_trending", [])),
+        arxiv_papers=_build(Paper, sections.get("arxiv", [])),
+        exchange_rates=_build(ExchangeRate, sections.get("exchange_rates", [])),
+        todo_tasks=_build(TodoTask, sections.get("todo_tasks", [])),
+    )
+
+
+def _build(cls: type[_M], items: Iterable[dict[str, Any]]) -> list[_M]:
+    return [cls.from_dict(item) for item in items]
+
+
+# ── Encoding ──────────────────────────────────
+
+
+def _default(obj: object) -> dict[str, Any]:
+    if isinstance(obj, Model):
+        return obj.to_json()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _load_encoder() -> Callable[[Any], bytes]:
+    try:
+        import orjson
+    except ImportError:
+        stdlib = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"), default=_default)
+        return lambda obj: stdlib.encode(obj).encode("utf-8")
+
+    # orjson would serialize dataclasses itself, with snake_case keys.
+    option = orjson.OPT_PASSTHROUGH_DATACLASS
+    return lambda obj: orjson.dumps(obj, default=_default, option=option)
+
+
+encode: Callable[[Any], bytes] = _load_encoder()
+"""Serialize models (and plain JSON values) to compact UTF-8 JSON bytes."""
@@ -0,0 +1,496 @@
+"""Fetch pipeline shared by single-recipient runs and fan-out.
+
+Runs each section's fetch function concurrently — in worker threads, or
+as coroutines on one pooled HTTP client when ``fetch.mode`` is
+``async`` — and starts each :class:`Stage` (LLM ranking) as soon as its
+input sections are in.  Every section and stage has a deadline; one that
+fails or misses it renders as its fallback.
+
+Public entry points: :func:`fetch_all`, :func:`default_tasks`,
+:func:`lazy`, :func:`empty_section` and :func:`write_trace`.
+"""
+
+from __future__ import annotations
+
+import os
+import queue
+import threading
+import time
+import traceback
+from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from dataclasses import dataclass
+from functools import partial
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from . import services
+from .config import cfg
+from .services import tracing
+from .services.section_cache import SectionCache
+
+if TYPE_CHECKING:
+    import asyncio
+
+
+# Chrome-trace timing report, written next to the JSON payload.
+_TRACE_NAME = "run-trace.json"
+
+# Sections that return a list on failure (vs. empty dict).
+_LIST_SECTIONS = frozenset(
+    ["news", "stocks", "hn", "github_trending", "arxiv", "exchange_rates", "todo_tasks"]
+)
+
+# Coroutine variants used by the asyncio fetch engine (fetch.mode: async),
+# by their name in ``services``.  Sections without an entry here run in a
+# worker thread instead.
+_ASYNC_TASKS: dict[str, str] = {
+    "weather": "fetch_weather_async",
+    "news": "fetch_news_async",
+    "hn": "fetch_hn_stories_async",
+    "github_trending": "fetch_github_trending_async",
+    "todo_tasks": "fetch_todo_tasks_async",
+}
+
+
+def _is_skipped(name: str) -> bool:
+    """Check if a service should be skipped via SKIP_* env vars.
+
+    Used in integration tests to skip services that rely on Python
+    libraries (yfinance, astral, arxiv) rather than HTTP endpoints.
+    """
+    # Keyed tasks such as "astronomy@37.37,-122.04" share their base section's flag.
+    env_key = f"SKIP_{name.split('@')[0].upper()}"
+    return os.environ.get(env_key, "").lower() in ("true", "1", "yes")
+
+
+class _Lazy:
+    """A stand-in for ``services.<attr>`` until :func:`_resolve` swaps in the real one.
+
+    Keeps skipped sections from loading their libraries at all.
+    """
+
+    def __init__(self, attr: str) -> None:
+        self.attr = attr
+        self.__name__ = self.__qualname__ = attr
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        return getattr(services, self.attr)(*args, **kwargs)
+
+    def __repr__(self) -> str:
+        # Stable across runs: the section cache hashes bound arguments' reprs.
+        return f"lazy({self.attr!r})"
+
+
+def lazy(attr: str) -> Callable[..., Any]:
+    """Return a stand-in for ``services.<attr>`` that imports nothing until resolved."""
+    return _Lazy(attr)
+
+
+def _resolve(fn: Callable[..., Any]) -> Callable[..., Any]:
+    """Import the services *fn* stands in for, directly or through partials.
+
+    Called on the main thread for every task that will run, so worker
+    threads never race each other importing a module.
+    """
+    if isinstance(fn, _Lazy):
+        return getattr(services, fn.attr)
+    if isinstance(fn, partial):
+        args = [_resolve(a) if isinstance(a, _Lazy | partial) else a for a in fn.args]
+        return partial(_resolve(fn.func), *args, **fn.keywords)
+    return fn
+
+
+def default_tasks() -> dict[str, Callable[[], Any]]:
+    """Return the section → fetch function map for a single-recipient run."""
+    return {
+        "weather": lazy("fetch_weather"),
+        "news": lazy("fetch_news"),
+        "stocks": lazy("fetch_stocks"),
+        "hn": lazy("fetch_hn_stories"),
+        "astronomy": lazy("fetch_astronomy"),
+        "github_trending": lazy("fetch_github_trending"),
+        "arxiv": lazy("fetch_arxiv_papers"),
+        "exchange_rates": lazy("fetch_exchange_rates"),
+        "todo_tasks": lazy("fetch_todo_tasks"),
+    }
+
+
+@dataclass(frozen=True)
+class Stage:
+    """A post-processing step over fetched sections.
+
+    *run* receives ``{input: data}`` once every section in *inputs* is in
+    and returns the sections it replaces; *fallback* is called with the
+    same inputs when *run* fails or misses its deadline.
+    """
+
+    inputs: tuple[str, ...]
+    run: Callable[[dict[str, Any]], dict[str, Any]]
+    fallback: Callable[[dict[str, Any]], dict[str, Any]]
+
+
+def _default_stages() -> dict[str, Stage]:
+    """Return the stage name → :class:`Stage` map: one LLM ranking call per group."""
+    if not cfg.ranking_enabled:
+        return {}
+    return {
+        f"ranking@{group}": Stage(
+            inputs=keys,
+            run=partial(services.rank_group, group),
+            fallback=partial(services.trim_group, group),
+        )
+        for group, keys in services.RANKING_GROUPS.items()
+    }
+
+
+def fetch_all(
+    tasks: dict[str, Callable[[], Any]] | None = None,
+    stages: dict[str, Stage] | None = None,
+) -> dict[str, Any]:
+    """Fetch all content sections in parallel.
+
+    Each service is called concurrently — in worker threads by default,
+    or as coroutines on one shared HTTP client when ``fetch.mode`` is
+    ``async``. Failures are logged and replaced with safe defaults
+    (empty list or empty dict) so the newsletter can still render with
+    partial data.  A section still running at its deadline
+    (``budget.sections``, counted from the start of the run) is
+    abandoned the same way.
+
+    Each stage starts as soon as its input sections are in, while other
+    sections are still fetching — ranking news + HN does not wait for
+    arXiv.  A stage's deadline counts from its own start, capped by
+    ``budget.runSeconds``; a failed or late stage applies its fallback.
+
+    Sections listed under ``sectionCache`` are served from their last
+    good result while it is fresh, and fall back to it (instead of the
+    empty default) when the live fetch fails.
+
+    Services can be skipped via SKIP_* env vars (e.g. SKIP_STOCKS=true).
+
+    Args:
+        tasks: Section name → fetch function; defaults to every section
+            for the configured recipient.
+        stages: Stage name → :class:`Stage`; defaults to LLM ranking
+            when ``ranking.enabled``.
+
+    Returns:
+        A dict mapping section names to their fetched data.
+    """
+    tasks = dict(tasks) if tasks is not None else default_tasks()
+    stages = stages if stages is not None else _default_stages()
+
+    sections: dict[str, Any] = {}
+
+    # Skip services disabled via env vars.
+    for name in list(tasks):
+        if _is_skipped(name):
+            print(f"  ⏭️  {name} (skipped via env)")
+            sections[name] = empty_section(name)
+            del tasks[name]
+
+    # Serve fresh cached copies without fetching.
+    cache = SectionCache(tasks)
+    for name in list(tasks):
+        cached = cache.fresh(name)
+        if cached is not None:
+            sections[name] = cached
+            del tasks[name]
+
+    tasks = {name: _resolve(fn) for name, fn in tasks.items()}
+    run = _Run(tasks, stages, sections, cache, time.monotonic())
+    with tracing.span("fetch_all", "run", mode=cfg.fetch_mode, budget_s=cfg.run_budget):
+        if cfg.fetch_mode == "async":
+            import asyncio  # only the async engine pays for importing it
+
+            asyncio.run(_fetch_async(tasks, run))
+        else:
+            _fetch_threaded(tasks, run)
+
+    return sections
+
+
+class _Run:
+    """Deadlines, results and stage readiness shared by both fetch engines."""
+
+    def __init__(
+        self,
+        tasks: dict[str, Callable[[], Any]],
+        stages: dict[str, Stage],
+        sections: dict[str, Any],
+        cache: SectionCache,
+        start: float,
+    ) -> None:
+        self.sections = sections
+        self.cache = cache
+        self.stages = stages
+        self.end = start + cfg.run_budget
+        self.deadlines = {name: start + cfg.section_budget(name) for name in tasks}
+        self._fetching = set(tasks)
+        self._waiting = dict(stages)
+        self._inputs: dict[str, dict[str, Any]] = {}
+        self._budgets: dict[str, float] = {}
+
+    def ready_stages(self) -> list[tuple[str, Callable[[], dict[str, Any]]]]:
+        """Start every waiting stage whose inputs are all in.
+
+        Returns:
+            ``(stage name, call)`` pairs; each call runs the stage on a
+            snapshot of its inputs inside the stage's trace span.
+        """
+        ready: list[tuple[str, Callable[[], dict[str, Any]]]] = []
+        for name, stage in list(self._waiting.items()):
+            if self._fetching.isdisjoint(stage.inputs):
+                del self._waiting[name]
+                inputs = {key: self.sections.get(key, empty_section(key)) for key in stage.inputs}
+                self._inputs[name] = inputs
+                now = time.monotonic()
+                self._budgets[name] = max(0.0, min(cfg.section_budget(name), self.end - now))
+                self.deadlines[name] = now + self._budgets[name]
+                ready.append((name, partial(_traced_stage, name, stage.run, inputs)))
+        return ready
+
+    def finish(self, name: str, future: Future[Any] | asyncio.Task[Any]) -> None:
+        """Store a finished section or apply a finished stage's result."""
+        stage = self.stages.get(name)
+        if stage is None:
+            _record(self.sections, self.cache, name, future)
+            self._fetching.discard(name)
+            return
+
+        try:
+            result = future.result()
+        except Exception as exc:
+            print(f"  ❌  {name}: {exc}")
+            traceback.print_exc()
+            result = stage.fallback(self._inputs[name])
+        self.sections.update(result)
+
+    def abandon(self, name: str, future: Future[Any] | asyncio.Task[Any]) -> None:
+        """Give up on a section or stage that missed its deadline."""
+        stage = self.stages.get(name)
+        if stage is None:
+            _abandon(self.sections, self.cache, name, future)
+            self._fetching.discard(name)
+            return
+
+        budget = self._budgets[name]
+        print(f"  ⏰  {name}: no result after {budget:.0f}s — using fallback")
+        tracing.record_late(name, budget, future)
+        self.sections.update(stage.fallback(self._inputs[name]))
+
+
+class _DaemonPool:
+    """A bounded worker pool whose threads never hold the process open.
+
+    ``ThreadPoolExecutor`` joins its workers at interpreter exit, so a
+    section abandoned at its deadline would keep the process running
+    after the output is written.  These workers are daemon threads: the
+    process exits normally (atexit handlers included) and stragglers are
+    dropped.  Pools a straggler opens itself still finish their current
+    call first, and those calls carry their own HTTP timeouts.
+    """
+
+    def __init__(self, max_workers: int, name: str) -> None:
+        self._max_workers = max(1, max_workers)
+        self._name = name
+        self._work: queue.SimpleQueue[tuple[Future[Any], Callable[[], Any]] | None] = (
+            queue.SimpleQueue()
+        )
+        self._workers = 0
+
+    def submit(self, fn: Callable[[], Any]) -> Future[Any]:
+        """Queue *fn* and return a future for its result."""
+        future: Future[Any] = Future()
+        self._work.put((future, fn))
+        if self._workers < self._max_workers:
+            self._workers += 1
+            threading.Thread(
+                target=self._worker, name=f"{self._name}-{self._workers}", daemon=True
+            ).start()
+        return future
+
+    def shutdown(self) -> None:
+        """Cancel queued work and let idle workers exit; running calls are left alone."""
+        while True:
+            try:
+                item = self._work.get_nowait()
+            except queue.Empty:
+                break
+            if item is not None:
+                item[0].cancel()
+        for _ in range(self._workers):
+            self._work.put(None)
+
+    def _worker(self) -> None:
+        while (item := self._work.get()) is not None:
+            future, fn = item
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                result = fn()
+            except BaseException as exc:
+                future.set_exception(exc)
+            else:
+                future.set_result(result)
+
+
+def _fetch_threaded(tasks: dict[str, Callable[[], Any]], run: _Run) -> None:
+    """Run every task and ready stage in its own worker thread until its deadline."""
+    pool = _DaemonPool(cfg.fetch_max_workers, "fetch")
+    # Stages get their own workers so they never queue behind slow fetches.
+    stage_pool = _DaemonPool(len(run.stages), "stage")
+    try:
+        futures = {
+            pool.submit(tracing.in_context(partial(_traced_section, name, fn))): name
+            for name, fn in tasks.items()
+        }
+        while True:
+            for name, call in run.ready_stages():
+                futures[stage_pool.submit(tracing.in_context(call))] = name
+            if not futures:
+                break
+
+            timeout = min(run.deadlines[name] for name in futures.values()) - time.monotonic()
+            done, _ = wait(futures, timeout=max(0.0, timeout), return_when=FIRST_COMPLETED)
+            for future in done:
+                run.finish(futures.pop(future), future)
+
+            now = time.monotonic()
+            for future in [f for f, name in futures.items() if run.deadlines[name] <= now]:
+                future.cancel()  # only helps if it has not started yet
+                run.abandon(futures.pop(future), future)
+    finally:
+        # A running thread cannot be stopped; just stop waiting for it.
+        pool.shutdown()
+        stage_pool.shutdown()
+
+
+async def _fetch_async(tasks: dict[str, Callable[[], Any]], run: _Run) -> None:
+    """Run HTTP-backed tasks as coroutines on one pooled client.
+
+    Blocking services (yfinance, astral, arxiv) and stages are bridged
+    through thread executors so they overlap with the network-bound
+    coroutines.  A coroutine that misses its deadline is cancelled; a
+    bridged call keeps its thread and is left to finish in the background.
+    """
+    import asyncio
+
+    pool = _DaemonPool(cfg.fetch_max_workers, "fetch")
+    stage_pool = _DaemonPool(len(run.stages), "stage")
+    bridged: dict[str, Future[Any]] = {}
+    # Resolved here, on the loop's thread, before any bridged worker starts.
+    coroutines = {
+        name: getattr(services, _ASYNC_TASKS[name]) for name in tasks if name in _ASYNC_TASKS
+    }
+
+    async with services.SharedAsyncClient() as http:
+
+        async def _run(name: str, fn: Callable[[], Any]) -> Any:
+            with tracing.span(name, "section"):
+                if name in coroutines:
+                    return await coroutines[name](http)
+                bridged[name] = pool.submit(tracing.in_context(fn))
+                return await asyncio.wrap_future(bridged[name])
+
+        async def _run_stage(name: str, call: Callable[[], Any]) -> Any:
+            bridged[name] = stage_pool.submit(tracing.in_context(call))
+            return await asyncio.wrap_future(bridged[name])
+
+        pending = {
+            asyncio.create_task(_run(name, fn), name=name): name
+            for name, fn in tasks.items()
+        }
+        try:
+            while True:
+                for name, call in run.ready_stages():
+                    pending[asyncio.create_task(_run_stage(name, call), name=name)] = name
+                if not pending:
+                    break
+
+                timeout = min(run.deadlines[name] for name in pending.values()) - time.monotonic()
+                done, _ = await asyncio.wait(
+                    pending, timeout=max(0.0, timeout), return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    run.finish(pending.pop(task), task)
+
+                now = time.monotonic()
+                for task in [t for t, name in pending.items() if run.deadlines[name] <= now]:
+                    name = pending.pop(task)
+                    task.cancel()
+                    run.abandon(name, bridged.get(name, task))
+        finally:
+            pool.shutdown()
+            stage_pool.shutdown()
+
+
+def _traced_section(name: str, fn: Callable[[], Any]) -> Any:
+    """Run one section's fetch function inside its trace span."""
+    with tracing.span(name, "section"):
+        return fn()
+
+
+def _traced_stage(
+    name: str, run: Callable[[dict[str, Any]], dict[str, Any]], inputs: dict[str, Any]
+) -> dict[str, Any]:
+    """Run one stage on its inputs inside its trace span."""
+    with tracing.span(name, "stage"):
+        return run(inputs)
+
+
+def _record(
+    sections: dict[str, Any],
+    cache: SectionCache,
+    name: str,
+    future: Future[Any] | asyncio.Task[Any],
+) -> None:
+    """Store a finished section, falling back to its cached copy or a safe default on error."""
+    try:
+        result = future.result()
+    except Exception as exc:
+        print(f"  ❌  {name}: {exc}")
+        traceback.print_exc()
+        # Use safe defaults so the newsletter can still render.
+        sections[name] = cache.fallback(name, empty_section(name))
+        return
+
+    print(f"  ✅  {name}")
+    if result:
+        cache.store(name, result)
+        sections[name] = result
+    else:
+        # Services swallow most errors and come back empty.
+        sections[name] = cache.fallback(name, result)
+
+
+def _abandon(
+    sections: dict[str, Any],
+    cache: SectionCache,
+    name: str,
+    future: Future[Any] | asyncio.Task[Any],
+) -> None:
+    """Give up on a section that missed its deadline and use its cached copy or safe default.
+
+    The miss is recorded in the run trace, along with how late the
+    abandoned *future* eventually finishes.
+    """
+    budget = cfg.section_budget(name)
+    print(f"  ⏰  {name}: no result after {budget:.0f}s — abandoned")
+    tracing.record_late(name, budget, future)
+    sections[name] = cache.fallback(name, empty_section(name))
+
+
+def empty_section(name: str) -> Any:
+    """Return the empty value a failed or abandoned section renders as."""
+    return [] if name in _LIST_SECTIONS else {}
+
+
+def write_trace(directory: Path) -> None:
+    """Write the run's timing spans to ``run-trace.json`` and print the slowest sections."""
+    path = tracing.write_trace(directory / _TRACE_NAME)
+    timings = sorted(tracing.summary()["sections"].items(), key=lambda kv: -kv[1])
+    print(f"⏱️  Trace written to {path}")
+    for name, ms in timings[:3]:
+        print(f"    {name}: {ms / 1000:.1f}s")
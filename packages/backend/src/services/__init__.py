@@ -1,19 +1,43 @@
-"""Newsletter backend services — each module fetches one content section."""
+"""Newsletter backend services — each module fetches one content section.
 
-from .weather_service import fetch_weather
-from .news_service import fetch_news
-from .stocks_service import fetch_stocks
-from .hn_service import fetch_hn_stories
-from .astronomy_service import fetch_astronomy
-from .github_trending_service import fetch_github_trending
-from .arxiv_service import fetch_arxiv_papers
-from .exchange_rate_service import fetch_exchange_rates
+Services are imported on first use (PEP 562 module ``__getattr__``), so a
+run only pays for the libraries behind the sections it actually fetches —
+bs4, feedparser, astral, arxiv, httpx and google-genai are not loaded
+for sections disabled via ``SKIP_*``.
+"""
 
-from .todo_service import fetch_todo_tasks
-from .ranking_service import rank_sections
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+# Public name → defining submodule.
+_REGISTRY: dict[str, str] = {
+    "fetch_weather": "weather_service",
+    "fetch_weather_many": "weather_service",
+    "fetch_news": "news_service",
+    "fetch_stocks": "stocks_service",
+    "fetch_hn_stories": "hn_service",
+    "fetch_astronomy": "astronomy_service",
+    "fetch_github_trending": "github_trending_service",
+    "fetch_arxiv_papers": "arxiv_service",
+    "fetch_exchange_rates": "exchange_rate_service",
+    "fetch_todo_tasks": "todo_service",
+    "rank_group": "ranking_service",
+    "trim_group": "ranking_service",
+    "RANKING_GROUPS": "ranking_service",
+    # asyncio fetch engine
+    "SharedAsyncClient": "http_client",
+    "fetch_weather_async": "weather_service",
+    "fetch_news_async": "news_service",
+    "fetch_hn_stories_async": "hn_service",
+    "fetch_github_trending_async": "github_trending_service",
+    "fetch_todo_tasks_async": "todo_service",
+}
 
 __all__ = [
     "fetch_weather",
+    "fetch_weather_many",
     "fetch_news",
     "fetch_stocks",
     "fetch_hn_stories",
@@ -21,7 +45,42 @@ __all__ = [
     "fetch_github_trending",
     "fetch_arxiv_papers",
     "fetch_exchange_rates",
-
     "fetch_todo_tasks",
-    "rank_sections",
+    "rank_group",
+    "trim_group",
+    "RANKING_GROUPS",
+    # asyncio fetch engine
+    "SharedAsyncClient",
+    "fetch_weather_async",
+    "fetch_news_async",
+    "fetch_hn_stories_async",
+    "fetch_github_trending_async",
+    "fetch_todo_tasks_async",
 ]
+
+if TYPE_CHECKING:
+    from .weather_service import fetch_weather, fetch_weather_async, fetch_weather_many
+    from .news_service import fetch_news, fetch_news_async
+    from .stocks_service import fetch_stocks
+    from .hn_service import fetch_hn_stories, fetch_hn_stories_async
+    from .astronomy_service import fetch_astronomy
+    from .github_trending_service import fetch_github_trending, fetch_github_trending_async
+    from .arxiv_service import fetch_arxiv_papers
+    from .exchange_rate_service import fetch_exchange_rates
+    from .todo_service import fetch_todo_tasks, fetch_todo_tasks_async
+    from .ranking_service import RANKING_GROUPS, rank_group, trim_group
+    from .http_client import SharedAsyncClient
+
+
+def __getattr__(name: str) -> Any:
+    module = _REGISTRY.get(name)
+    if module is None:
+        # Lets ``from . import tracing`` fall through to a submodule import.
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value  # later lookups skip __getattr__
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *__all__])
@@ -1,8 +1,9 @@
 """
 arXiv service — fetches latest papers and summarizes with Gemini.
 
-Uses the ``arxiv`` package (lukasschwab/arxiv.py) for reliable API access
-with exponential back-off on HTTP 429 (rate-limit) errors.
+Uses the ``arxiv`` package (lukasschwab/arxiv.py) for API access, paced by
+a token bucket shared across threads and processes so requests only wait
+when arXiv's rate limit actually requires it.
 
 Categories:
   - cs.CL (Computation and Language) → LLM papers
@@ -13,85 +14,202 @@ Falls back to Google Translate if GEMINI_API_KEY is not set.
 
 from __future__ import annotations
 
-import random
-import time
+import re
+from concurrent.futures import ThreadPoolExecutor
 
 import arxiv
 
 from ..config import cfg
-from . import gemini_client
+from . import gemini_client, tracing
+from .cache_store import JsonCache
+from .rate_limit import TokenBucket
 
 # Maximum characters of abstract text sent to Gemini per paper
 _MAX_ABSTRACT_CHARS = 400
 
-# ── Retry / back-off settings ───────────────────────────────
-_MAX_RETRIES = 5  # per-query retry attempts
-_BASE_DELAY = 5.0  # initial back-off in seconds
-_DELAY_BETWEEN_QUERIES = 5.0  # pause between separate arXiv queries
+# Bump whenever the summary prompt changes so cached summaries are redone.
+_PROMPT_VERSION = 2
+
+# Expected reply per paper (a JSON record with a Chinese title and a
+# one-sentence summary), counted against ``arxiv.summaryChunkTokens``
+# along with the prompt.
+_REPLY_TOKENS_PER_PAPER = 170
+
+# One streamed record per paper, by its number in the prompt.
+_SUMMARY_SCHEMA = {
+    "type": "OBJECT",
+    "properties": {
+        "index": {"type": "INTEGER"},
+        "title_cn": {"type": "STRING"},
+        "summary": {"type": "STRING"},
+    },
+    "required": ["index", "title_cn", "summary"],
+}
+# Summary rounds: the first covers every uncached paper, later ones only
+# the papers a chunk failed to return.
+_SUMMARY_ROUNDS = 2
+
+_summary_cache = JsonCache("arxiv_summaries")
+
+# ── Rate limiting / retries ─────────────────────────────────
+# arXiv asks API clients for at most one request every 3 seconds.  The
+# bucket is shared by every thread and process on this machine, so we
+# only wait when another request really was that recent.
+_MIN_REQUEST_INTERVAL = 3.0
+_MAX_RETRIES = 2  # per-query attempts on top of arxiv.Client's own retries
+_BASE_DELAY = 5.0  # back-off applied to the shared bucket after HTTP 429/503
+
+# Merged queries fetch extra results so every label can still fill its quota.
+_MERGE_HEADROOM = 2
+
+# Query terms we can evaluate locally when splitting merged results.
+_TERM = re.compile(r'^(cat|abs|ti|all):("[^"]+"|\S+)$')
+
+_limiter = TokenBucket(
+    rate=1 / _MIN_REQUEST_INTERVAL,
+    state_path=cfg.cache_dir / "arxiv-rate.json",
+)
 
 
-def _fetch_query_with_backoff(
-    client: arxiv.Client, qcfg: dict, max_results: int
-) -> list[dict]:
-    """Fetch a single arXiv query with exponential back-off on failure."""
+def fetch_arxiv_papers() -> list[dict]:
+    """Fetch latest arXiv papers for configured categories and summarize.
+
+    With ``arxiv.mergeQueries`` enabled, compatible queries are sent as a
+    single OR'ed search and the results are split back out by label.
+    Papers matched by several queries are kept once, under the first label.
+    """
+    multiplier = cfg.ranking_fetch_multiplier if cfg.ranking_enabled else 1
+
+    queries = list(cfg.arxiv_queries)
+    mergeable = [q for q in queries if _parse_terms(q["query"])] if cfg.arxiv_merge_queries else []
+    results: list[dict] = []
+
+    if len(mergeable) > 1:
+        results.extend(_fetch_merged(mergeable, multiplier))
+        queries = [q for q in queries if q not in mergeable]
+
+    for qcfg in queries:
+        max_results = qcfg.get("maxResults", 3) * multiplier
+        label = qcfg.get("label", "")
+        found = _search_with_backoff(qcfg["query"], max_results, label)
+        results.extend(_to_paper(r, label) for r in found)
+
+    # Summarize with Gemini (or fallback)
+    return _summarize(_dedupe(results))
+
+
+def _search_with_backoff(query: str, max_results: int, label: str) -> list[arxiv.Result]:
+    """Run one arXiv search through the shared rate limiter.
+
+    Overload responses (429/503) push the shared bucket back so every
+    caller slows down, instead of each one sleeping on its own.
+    """
     last_err: Exception | None = None
+    # A single page per search — further pages would bypass the shared limiter.
+    client = arxiv.Client(
+        page_size=max(1, max_results),
+        delay_seconds=_MIN_REQUEST_INTERVAL,
+        num_retries=3,
+    )
 
     for attempt in range(_MAX_RETRIES):
         try:
-            search = arxiv.Search(
-                query=qcfg["query"],
-                max_results=max_results,
-                sort_by=arxiv.SortCriterion.SubmittedDate,
-            )
-
-            papers: list[dict] = []
-            for paper in client.results(search):
-                authors: list[str] = [a.name for a in paper.authors[:3]]
-                author_str = ", ".join(authors)
-                if len(paper.authors) > 3:
-                    author_str += " et al."
-
-                papers.append(
-                    {
-                        "title": paper.title,
-                        "title_cn": "",
-                        "summary": "",
-                        "_abstract": paper.summary.replace("\n", " ").strip(),
-                        "authors": author_str,
-                        "url": paper.entry_id,
-                        "category": qcfg.get("label", ""),
-                    }
+            with tracing.span("arxiv.search", "http", label=label, attempt=attempt + 1) as info:
+                info["throttled_ms"] = round(_limiter.acquire() * 1000, 1)
+                search = arxiv.Search(
+                    query=query,
+                    max_results=max_results,
+                    sort_by=arxiv.SortCriterion.SubmittedDate,
                 )
-            return papers
+                found = list(client.results(search))
+                info["results"] = len(found)
+                return found
         except Exception as e:
             last_err = e
-            wait = _BASE_DELAY * (2**attempt) + random.uniform(0, 1)
-            print(
-                f"⚠️  arXiv ({qcfg.get('label', '?')}) attempt {attempt + 1}/{_MAX_RETRIES} "
-                f"failed: {e} — retrying in {wait:.1f}s"
-            )
-            time.sleep(wait)
-
-    print(f"⚠️  Failed to fetch arXiv ({qcfg.get('label', '?')}) after {_MAX_RETRIES} attempts: {last_err}")
+            if isinstance(e, arxiv.HTTPError) and e.status in (429, 503):
+                _limiter.penalize(_BASE_DELAY * (2**attempt))
+            print(f"⚠️  arXiv ({label or '?'}) attempt {attempt + 1}/{_MAX_RETRIES} failed: {e}")
+
+    print(f"⚠️  Failed to fetch arXiv ({label or '?'}) after {_MAX_RETRIES} attempts: {last_err}")
     return []
 
 
-def fetch_arxiv_papers() -> list[dict]:
-    """Fetch latest arXiv papers for configured categories and summarize."""
-    results: list[dict] = []
-    client = arxiv.Client(page_size=10, delay_seconds=5.0, num_retries=5)
-    multiplier = cfg.ranking_fetch_multiplier if cfg.ranking_enabled else 1
+def _fetch_merged(queries: list[dict], multiplier: int) -> list[dict]:
+    """Fetch several queries as one OR'ed search and split results by label."""
+    quotas = {id(q): q.get("maxResults", 3) * multiplier for q in queries}
+    merged_query = " OR ".join(f"({q['query']})" for q in queries)
+    labels = "+".join(q.get("label", "?") for q in queries)
 
-    for i, qcfg in enumerate(cfg.arxiv_queries):
-        if i > 0:
-            time.sleep(_DELAY_BETWEEN_QUERIES)
+    found = _search_with_backoff(merged_query, sum(quotas.values()) * _MERGE_HEADROOM, labels)
 
-        max_results = qcfg.get("maxResults", 3) * multiplier
-        papers = _fetch_query_with_backoff(client, qcfg, max_results)
-        results.extend(papers)
+    papers: list[dict] = []
+    for result in found:
+        for qcfg in queries:
+            if quotas[id(qcfg)] > 0 and _matches(result, _parse_terms(qcfg["query"])):
+                quotas[id(qcfg)] -= 1
+                papers.append(_to_paper(result, qcfg.get("label", "")))
+                break
+    return papers
 
-    # Summarize with Gemini (or fallback)
-    return _summarize(results)
+
+def _parse_terms(query: str) -> list[tuple[str, str]]:
+    """Parse ``field:term AND field:term …`` into pairs.
+
+    Returns an empty list for anything we can't evaluate locally
+    (OR, ANDNOT, grouping, unknown fields), which keeps that query
+    out of a merged search.
+    """
+    terms: list[tuple[str, str]] = []
+    for part in re.split(r"\s+AND\s+", query.strip()):
+        m = _TERM.match(part.strip())
+        if not m:
+            return []
+        terms.append((m.group(1), m.group(2).strip('"')))
+    return terms
+
+
+def _matches(result: arxiv.Result, terms: list[tuple[str, str]]) -> bool:
+    """Check a search result against parsed query terms."""
+    for field, term in terms:
+        if field == "cat":
+            if term not in result.categories:
+                return False
+            continue
+        text = {
+            "abs": result.summary,
+            "ti": result.title,
+        }.get(field, f"{result.title} {result.summary}")
+        if not re.search(rf"\b{re.escape(term)}", text, re.IGNORECASE):
+            return False
+    return True
+
+
+def _to_paper(result: arxiv.Result, label: str) -> dict:
+    authors: list[str] = [a.name for a in result.authors[:3]]
+    author_str = ", ".join(authors)
+    if len(result.authors) > 3:
+        author_str += " et al."
+
+    return {
+        "title": result.title,
+        "title_cn": "",
+        "summary": "",
+        "_abstract": result.summary.replace("\n", " ").strip(),
+        "authors": author_str,
+        "url": result.entry_id,
+        "category": label,
+    }
+
+
+def _dedupe(papers: list[dict]) -> list[dict]:
+    """Drop papers already returned by an earlier query."""
+    seen: set[str] = set()
+    unique: list[dict] = []
+    for p in papers:
+        if p["url"] not in seen:
+            seen.add(p["url"])
+            unique.append(p)
+    return unique
 
 
 # ── AI Summarization ─────────────────────────────────────────
@@ -115,71 +233,144 @@ def _summarize(papers: list[dict]) -> list[dict]:
 
 
 def _summarize_batch_gemini(papers: list[dict], client: object) -> list[dict]:
-    """Batch-summarise all papers in a single Gemini call (saves API quota)."""
+    """Summarise papers in batched Gemini calls (saves API quota).
+
+    Papers summarised on an earlier run are served from the summary
+    cache, preferring a summary by the configured model over one by a
+    fallback model.  The misses are packed into chunks of at most
+    ``arxiv.summaryChunkTokens`` estimated tokens and sent concurrently
+    (:mod:`gemini_client` paces them).  Papers a chunk failed to return
+    are sent again in fresh chunks; whatever is still missing after
+    that falls back to translation.
+    """
     if not papers:
         return papers
 
-    # Build a numbered list for the prompt
-    paper_lines: list[str] = []
-    for i, p in enumerate(papers):
-        paper_lines.append(
-            f"[{i}] 标题：{p['title']}\n    摘要：{p.get('_abstract', '')[:_MAX_ABSTRACT_CHARS]}"
+    models = gemini_client.model_chain()
+    cached = _summary_cache.get_many(_summary_key(p, m) for p in papers for m in models)
+    misses: list[dict] = []
+    for p in papers:
+        hit = next((cached[k] for m in models if (k := _summary_key(p, m)) in cached), None)
+        if hit:
+            p["title_cn"], p["summary"] = hit[0]["title_cn"], hit[0]["summary"]
+        else:
+            misses.append(p)
+
+    pending = misses
+    for _ in range(_SUMMARY_ROUNDS):
+        if not pending:
+            break
+        chunks = _chunk(pending)
+        print(
+            f"    📄  arXiv summaries: {len(papers) - len(pending)} done, "
+            f"{len(pending)} to generate in {len(chunks)} call(s)"
         )
-    numbered_text = "\n".join(paper_lines)
+        pool = ThreadPoolExecutor(max_workers=min(len(chunks), max(1, cfg.gemini_max_concurrency)))
+        with pool:
+            futures = [
+                pool.submit(tracing.in_context(_summarize_chunk), chunk, client) for chunk in chunks
+            ]
+        for future in futures:
+            if future.exception() is not None:
+                print(f"⚠️  arXiv summary chunk failed: {future.exception()}")
+        pending = [p for p in pending if not _is_summarized(p)]
+
+    # Fill in any that no chunk returned
+    _summarize_fallback(pending)
+
+    return papers
+
+
+def _chunk(papers: list[dict]) -> list[list[dict]]:
+    """Split *papers* into consecutive chunks within the per-call token budget.
+
+    Each chunk holds at least one paper, however long.
+    """
+    budget = cfg.arxiv_summary_chunk_tokens
+    overhead = gemini_client.estimate_tokens(_summary_prompt([]))
+    chunks: list[list[dict]] = []
+    chunk: list[dict] = []
+    used = overhead
+    for p in papers:
+        cost = gemini_client.estimate_tokens(_paper_line(len(chunk), p)) + _REPLY_TOKENS_PER_PAPER
+        if chunk and used + cost > budget:
+            chunks.append(chunk)
+            chunk, used = [], overhead
+        chunk.append(p)
+        used += cost
+    if chunk:
+        chunks.append(chunk)
+    return chunks
+
+
+def _summarize_chunk(chunk: list[dict], client: object) -> None:
+    """Summarise one chunk with a single streamed Gemini call and cache what came back.
+
+    Each paper is filled in as its record arrives, so a reply cut short
+    still keeps the papers before the cut.
+    """
+    reply = gemini_client.generate_records(
+        client,
+        _summary_prompt(chunk),
+        _SUMMARY_SCHEMA,
+        on_record=lambda record: _apply_summary(chunk, record),
+    )
+    if reply is None:
+        return
+
+    # Cache only complete Gemini results — never the fallback text — under
+    # the model that actually wrote them.
+    _summary_cache.set_many({
+        _summary_key(p, reply.model): {"title_cn": p["title_cn"], "summary": p["summary"]}
+        for p in chunk
+        if _is_summarized(p)
+    })
+
 
-    prompt = (
+def _summary_prompt(papers: list[dict]) -> str:
+    numbered_text = "\n".join(_paper_line(i, p) for i, p in enumerate(papers))
+    return (
         "请为以下每篇学术论文提供：\n"
         "1. 中文标题翻译\n"
         "2. 一句话中文摘要（不超过80字）\n\n"
         f"{numbered_text}\n\n"
-        "请严格按以下格式逐篇回复，不要多余内容：\n"
-        "[编号]\n"
-        "标题：<中文标题>\n"
-        "摘要：<一句话中文摘要>\n"
+        "请逐篇回复：index 为编号，title_cn 为中文标题，summary 为一句话中文摘要。\n"
     )
 
-    text = gemini_client.generate(client, prompt)
-    if text is None:
-        return _summarize_fallback(papers)
 
-    _parse_batch_response(papers, text)
-
-    # Fill in any that the batch missed
-    for p in papers:
-        if not p.get("title_cn"):
-            _fallback_single(p)
+def _paper_line(index: int, paper: dict) -> str:
+    abstract = paper.get("_abstract", "")[:_MAX_ABSTRACT_CHARS]
+    return f"[{index}] 标题：{paper['title']}\n    摘要：{abstract}"
 
-    return papers
 
+def _is_summarized(paper: dict) -> bool:
+    return bool(paper.get("title_cn") and paper.get("summary"))
 
-def _parse_batch_response(papers: list[dict], text: str) -> None:
-    """Parse the batch Gemini response and populate paper dicts."""
-    current_idx: int | None = None
 
-    for line in text.split("\n"):
-        line = line.strip()
-        if not line:
-            continue
+def _summary_key(paper: dict, model: str) -> str:
+    """Cache key: arXiv entry id + the model that wrote the summary + prompt version."""
+    return f"{paper['url']}|{model}|v{_PROMPT_VERSION}"
 
-        # Detect "[0]", "[1]", etc.
-        if line.startswith("[") and "]" in line:
-            try:
-                idx_str = line[1 : line.index("]")]
-                current_idx = int(idx_str)
-            except (ValueError, IndexError):
-                pass
-            continue
 
-        if current_idx is not None and 0 <= current_idx < len(papers):
-            p = papers[current_idx]
-            if line.startswith(("标题：", "标题:")):
-                p["title_cn"] = line.split("：", 1)[-1].split(":", 1)[-1].strip()
-            elif line.startswith(("摘要：", "摘要:")):
-                p["summary"] = line.split("：", 1)[-1].split(":", 1)[-1].strip()
+def _apply_summary(papers: list[dict], record: dict) -> None:
+    """Fill in the paper a streamed summary record refers to."""
+    try:
+        index = int(record["index"])
+        title_cn, summary = str(record["title_cn"]).strip(), str(record["summary"]).strip()
+    except (KeyError, TypeError, ValueError):
+        return  # skip a malformed record
+    if 0 <= index < len(papers) and title_cn and summary:
+        papers[index]["title_cn"], papers[index]["summary"] = title_cn, summary
 
 
 def _summarize_fallback(papers: list[dict]) -> list[dict]:
     """Fallback: use Google Translate for titles and truncated abstract."""
+    from .translator import translate_batch
+
+    missing = [p for p in papers if not p.get("title_cn")]
+    for p, title_cn in zip(missing, translate_batch([p["title"] for p in missing])):
+        p["title_cn"] = title_cn
+
     for p in papers:
         _fallback_single(p)
     return papers
@@ -1,17 +1,45 @@
 """
-Astronomy service — sunrise/sunset from Open-Meteo.
-Uses the `astral` library for precise sun data.
+Astronomy service — sunrise, sunset, day length and golden hour.
+
+Uses the `astral` library for precise sun data.  Rather than calling the
+solver on every run, a whole year is computed per location in one pass
+and kept in a small array file under ``.cache/sun/``: sunrise and sunset
+as local wall-clock microseconds since midnight, one slot per day of
+the year.  A run then costs one file read (memoised per process) and an
+index by day-of-year, however many recipients share the location.
+
+Tables are built on first use; ``python -m src.main --precompute-sun``
+builds them ahead of time for every configured location.
 """
 
 from __future__ import annotations
 
 import datetime
+import functools
+import os
+from array import array
+from collections.abc import Iterable
+from pathlib import Path
 from zoneinfo import ZoneInfo
 
-from astral import LocationInfo
+from astral import Observer
 from astral.sun import sun
 
-from ..config import cfg
+from ..config import Location, cfg
+
+# One slot per possible day of the year; day 366 is unused in common years.
+_DAYS = 366
+# Marks a day without a sunrise or sunset (polar day / night).
+_NO_EVENT = -1
+_US_PER_DAY = 86_400_000_000
+
+_PLACEHOLDER = {
+    "sunrise": "--:--",
+    "sunset": "--:--",
+    "day_length": "--",
+    "golden_hour": "--:--",
+    "note": "",
+}
 
 
 def _format_duration(td: datetime.timedelta) -> str:
@@ -22,47 +50,119 @@ def _format_duration(td: datetime.timedelta) -> str:
     return f"{hours}时{minutes:02d}分"
 
 
-def fetch_astronomy() -> dict:
+def fetch_astronomy(location: Location | None = None) -> dict:
     """
     Calculate astronomy data (sunrise, sunset, moon phase, etc.).
     Returns a dict matching the AstronomyData proto message.
+    Defaults to the configured weather location.
     """
-    tz = ZoneInfo(cfg.timezone)
+    location = location or cfg.weather_location
     today = datetime.date.today()
 
-    # Astral location
-    loc = LocationInfo(
-        name=cfg.weather_location_name,
-        region="",
-        timezone=cfg.timezone,
-        latitude=cfg.weather_lat,
-        longitude=cfg.weather_lon,
-    )
-
     try:
-        s = sun(loc.observer, date=today, tzinfo=tz)
-
-        sunrise_dt = s["sunrise"]
-        sunset_dt = s["sunset"]
-        day_length = sunset_dt - sunrise_dt
+        table = _sun_table(location.latitude, location.longitude, cfg.timezone, today.year)
+        day = today.timetuple().tm_yday - 1
+        sunrise_us, sunset_us = table[day], table[_DAYS + day]
+        if _NO_EVENT in (sunrise_us, sunset_us):
+            raise ValueError("the sun does not rise and set on this day")
 
+        day_length = datetime.timedelta(microseconds=sunset_us - sunrise_us)
         # Golden hour is roughly 30 minutes before sunset
-        golden_hour_dt = sunset_dt - datetime.timedelta(minutes=30)
+        golden_hour_us = (sunset_us - 30 * 60_000_000) % _US_PER_DAY
 
         return {
-            "sunrise": sunrise_dt.strftime("%H:%M"),
-            "sunset": sunset_dt.strftime("%H:%M"),
+            "sunrise": _clock(sunrise_us),
+            "sunset": _clock(sunset_us),
             "day_length": _format_duration(day_length),
-            "golden_hour": golden_hour_dt.strftime("%H:%M"),
+            "golden_hour": _clock(golden_hour_us),
             "note": "",
         }
 
     except Exception as e:
         print(f"⚠️  Failed to calculate astronomy data: {e}")
-        return {
-            "sunrise": "--:--",
-            "sunset": "--:--",
-            "day_length": "--",
-            "golden_hour": "--:--",
-            "note": "",
-        }
+        return dict(_PLACEHOLDER)
+
+
+def precompute_sun_tables(locations: Iterable[Location], year: int) -> list[Path]:
+    """Build (or rebuild) the year's sun table for each location.
+
+    Returns:
+        The table files written, one per distinct coordinate pair.
+    """
+    paths: dict[Path, None] = {}
+    for loc in locations:
+        path = _table_path(loc.latitude, loc.longitude, cfg.timezone, year)
+        if path not in paths:
+            _write_table(path, _compute_table(loc.latitude, loc.longitude, cfg.timezone, year))
+            paths[path] = None
+    _sun_table.cache_clear()
+    return list(paths)
+
+
+# ── internal helpers ──────────────────────────────────────────
+
+
+@functools.lru_cache(maxsize=64)
+def _sun_table(latitude: float, longitude: float, timezone: str, year: int) -> array[int]:
+    """Return the year's table for one location, computing it on a miss."""
+    path = _table_path(latitude, longitude, timezone, year)
+    table = array("q")
+    try:
+        table.frombytes(path.read_bytes())
+    except (OSError, ValueError):
+        table = array("q")
+    if len(table) == 2 * _DAYS:
+        return table
+
+    table = _compute_table(latitude, longitude, timezone, year)
+    try:
+        _write_table(path, table)
+    except OSError as e:
+        print(f"⚠️  Could not save sun table {path.name}: {e}")
+    return table
+
+
+def _compute_table(latitude: float, longitude: float, timezone: str, year: int) -> array[int]:
+    """Solve sunrise / sunset for every day of *year*: ``[sunrise × 366, sunset × 366]``."""
+    observer = Observer(latitude=latitude, longitude=longitude)
+    tz = ZoneInfo(timezone)
+    sunrises = array("q", [_NO_EVENT] * _DAYS)
+    sunsets = array("q", [_NO_EVENT] * _DAYS)
+
+    day = datetime.date(year, 1, 1)
+    while day.year == year:
+        index = day.timetuple().tm_yday - 1
+        try:
+            s = sun(observer, date=day, tzinfo=tz)
+        except ValueError:  # no sunrise or sunset
+            pass
+        else:
+            sunrises[index] = _since_midnight(s["sunrise"])
+            sunsets[index] = _since_midnight(s["sunset"])
+        day += datetime.timedelta(days=1)
+
+    return sunrises + sunsets
+
+
+def _table_path(latitude: float, longitude: float, timezone: str, year: int) -> Path:
+    zone = timezone.replace("/", "_")
+    return cfg.cache_dir / "sun" / f"{latitude:.4f},{longitude:.4f}-{zone}-{year}.bin"
+
+
+def _write_table(path: Path, table: array[int]) -> None:
+    """Write *table* atomically so a concurrent reader never sees half a file."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(f".{os.getpid()}.tmp")
+    tmp.write_bytes(table.tobytes())
+    tmp.replace(path)
+
+
+def _since_midnight(dt: datetime.datetime) -> int:
+    """Local wall-clock microseconds since midnight."""
+    return ((dt.hour * 60 + dt.minute) * 60 + dt.second) * 1_000_000 + dt.microsecond
+
+
+def _clock(us: int) -> str:
+    """Format microseconds since midnight as 'HH:MM'."""
+    minutes = us // 60_000_000
+    return f"{minutes // 60:02d}:{minutes % 60:02d}"
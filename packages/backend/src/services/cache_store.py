@@ -0,0 +1,117 @@
+"""
+Persistent cache store — JSON values in a small SQLite file under ``.cache/``.
+
+Each cache is a namespace (one table) of ``key → (value, stored_at)`` rows.
+The store does not expire anything itself; callers compare ``stored_at``
+against their own TTLs, which lets one entry carry fields with different
+lifetimes.
+
+Cache errors (read-only filesystem, locked database, …) are logged and
+treated as misses so a broken cache never takes a section down.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+import sqlite3
+import time
+from collections.abc import Iterable, Iterator
+from contextlib import closing, contextmanager
+from pathlib import Path
+from typing import Any
+
+from ..config import cfg
+
+_DB_NAME = "cache.sqlite3"
+
+# SQLite caps bound parameters per statement; stay well below it.
+_MAX_PARAMS = 500
+
+
+class JsonCache:
+    """A namespaced, persistent ``str → JSON`` cache.
+
+    Args:
+        namespace: Table name — one per kind of cached data (e.g. ``"hn_items"``).
+        path: SQLite file; defaults to ``<cache_dir>/cache.sqlite3``.
+    """
+
+    def __init__(self, namespace: str, path: Path | None = None) -> None:
+        if not re.fullmatch(r"[a-z][a-z0-9_]*", namespace):
+            raise ValueError(f"Invalid cache namespace: {namespace!r}")
+        self.namespace = namespace
+        self.path = path or cfg.cache_dir / _DB_NAME
+        self._ready = False
+
+    # ── public API ───────────────────────────
+
+    def get(self, key: str) -> tuple[Any, float] | None:
+        """Return ``(value, stored_at)`` for *key*, or *None* on a miss."""
+        return self.get_many([key]).get(key)
+
+    def get_many(self, keys: Iterable[str]) -> dict[str, tuple[Any, float]]:
+        """Return ``{key: (value, stored_at)}`` for every key that is cached."""
+        keys = list(dict.fromkeys(keys))
+        found: dict[str, tuple[Any, float]] = {}
+        if not keys:
+            return found
+
+        try:
+            with self._connect() as conn:
+                for i in range(0, len(keys), _MAX_PARAMS):
+                    chunk = keys[i : i + _MAX_PARAMS]
+                    marks = ",".join("?" * len(chunk))
+                    rows = conn.execute(
+                        f"SELECT key, value, stored_at FROM {self.namespace} "
+                        f"WHERE key IN ({marks})",
+                        chunk,
+                    )
+                    for key, value, stored_at in rows:
+                        found[key] = (json.loads(value), stored_at)
+        except (sqlite3.Error, OSError, ValueError) as e:
+            print(f"⚠️  Cache read failed ({self.namespace}): {e}")
+        return found
+
+    def set(self, key: str, value: Any) -> None:
+        """Store *value* under *key*, stamped with the current time."""
+        self.set_many({key: value})
+
+    def set_many(self, items: dict[str, Any]) -> None:
+        """Store every ``key → value`` pair in one transaction."""
+        if not items:
+            return
+        now = time.time()
+        rows = [
+            (key, json.dumps(value, ensure_ascii=False), now)
+            for key, value in items.items()
+        ]
+        try:
+            with self._connect() as conn:
+                conn.executemany(
+                    f"INSERT OR REPLACE INTO {self.namespace} (key, value, stored_at) "
+                    "VALUES (?, ?, ?)",
+                    rows,
+                )
+        except (sqlite3.Error, OSError) as e:
+            print(f"⚠️  Cache write failed ({self.namespace}): {e}")
+
+    # ── internal helpers ─────────────────────
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Open a short-lived connection and commit on success.
+
+        A connection per call keeps the store safe to use from any
+        thread; SQLite's own file locking covers concurrent processes.
+        """
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with closing(sqlite3.connect(self.path, timeout=30)) as conn:
+            if not self._ready:
+                conn.execute(
+                    f"CREATE TABLE IF NOT EXISTS {self.namespace} ("
+                    "key TEXT PRIMARY KEY, value TEXT NOT NULL, stored_at REAL NOT NULL)"
+                )
+                self._ready = True
+            with conn:
+                yield conn
@@ -0,0 +1,106 @@
+"""
+RSS feed cache — conditional GETs with ETag / Last-Modified.
+
+Each feed's validators and parsed entries are stored on disk.  The next
+fetch sends ``If-None-Match`` / ``If-Modified-Since``; on ``304 Not
+Modified`` the stored entries are reused and nothing is downloaded or
+reparsed.
+
+Feeds are returned as plain snapshots::
+
+    {"title": "BBC News", "entries": [{"title", "summary", "link", "tags"}, …]}
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+import feedparser
+import httpx
+
+from .cache_store import JsonCache
+from .http_client import USER_AGENT, SharedAsyncClient, traced_get
+
+# Entries kept per feed — far more than any per-feed limit we use.
+_MAX_ENTRIES = 50
+
+_cache = JsonCache("feeds")
+
+
+def fetch_feed(url: str, *, timeout: float = 15) -> dict:
+    """Fetch and parse *url*, reusing the cached copy when it is unchanged."""
+    cached = _cached(url)
+    resp = traced_get(
+        url,
+        headers=_request_headers(cached),
+        timeout=timeout,
+        follow_redirects=True,
+    )
+    return _handle_response(url, resp, cached)
+
+
+async def fetch_feed_async(http: SharedAsyncClient, url: str, *, timeout: float = 15) -> dict:
+    """Async variant of :func:`fetch_feed` on the shared client."""
+    cached = _cached(url)
+    resp = await http.get(url, headers=_request_headers(cached), timeout=timeout)
+    return _handle_response(url, resp, cached)
+
+
+def cached_feed(url: str) -> dict | None:
+    """Return the last good snapshot of *url* without touching the network."""
+    cached = _cached(url)
+    return cached["feed"] if cached else None
+
+
+# ── internal helpers ──────────────────────────────────────────
+
+
+def _cached(url: str) -> dict | None:
+    hit = _cache.get(url)
+    return hit[0] if hit else None
+
+
+def _request_headers(cached: dict | None) -> dict[str, str]:
+    headers = {"User-Agent": USER_AGENT}
+    if cached:
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
+    return headers
+
+
+def _handle_response(url: str, resp: httpx.Response, cached: dict | None) -> dict:
+    """Return the feed snapshot for *resp*, updating the cache on a 200."""
+    if resp.status_code == 304 and cached:
+        return cached["feed"]
+
+    resp.raise_for_status()
+    parsed = feedparser.parse(resp.content, response_headers=dict(resp.headers))
+    feed = _snapshot(parsed)
+
+    _cache.set(
+        url,
+        {
+            "etag": resp.headers.get("ETag", ""),
+            "last_modified": resp.headers.get("Last-Modified", ""),
+            "feed": feed,
+        },
+    )
+    return feed
+
+
+def _snapshot(parsed: Any) -> dict:
+    """Reduce a feedparser result to the JSON-safe fields we use."""
+    return {
+        "title": parsed.feed.get("title", ""),
+        "entries": [
+            {
+                "title": entry.get("title", ""),
+                "summary": entry.get("summary", entry.get("description", "")),
+                "link": entry.get("link", "#"),
+                "tags": [{"term": t.get("term", "")} for t in entry.get("tags", [])[:1]],
+            }
+            for entry in parsed.entries[:_MAX_ENTRIES]
+        ],
+    }
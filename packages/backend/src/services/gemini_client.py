@@ -2,80 +2,235 @@
 Shared Gemini client — retry, backoff, and rate-limiting.
 
 Centralises all Gemini API access so callers don't duplicate
-error-handling / fallback logic.
+error-handling / fallback logic.  :func:`generate_records` streams
+schema-constrained JSON and hands over each record as soon as it is
+complete, so a reply cut short still yields the records before the cut.
+
+The client is a process-wide singleton and :func:`generate_records` is
+safe to call from several threads at once: call starts are paced by a token
+bucket (``gemini.minCallGapSeconds``) and at most
+``gemini.maxConcurrentCalls`` requests are in flight at any time.
 """
 
 from __future__ import annotations
 
+import json
+import math
 import os
+import queue
+import re
+import threading
 import time
-from typing import Any
+from collections.abc import Callable
+from typing import Any, NamedTuple
 
 from ..config import cfg
+from . import tracing
+from .rate_limit import TokenBucket
 
 _FALLBACK_MODELS = ["gemini-2.5-flash", "gemini-2.5-flash-lite"]
 
-# Minimum gap between consecutive API calls (seconds)
-_MIN_CALL_GAP = 1.0
-_last_call_ts: float = 0.0
-
 # Retry settings
 _MAX_RETRIES = 2
 _BACKOFF_BASE = 2.0  # seconds
 
+# Minimum gap between call starts; a burst of up to maxConcurrentCalls
+# may start together, then calls are spaced by the gap.
+_limiter = TokenBucket(
+    rate=1 / max(cfg.gemini_min_call_gap, 1e-3),
+    capacity=max(1, cfg.gemini_max_concurrency),
+)
+_in_flight = threading.BoundedSemaphore(max(1, cfg.gemini_max_concurrency))
+
+_client: Any | None = None
+_client_lock = threading.Lock()
+
+# Han characters, kana and Hangul: roughly one token each.
+_CJK = re.compile(r"[\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uac00-\ud7af\uff00-\uffef]")
+
+
+class Reply(NamedTuple):
+    """Records streamed back by Gemini and the model that sent them."""
+
+    records: list[dict[str, Any]]
+    model: str
+
 
 def get_client() -> Any | None:
-    """Return a ``genai.Client`` if the API key is set, else *None*."""
+    """Return the shared ``genai.Client`` if the API key is set, else *None*."""
+    global _client
+
     api_key = os.getenv("GEMINI_API_KEY", "")
     if not api_key:
         return None
-    try:
-        from google import genai  # type: ignore[import-untyped]
 
-        return genai.Client(api_key=api_key)
-    except ImportError:
-        print("⚠️  google-genai not installed — Gemini features disabled")
-        return None
+    with _client_lock:
+        if _client is None:
+            try:
+                from google import genai  # type: ignore[import-untyped]
+
+                _client = genai.Client(api_key=api_key)
+            except ImportError:
+                print("⚠️  google-genai not installed — Gemini features disabled")
+                return None
+        return _client
 
 
-def generate(
+def generate_records(
     client: Any,
     prompt: str,
+    item_schema: dict[str, Any],
     *,
+    on_record: Callable[[dict[str, Any]], None] | None = None,
     models: list[str] | None = None,
-) -> str | None:
-    """Call Gemini with automatic model fallback, retry, and rate-limiting.
-
-    Returns the response text on success, or *None* if every attempt fails.
+) -> Reply | None:
+    """Stream a JSON array of records from Gemini, parsing each as it arrives.
+
+    The reply is constrained to ``{"type": "ARRAY", "items": item_schema}``
+    (OpenAPI-style schema, as Gemini's ``response_schema`` expects).  Each
+    complete record is passed to *on_record* straight away; errors raised
+    by *on_record* propagate to the caller.
+
+    A stream that fails, or is still running after
+    ``gemini.streamTimeoutSeconds``, after some records arrived is a
+    partial success: those records are returned and the call is not
+    retried.  A reply with no records at all is retried with backoff,
+    falling back through the models; a timed-out one is not.
+
+    Returns the records in reply order with the model that answered, or
+    *None* if none ever arrived.
     """
-    global _last_call_ts
-
     if models is None:
-        models = [cfg.gemini_model, *_FALLBACK_MODELS]
+        models = model_chain()
+    config = {
+        "response_mime_type": "application/json",
+        "response_schema": {"type": "ARRAY", "items": item_schema},
+    }
 
     for model_name in models:
         for attempt in range(_MAX_RETRIES + 1):
-            try:
-                # Simple rate-limit: space calls apart
-                elapsed = time.monotonic() - _last_call_ts
-                if elapsed < _MIN_CALL_GAP:
-                    time.sleep(_MIN_CALL_GAP - elapsed)
-
-                resp = client.models.generate_content(
-                    model=model_name,
-                    contents=prompt,
-                )
-                _last_call_ts = time.monotonic()
-
-                if resp.text:
-                    return resp.text.strip()
-            except Exception as e:
-                _last_call_ts = time.monotonic()
-                wait = _BACKOFF_BASE ** attempt
-                print(
-                    f"⚠️  Gemini ({model_name}) attempt {attempt + 1} failed: {e}"
-                )
-                if attempt < _MAX_RETRIES:
-                    time.sleep(wait)
+            with tracing.span(
+                "gemini.stream", "gemini", model=model_name, attempt=attempt + 1
+            ) as info:
+                info["throttled_ms"] = round(_limiter.acquire() * 1000, 1)
+                with _in_flight:
+                    records, error = _stream_records(
+                        client, model_name, prompt, config, on_record
+                    )
+                info["records"] = len(records)
+
+            if records:
+                if error is not None:
+                    print(
+                        f"⚠️  Gemini ({model_name}) stream stopped after "
+                        f"{len(records)} record(s): {error} — keeping them"
+                    )
+                return Reply(records, model_name)
+            if isinstance(error, _StreamTimeout):
+                print(f"⚠️  Gemini ({model_name}): {error}")
+                return None
+
+            print(
+                f"⚠️  Gemini ({model_name}) attempt {attempt + 1} failed: "
+                f"{error or 'no records in reply'}"
+            )
+            if attempt < _MAX_RETRIES:
+                time.sleep(_BACKOFF_BASE ** attempt)
 
     return None
+
+
+def model_chain() -> list[str]:
+    """The configured model followed by the fallbacks, in the order they are tried."""
+    return [cfg.gemini_model, *_FALLBACK_MODELS]
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough Gemini token count for *text*, without an API call.
+
+    CJK characters count as one token each and other text as one per four
+    characters — close enough to size prompts.
+    """
+    cjk = len(_CJK.findall(text))
+    return cjk + math.ceil((len(text) - cjk) / 4)
+
+
+# ── internal helpers ──────────────────────────────────────────
+
+
+class _StreamTimeout(Exception):
+    """The reply was still streaming after ``gemini.streamTimeoutSeconds``."""
+
+
+def _stream_records(
+    client: Any,
+    model_name: str,
+    prompt: str,
+    config: dict[str, Any],
+    on_record: Callable[[dict[str, Any]], None] | None,
+) -> tuple[list[dict[str, Any]], Exception | None]:
+    """Read one streamed reply; return its records and what cut it short, if anything.
+
+    The stream is read on a daemon thread so a stalled read is bounded
+    by the timeout; an abandoned reader just finishes in the background.
+    """
+    chunks: queue.Queue[tuple[str | None, Exception | None]] = queue.Queue()
+
+    def read() -> None:
+        try:
+            stream = client.models.generate_content_stream(
+                model=model_name, contents=prompt, config=config
+            )
+            for chunk in stream:
+                chunks.put((chunk.text or "", None))
+        except Exception as e:
+            chunks.put((None, e))
+        else:
+            chunks.put((None, None))
+
+    threading.Thread(target=tracing.in_context(read), name="gemini-stream", daemon=True).start()
+
+    parser = _RecordParser()
+    records: list[dict[str, Any]] = []
+    deadline = time.monotonic() + cfg.gemini_stream_timeout
+    while True:
+        try:
+            text, error = chunks.get(timeout=max(0.0, deadline - time.monotonic()))
+        except queue.Empty:
+            return records, _StreamTimeout(
+                f"reply not finished after {cfg.gemini_stream_timeout:g}s"
+            )
+        if text is None:
+            return records, error
+        for record in parser.feed(text):
+            records.append(record)
+            if on_record is not None:
+                on_record(record)
+
+
+class _RecordParser:
+    """Incrementally pull complete objects out of a streamed JSON array.
+
+    Text before, between and after the objects (``[``, commas, ``]``,
+    whitespace, even a markdown fence) is skipped.  A partial object
+    stays buffered until the rest of it arrives.
+    """
+
+    def __init__(self) -> None:
+        self._buffer = ""
+        self._decoder = json.JSONDecoder()
+
+    def feed(self, text: str) -> list[dict[str, Any]]:
+        """Add streamed *text* and return the objects it completed."""
+        self._buffer += text
+        records: list[dict[str, Any]] = []
+        pos = 0
+        while (start := self._buffer.find("{", pos)) != -1:
+            try:
+                record, pos = self._decoder.raw_decode(self._buffer, start)
+            except json.JSONDecodeError:
+                pos = start  # incomplete — wait for more text
+                break
+            records.append(record)
+        self._buffer = self._buffer[pos:]
+        return records
@@ -2,92 +2,208 @@
 
 from __future__ import annotations
 
+import asyncio
+import html as html_lib
 import os
+import re
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 
-import httpx
 from bs4 import BeautifulSoup
 
 from ..config import cfg
-from .translator import translate_to_chinese
+from . import tracing
+from .http_client import USER_AGENT, SharedAsyncClient, traced_get
+from .translator import translate_batch
 
 _BASE = os.environ.get("GITHUB_TRENDING_BASE", "https://github.com") + "/trending"
 
+# Targeted extractors for one ``article.Box-row`` block.
+_ARTICLE_OPEN = re.compile(r'<article\b[^>]*class="[^"]*\bBox-row\b[^"]*"[^>]*>')
+_REPO_LINK = re.compile(
+    r'<h2\b.*?<a\b[^>]*href="(?P<href>[^"]+)"[^>]*>(?P<name>.*?)</a>', re.DOTALL
+)
+_DESCRIPTION = re.compile(r"<p\b[^>]*>(.*?)</p>", re.DOTALL)
+# The star count is the link to the repo's stargazers, whatever its styling.
+_TOTAL_STARS = re.compile(r'<a\b[^>]*href="[^"]*/stargazers"[^>]*>(.*?)</a>', re.DOTALL)
+_TODAY_STARS = re.compile(
+    r'<span\b[^>]*class="[^"]*d-inline-block float-sm-right[^"]*"[^>]*>(.*?)</span>', re.DOTALL
+)
+_TAG = re.compile(r"<[^>]+>")
+
 
 def fetch_github_trending() -> list[dict]:
-    """Fetch daily trending repos for configured languages."""
-    results: list[dict] = []
-    multiplier = cfg.ranking_fetch_multiplier if cfg.ranking_enabled else 1
-    effective_max_per_lang = cfg.github_trending_max_per_lang * multiplier
+    """Fetch daily trending repos for configured languages.
+
+    Language pages are fetched concurrently; descriptions are translated
+    in one batch once every page is parsed.
+    """
+    limit = _effective_max_per_lang()
+    languages = cfg.github_trending_languages
+
+    with ThreadPoolExecutor(max_workers=max(1, len(languages))) as pool:
+        futures = [
+            pool.submit(tracing.in_context(_fetch_language), lang, limit) for lang in languages
+        ]
+        results = [repo for future in futures for repo in future.result()]
+
+    _translate_descriptions(results)
+    return results
+
+
+async def fetch_github_trending_async(http: SharedAsyncClient) -> list[dict]:
+    """Async variant of :func:`fetch_github_trending` on the shared client."""
+    limit = _effective_max_per_lang()
 
-    for lang in cfg.github_trending_languages:
+    async def _one(lang: str) -> list[dict]:
+        url, display_lang = _language_page(lang)
         try:
-            url = f"{_BASE}/{lang.lower()}" if lang else _BASE
-            display_lang = lang or "overall"
-            resp = httpx.get(
-                url,
-                params={"since": "daily"},
-                timeout=15,
-                headers={"User-Agent": "Mozilla/5.0 newsletter-bot/1.0"},
-            )
+            resp = await http.get(url, params={"since": "daily"}, timeout=15)
             resp.raise_for_status()
-            repos = _parse_trending_page(resp.text, display_lang)
-            results.extend(repos[: effective_max_per_lang])
+            return _parse_trending_page(resp.text, display_lang, limit)
         except Exception as e:
             print(f"⚠️  Failed to fetch GitHub trending for {display_lang}: {e}")
+            return []
 
+    per_lang = await asyncio.gather(*(_one(lang) for lang in cfg.github_trending_languages))
+    results = [repo for repos in per_lang for repo in repos]
+    await asyncio.to_thread(_translate_descriptions, results)
     return results
 
 
-def _parse_trending_page(html: str, language: str) -> list[dict]:
-    """Parse GitHub trending page HTML into structured repo data."""
+def _fetch_language(lang: str, limit: int) -> list[dict]:
+    """Fetch and parse one language page; failures yield no repos."""
+    url, display_lang = _language_page(lang)
+    try:
+        resp = traced_get(
+            url,
+            params={"since": "daily"},
+            timeout=15,
+            headers={"User-Agent": USER_AGENT},
+        )
+        resp.raise_for_status()
+        return _parse_trending_page(resp.text, display_lang, limit)
+    except Exception as e:
+        print(f"⚠️  Failed to fetch GitHub trending for {display_lang}: {e}")
+        return []
+
+
+def _effective_max_per_lang() -> int:
+    multiplier = cfg.ranking_fetch_multiplier if cfg.ranking_enabled else 1
+    return cfg.github_trending_max_per_lang * multiplier
+
+
+def _language_page(lang: str) -> tuple[str, str]:
+    """Return ``(url, display_language)`` for a configured language."""
+    url = f"{_BASE}/{lang.lower()}" if lang else _BASE
+    return url, lang or "overall"
+
+
+def _parse_trending_page(html: str, language: str, limit: int | None = None) -> list[dict]:
+    """Parse GitHub trending page HTML into structured repo data.
+
+    Scans the page for ``<article class="Box-row">`` blocks with a few
+    targeted regexes and stops after *limit* repos, so the rest of the
+    (~500 KB) page is never looked at.  Falls back to BeautifulSoup if
+    the markup no longer matches — no repos, or no star counts at all.
+    """
+    repos: list[dict] = []
+    for block in _iter_articles(html):
+        if limit is not None and len(repos) >= limit:
+            break
+        repo = _parse_article(block, language)
+        if repo is not None:
+            repos.append(repo)
+
+    if "Box-row" in html and not any(repo["stars"] for repo in repos):
+        repos = _parse_with_soup(html, language)[:limit] or repos
+    return repos
+
+
+def _iter_articles(html: str) -> Iterator[str]:
+    """Yield the inner HTML of each ``article.Box-row``, lazily."""
+    pos = 0
+    while True:
+        match = _ARTICLE_OPEN.search(html, pos)
+        if match is None:
+            return
+        end = html.find("</article>", match.end())
+        if end == -1:
+            return
+        yield html[match.end():end]
+        pos = end
+
+
+def _parse_article(block: str, language: str) -> dict | None:
+    link = _REPO_LINK.search(block)
+    if link is None:
+        return None
+
+    desc = _DESCRIPTION.search(block)
+    stars = _TOTAL_STARS.search(block)
+    today = _TODAY_STARS.search(block)
+    return _repo(
+        name=_text(link.group("name")).replace(" ", ""),
+        href=link.group("href"),
+        desc=_text(desc.group(1)) if desc else "",
+        total_text=_text(stars.group(1)) if stars else "",
+        today_text=_text(today.group(1)) if today else "",
+        language=language,
+    )
+
+
+def _parse_with_soup(html: str, language: str) -> list[dict]:
+    """Slow but forgiving parse of the whole page with BeautifulSoup."""
     soup = BeautifulSoup(html, "html.parser")
     repos: list[dict] = []
 
     for article in soup.select("article.Box-row"):
-        try:
-            # ── Repo name & URL ──
-            h2 = article.select_one("h2")
-            if not h2:
-                continue
-            a_tag = h2.select_one("a")
-            if not a_tag:
-                continue
-            name = a_tag.get_text(strip=True).replace("\n", "").replace(" ", "")
-            href = a_tag.get("href", "")
-            url = "https://github.com" + (href if isinstance(href, str) else href[0])
-
-            # ── Description ──
-            desc_tag = article.select_one("p")
-            desc = desc_tag.get_text(strip=True) if desc_tag else ""
-
-            # ── Total stars ──
-            star_links = article.select("a.Link--muted.d-inline-block.mr-3")
-            total_stars = 0
-            if star_links:
-                star_text = star_links[0].get_text(strip=True).replace(",", "")
-                total_stars = int("".join(c for c in star_text if c.isdigit()) or "0")
-
-            # ── Stars today ──
-            today_span = article.select_one("span.d-inline-block.float-sm-right")
-            today_stars = 0
-            if today_span:
-                today_text = today_span.get_text(strip=True)
-                today_stars = int(
-                    "".join(c for c in today_text.split("star")[0] if c.isdigit()) or "0"
-                )
-
-            repos.append(
-                {
-                    "name": name,
-                    "description": desc,
-                    "description_cn": translate_to_chinese(desc) if desc else "",
-                    "language": language.capitalize(),
-                    "stars": total_stars,
-                    "today_stars": today_stars,
-                    "url": url,
-                }
-            )
-        except Exception:
+        h2 = article.select_one("h2")
+        a_tag = h2.select_one("a") if h2 else None
+        if not a_tag:
             continue
-
+        href = a_tag.get("href", "")
+        desc_tag = article.select_one("p")
+        stars = article.select_one('a[href$="/stargazers"], a.Link--muted.d-inline-block.mr-3')
+        today_span = article.select_one("span.d-inline-block.float-sm-right")
+        repos.append(
+            _repo(
+                name=a_tag.get_text(strip=True).replace("\n", "").replace(" ", ""),
+                href=href if isinstance(href, str) else href[0],
+                desc=desc_tag.get_text(strip=True) if desc_tag else "",
+                total_text=stars.get_text(strip=True) if stars else "",
+                today_text=today_span.get_text(strip=True) if today_span else "",
+                language=language,
+            )
+        )
     return repos
+
+
+def _repo(
+    *, name: str, href: str, desc: str, total_text: str, today_text: str, language: str
+) -> dict:
+    return {
+        "name": name,
+        "description": desc,
+        "description_cn": "",
+        "language": language.capitalize(),
+        "stars": _digits(total_text),
+        "today_stars": _digits(today_text.split("star")[0]),
+        "url": "https://github.com" + href,
+    }
+
+
+def _text(fragment: str) -> str:
+    """Strip tags, unescape entities and collapse whitespace."""
+    return " ".join(html_lib.unescape(_TAG.sub("", fragment)).split())
+
+
+def _digits(text: str) -> int:
+    return int("".join(c for c in text if c.isdigit()) or "0")
+
+
+def _translate_descriptions(repos: list[dict]) -> None:
+    """Fill ``description_cn`` for every repo with one batched translation."""
+    descs_cn = translate_batch([repo["description"] for repo in repos])
+    for repo, desc_cn in zip(repos, descs_cn):
+        repo["description_cn"] = desc_cn if repo["description"] else ""
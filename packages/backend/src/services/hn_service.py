@@ -1,53 +1,176 @@
 """
 Hacker News service — uses the official HN Firebase API (free, no key).
 https://github.com/HackerNews/API
+
+Items are fetched in parallel over a pooled client and cached on disk by
+id.  Title and URL never change once posted, so cached entries are kept
+indefinitely; points and comment counts go stale after
+``hackerNews.scoreTtlSeconds`` and trigger a refetch.  If a refetch
+fails, the last known copy is served instead of dropping the story.
 """
 
 from __future__ import annotations
 
+import asyncio
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 
 import httpx
 
 from ..config import cfg
-from .translator import translate_to_chinese
+from . import tracing
+from .cache_store import JsonCache
+from .http_client import SharedAsyncClient, traced_get
+from .translator import translate_batch
 
 _BASE = os.environ.get("HN_API_BASE", "https://hacker-news.firebaseio.com") + "/v0"
 
+# Fields kept in the item cache.
+_CACHED_FIELDS = ("id", "title", "url", "score", "descendants")
+
+_item_cache = JsonCache("hn_items")
+
 
 def fetch_hn_stories() -> list[dict]:
     """Fetch top N Hacker News stories."""
     results: list[dict] = []
-    effective_max = cfg.hn_max_stories * (cfg.ranking_fetch_multiplier if cfg.ranking_enabled else 1)
 
     try:
-        resp = httpx.get(f"{_BASE}/topstories.json", timeout=10)
+        resp = traced_get(f"{_BASE}/topstories.json", timeout=10)
+        resp.raise_for_status()
+        story_ids: list[int] = resp.json()[: _effective_max()]
+
+        items = fetch_items(story_ids)
+        results = [_to_story(sid, items[sid]) for sid in story_ids if sid in items]
+
+    except Exception as e:
+        print(f"⚠️  Failed to fetch HN top stories: {e}")
+
+    _translate_titles(results)
+    return results
+
+
+async def fetch_hn_stories_async(http: SharedAsyncClient) -> list[dict]:
+    """Async variant of :func:`fetch_hn_stories` on the shared client."""
+    results: list[dict] = []
+
+    try:
+        resp = await http.get(f"{_BASE}/topstories.json", timeout=10)
         resp.raise_for_status()
-        story_ids: list[int] = resp.json()[: effective_max]
+        story_ids: list[int] = resp.json()[: _effective_max()]
+
+        items = await fetch_items_async(http, story_ids)
+        results = [_to_story(sid, items[sid]) for sid in story_ids if sid in items]
+
+    except Exception as e:
+        print(f"⚠️  Failed to fetch HN top stories: {e}")
+
+    await asyncio.to_thread(_translate_titles, results)
+    return results
+
+
+def fetch_items(ids: list[int]) -> dict[int, dict]:
+    """Fetch HN items by id — cache first, the rest in parallel.
+
+    Returns a dict keyed by id; ids that could not be fetched (and have
+    no cached copy) are left out.
+    """
+    items, stale = _lookup_cached(ids)
+    to_fetch = [sid for sid in ids if sid not in items]
+    if not to_fetch:
+        return items
 
-        for sid in story_ids:
+    workers = max(1, min(cfg.hn_max_concurrency, len(to_fetch)))
+    limits = httpx.Limits(max_connections=workers, max_keepalive_connections=workers)
+    with httpx.Client(limits=limits, timeout=10) as client, ThreadPoolExecutor(workers) as pool:
+        fetched = list(pool.map(tracing.in_context(partial(_get_item, client)), to_fetch))
+
+    return _merge_fetched(items, stale, dict(zip(to_fetch, fetched)))
+
+
+async def fetch_items_async(http: SharedAsyncClient, ids: list[int]) -> dict[int, dict]:
+    """Async variant of :func:`fetch_items` on the shared client."""
+    items, stale = _lookup_cached(ids)
+    to_fetch = [sid for sid in ids if sid not in items]
+    if not to_fetch:
+        return items
+
+    slots = asyncio.Semaphore(max(1, cfg.hn_max_concurrency))
+
+    async def _one(sid: int) -> dict | None:
+        async with slots:
             try:
-                item_resp = httpx.get(f"{_BASE}/item/{sid}.json", timeout=10)
-                item_resp.raise_for_status()
-                item = item_resp.json()
-
-                results.append(
-                    {
-                        "title": item.get("title", ""),
-                        "url": item.get("url", f"https://news.ycombinator.com/item?id={sid}"),
-                        "points": item.get("score", 0),
-                        "comment_count": item.get("descendants", 0),
-                        "hn_url": f"https://news.ycombinator.com/item?id={sid}",
-                    }
-                )
+                resp = await http.get(f"{_BASE}/item/{sid}.json", timeout=10)
+                resp.raise_for_status()
+                return resp.json()
             except Exception as e:
                 print(f"⚠️  Failed to fetch HN story {sid}: {e}")
+                return None
+
+    fetched = await asyncio.gather(*(_one(sid) for sid in to_fetch))
+    return _merge_fetched(items, stale, dict(zip(to_fetch, fetched)))
 
+
+# ── internal helpers ──────────────────────────────────────────
+
+
+def _get_item(client: httpx.Client, sid: int) -> dict | None:
+    try:
+        resp = traced_get(f"{_BASE}/item/{sid}.json", client=client)
+        resp.raise_for_status()
+        return resp.json()
     except Exception as e:
-        print(f"⚠️  Failed to fetch HN top stories: {e}")
+        print(f"⚠️  Failed to fetch HN story {sid}: {e}")
+        return None
 
-    # Add Chinese translation alongside original English title
-    for item in results:
-        item["title_cn"] = translate_to_chinese(item["title"])
 
-    return results
+def _lookup_cached(ids: list[int]) -> tuple[dict[int, dict], dict[int, dict]]:
+    """Split cached items into ``(fresh, stale)`` by the score TTL."""
+    now = time.time()
+    fresh: dict[int, dict] = {}
+    stale: dict[int, dict] = {}
+    for key, (item, stored_at) in _item_cache.get_many(str(sid) for sid in ids).items():
+        target = fresh if now - stored_at < cfg.hn_score_ttl else stale
+        target[int(key)] = item
+    return fresh, stale
+
+
+def _merge_fetched(
+    items: dict[int, dict],
+    stale: dict[int, dict],
+    fetched: dict[int, dict | None],
+) -> dict[int, dict]:
+    """Cache successful fetches and fall back to stale copies for failures."""
+    new_entries: dict[str, dict] = {}
+    for sid, item in fetched.items():
+        if item:
+            entry = {k: item[k] for k in _CACHED_FIELDS if k in item}
+            new_entries[str(sid)] = entry
+            items[sid] = entry
+        elif sid in stale:
+            items[sid] = stale[sid]
+    _item_cache.set_many(new_entries)
+    return items
+
+
+def _effective_max() -> int:
+    return cfg.hn_max_stories * (cfg.ranking_fetch_multiplier if cfg.ranking_enabled else 1)
+
+
+def _to_story(sid: int, item: dict) -> dict:
+    return {
+        "title": item.get("title", ""),
+        "url": item.get("url", f"https://news.ycombinator.com/item?id={sid}"),
+        "points": item.get("score", 0),
+        "comment_count": item.get("descendants", 0),
+        "hn_url": f"https://news.ycombinator.com/item?id={sid}",
+    }
+
+
+def _translate_titles(results: list[dict]) -> None:
+    # Add Chinese translation alongside original English title
+    titles_cn = translate_batch([item["title"] for item in results])
+    for item, title_cn in zip(results, titles_cn):
+        item["title_cn"] = title_cn
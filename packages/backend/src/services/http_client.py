@@ -0,0 +1,88 @@
+"""
+Shared HTTP client — one pooled ``httpx.AsyncClient`` for every service.
+
+Used by the asyncio fetch engine (``fetch.mode: async``): all HTTP-backed
+services run as coroutines on a single client, so connections and TLS
+sessions are reused across sections instead of being reopened per call.
+A per-host semaphore keeps any one upstream from hogging the pool.
+
+:func:`traced_get` is the blocking counterpart used by the threaded
+engine; both record one ``http`` trace span per request.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any, Self
+
+import httpx
+
+from ..config import cfg
+from . import tracing
+
+USER_AGENT = "Mozilla/5.0 newsletter-bot/1.0"
+
+
+def traced_get(url: str, *, client: httpx.Client | None = None, **kwargs: Any) -> httpx.Response:
+    """Blocking GET via *client* (or a one-off request), recorded as a trace span."""
+    with tracing.span(f"GET {httpx.URL(url).host}", "http", url=url) as info:
+        resp = (client or httpx).get(url, **kwargs)
+        info["status"] = resp.status_code
+        return resp
+
+
+class SharedAsyncClient:
+    """Pooled async HTTP client with keep-alive and per-host limits.
+
+    Use as an async context manager::
+
+        async with SharedAsyncClient() as http:
+            resp = await http.get(url, params=...)
+    """
+
+    def __init__(
+        self,
+        *,
+        max_connections: int | None = None,
+        max_per_host: int | None = None,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ) -> None:
+        self._max_connections = max_connections or cfg.http_max_connections
+        self._max_per_host = max_per_host or cfg.http_max_per_host
+        self._transport = transport  # e.g. httpx.MockTransport in tests
+        self._host_slots: dict[str, asyncio.Semaphore] = {}
+        self._client: httpx.AsyncClient | None = None
+
+    async def __aenter__(self) -> Self:
+        self._client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=self._max_connections,
+                max_keepalive_connections=self._max_connections,
+            ),
+            headers={"User-Agent": USER_AGENT},
+            follow_redirects=True,
+            transport=self._transport,
+        )
+        return self
+
+    async def __aexit__(self, *exc: object) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def get(self, url: str, **kwargs: Any) -> httpx.Response:
+        """Issue a GET request, waiting for a free slot on the target host."""
+        if self._client is None:
+            raise RuntimeError("SharedAsyncClient used outside 'async with'")
+        start = time.perf_counter()
+        host = httpx.URL(url).host
+        slot = self._host_slots.get(host)
+        if slot is None:
+            slot = self._host_slots[host] = asyncio.Semaphore(self._max_per_host)
+        with tracing.span(f"GET {host}", "http", url=url) as info:
+            async with slot:
+                info["queued_ms"] = round((time.perf_counter() - start) * 1000, 1)
+                resp = await self._client.get(url, **kwargs)
+            info["status"] = resp.status_code
+            return resp
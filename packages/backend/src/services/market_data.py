@@ -0,0 +1,127 @@
+"""
+Market data — one batched yfinance download for stocks and FX rates.
+
+Equity symbols and ``XXXYYY=X`` currency tickers are gathered into a
+single ``yf.download`` call instead of several ``Ticker.fast_info``
+requests per symbol.  The result is memoised for the run, so the stocks
+and exchange-rate sections (which run as separate tasks) share one
+download; whichever asks first fetches everything configured.
+"""
+
+from __future__ import annotations
+
+import math
+import threading
+import time
+from collections.abc import Iterable
+from typing import Any, NamedTuple
+
+from ..config import cfg
+from . import tracing
+
+# Daily bars back far enough to span weekends and holidays.
+_PERIOD = "5d"
+
+# A memoised quote is reused for this long (seconds).
+_QUOTE_TTL = 300.0
+
+
+class Quote(NamedTuple):
+    """Latest price and the previous session's close."""
+
+    price: float
+    previous_close: float | None
+
+
+_lock = threading.Lock()
+_quotes: dict[str, tuple[Quote, float]] = {}
+
+
+def fx_ticker(pair: str) -> str:
+    """Return the Yahoo ticker for a currency pair, e.g. ``USD/CNY`` → ``USDCNY=X``."""
+    return pair.replace("/", "") + "=X"
+
+
+def get_quotes(symbols: Iterable[str]) -> dict[str, Quote]:
+    """Return quotes for *symbols*, downloading whatever is not memoised.
+
+    Every configured stock and FX ticker is folded into the same
+    download, so the other market section finds its quotes ready.
+    Symbols with no data are left out of the result.
+    """
+    symbols = list(dict.fromkeys(symbols))
+
+    with _lock:
+        now = time.monotonic()
+        wanted = dict.fromkeys(
+            [*symbols, *cfg.stock_symbols, *(fx_ticker(p) for p in cfg.exchange_rate_pairs)]
+        )
+        missing = [s for s in wanted if s not in _quotes or now - _quotes[s][1] > _QUOTE_TTL]
+        if missing:
+            for symbol, quote in _download(missing).items():
+                _quotes[symbol] = (quote, now)
+
+        return {s: _quotes[s][0] for s in symbols if s in _quotes}
+
+
+# ── internal helpers ──────────────────────────────────────────
+
+
+def _download(symbols: list[str]) -> dict[str, Quote]:
+    """Fetch daily bars for all *symbols* in one request.
+
+    Symbols the batch could not resolve fall back to a per-symbol
+    ``fast_info`` lookup, so one bad ticker never empties a section.
+    """
+    import yfinance as yf
+
+    quotes: dict[str, Quote] = {}
+    try:
+        with tracing.span("yfinance.download", "http", symbols=len(symbols)):
+            frame = yf.download(
+                tickers=symbols,
+                period=_PERIOD,
+                interval="1d",
+                group_by="ticker",
+                auto_adjust=False,
+                progress=False,
+                threads=True,
+            )
+        if frame is not None and not frame.empty:
+            for symbol in symbols:
+                quote = _quote_from_frame(frame, symbol)
+                if quote is not None:
+                    quotes[symbol] = quote
+    except Exception as e:
+        print(f"⚠️  Batched market download failed: {e}")
+
+    for symbol in symbols:
+        if symbol not in quotes:
+            quote = _quote_from_fast_info(yf, symbol)
+            if quote is not None:
+                quotes[symbol] = quote
+
+    return quotes
+
+
+def _quote_from_frame(frame: Any, symbol: str) -> Quote | None:
+    try:
+        closes = frame[symbol]["Close"].dropna()
+    except KeyError:
+        return None
+    if closes.empty:
+        return None
+    price = float(closes.iloc[-1])
+    prev_close = float(closes.iloc[-2]) if len(closes) > 1 else None
+    return Quote(price, prev_close) if math.isfinite(price) else None
+
+
+def _quote_from_fast_info(yf: Any, symbol: str) -> Quote | None:
+    try:
+        info = yf.Ticker(symbol).fast_info
+        if info.last_price is None:
+            return None
+        return Quote(info.last_price, info.previous_close)
+    except Exception as e:
+        print(f"⚠️  Failed to fetch quote for {symbol}: {e}")
+        return None
@@ -0,0 +1,114 @@
+"""
+Near-duplicate clustering for news stories from overlapping feeds.
+
+Several feeds usually cover the same event under different headlines.
+Each story is reduced to the set of content words in its headline and
+summary, and joins the first earlier cluster whose leading story shares
+at least ``news.dedupThreshold`` of their combined words (Jaccard
+similarity).  An inverted index from word to cluster means each story
+is only compared with clusters it shares a word with.
+
+Stories are compared with each cluster's first story only, so a chain
+of loosely related stories never merges into one cluster.  A feed does
+not run the same event twice, so a story never joins a cluster that
+already holds one from its own source (short items from one feed can
+share enough words by chance).
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+
+from . import tokens
+
+# Function words that say nothing about which event a story covers.
+_STOPWORDS = frozenset({
+    "a", "an", "and", "are", "as", "at", "be", "been", "by", "for", "from", "has",
+    "have", "he", "her", "his", "in", "into", "is", "it", "its", "new", "news", "not",
+    "of", "on", "or", "over", "said", "says", "she", "than", "that", "the", "their",
+    "they", "this", "to", "up", "was", "were", "what", "will", "with", "after", "amid",
+})
+
+
+def cluster_stories(items: list[dict], threshold: float) -> list[dict]:
+    """Collapse near-duplicate stories into one item per cluster.
+
+    Stories with the same headline always share a cluster.  Each cluster
+    keeps its first story that has a summary, so the order of
+    ``news.feeds`` sets which outlet is preferred.  The source and url
+    of other outlets in the cluster go under ``alternate_sources``.
+
+    Args:
+        items: News item dicts in feed order.
+        threshold: Minimum word-set similarity, 0–1, to join a cluster.
+
+    Returns:
+        One item per cluster, in the order each cluster was first seen.
+    """
+    clusters: list[list[dict]] = []
+    leaders: list[frozenset[str]] = []
+    sources: list[set[str]] = []
+    by_word: dict[str, list[int]] = {}
+    by_headline: dict[str, int] = {}
+
+    for item in items:
+        headline = item["headline"].strip().lower()
+        words = _words(f"{item['headline']} {item['summary']}")
+        index = by_headline.get(headline)
+        if index is None:
+            index = _closest(
+                words, leaders, by_word, threshold, skip=item["source"], sources=sources
+            )
+        if index is None:
+            index = len(clusters)
+            clusters.append([])
+            leaders.append(words)
+            sources.append(set())
+            for word in words:
+                by_word.setdefault(word, []).append(index)
+        by_headline.setdefault(headline, index)
+        clusters[index].append(item)
+        sources[index].add(item["source"])
+
+    return [_representative(members) for members in clusters]
+
+
+# ── internal helpers ──────────────────────────────────────────
+
+
+def _words(text: str) -> frozenset[str]:
+    """The content words of *text*, as in :func:`tokens.words`, minus stopwords."""
+    return frozenset(word for word in tokens.words(text, _STOPWORDS) if len(word) >= 2)
+
+
+def _closest(
+    words: frozenset[str],
+    leaders: list[frozenset[str]],
+    by_word: dict[str, list[int]],
+    threshold: float,
+    *,
+    skip: str,
+    sources: list[set[str]],
+) -> int | None:
+    """Return the most similar cluster at or above *threshold* without a story from *skip*."""
+    shared = Counter(index for word in words for index in by_word.get(word, ()))
+    best, best_score = None, threshold
+    for index, count in shared.items():
+        if skip in sources[index]:
+            continue
+        score = count / (len(words) + len(leaders[index]) - count)
+        if score >= best_score:
+            best, best_score = index, score
+    return best
+
+
+def _representative(members: list[dict]) -> dict:
+    """Pick the cluster's story and list the other outlets that ran it."""
+    chosen = next((m for m in members if m["summary"]), members[0])
+    seen = {chosen["source"]}
+    alternates = []
+    for member in members:
+        if member["source"] not in seen:
+            seen.add(member["source"])
+            alternates.append({"source": member["source"], "url": member["url"]})
+    return {**chosen, "alternate_sources": alternates} if alternates else chosen
@@ -1,13 +1,21 @@
-"""News service — fetches top stories from RSS feeds via feedparser."""
+"""News service — fetches top stories from RSS feeds via feedparser.
+
+Feeds go through :mod:`feed_cache`, so unchanged feeds cost a ``304``
+instead of a full download and reparse.
+"""
 
 from __future__ import annotations
 
+import asyncio
 import re
-
-import feedparser
+from concurrent.futures import ThreadPoolExecutor, wait
 
 from ..config import cfg
-from .translator import translate_to_chinese
+from . import tracing
+from .feed_cache import cached_feed, fetch_feed, fetch_feed_async
+from .http_client import SharedAsyncClient
+from .news_clusters import cluster_stories
+from .translator import translate_batch
 
 _SOURCE_MAP: dict[str, str] = {
     "BBC News": "BBC News",
@@ -28,51 +36,119 @@ _SOURCE_MAP: dict[str, str] = {
 
 
 def fetch_news() -> list[dict]:
-    """Parse configured RSS feeds and return top N stories, balanced across sources."""
+    """Parse configured RSS feeds and return top N stories, balanced across sources.
+
+    Feeds are fetched in parallel, each with ``news.feedTimeoutSeconds``
+    to finish.  A feed that errors or misses its deadline is served from
+    its last good copy, or dropped if it has none.
+    """
+    effective_max, per_feed_limit = _limits()
+    timeout = cfg.news_feed_timeout
+
+    pool = ThreadPoolExecutor(max_workers=max(1, len(cfg.news_feeds)))
+    futures = [
+        pool.submit(tracing.in_context(fetch_feed), url, timeout=timeout) for url in cfg.news_feeds
+    ]
+    wait(futures, timeout=timeout)
+    # Don't block on stragglers — their results are no longer wanted.
+    pool.shutdown(wait=False, cancel_futures=True)
+
     all_entries: list[dict] = []
-    multiplier = cfg.ranking_fetch_multiplier if cfg.ranking_enabled else 1
-    effective_max = cfg.news_max_items * multiplier
-    # Take at most 3 per feed to ensure source diversity
-    per_feed_limit = max(2, effective_max // max(len(cfg.news_feeds), 1) + 1)
+    for feed_url, future in zip(cfg.news_feeds, futures):
+        if not future.done():
+            feed = _last_good(feed_url, f"no response within {timeout:g}s")
+        elif future.exception() is not None:
+            feed = _last_good(feed_url, future.exception())
+        else:
+            feed = future.result()
+        if feed is not None:
+            all_entries.extend(_feed_entries(feed, feed_url, per_feed_limit))
+
+    return _finalize(all_entries, effective_max)
+
+
+async def fetch_news_async(http: SharedAsyncClient) -> list[dict]:
+    """Async variant of :func:`fetch_news` — same per-feed deadlines and fallback."""
+    effective_max, per_feed_limit = _limits()
+    timeout = cfg.news_feed_timeout
 
-    for feed_url in cfg.news_feeds:
+    async def _one(feed_url: str) -> dict | None:
         try:
-            parsed = feedparser.parse(feed_url)
-            source_name = parsed.feed.get("title", feed_url)
-            source_name = _SOURCE_MAP.get(source_name, source_name)
-
-            for entry in parsed.entries[:per_feed_limit]:
-                all_entries.append(
-                    {
-                        "headline": entry.get("title", ""),
-                        "summary": _clean_summary(
-                            entry.get("summary", entry.get("description", ""))
-                        ),
-                        "source": source_name,
-                        "url": entry.get("link", "#"),
-                        "category": _extract_category(entry),
-                    }
-                )
+            return await asyncio.wait_for(
+                fetch_feed_async(http, feed_url, timeout=timeout), timeout
+            )
+        except TimeoutError:
+            return _last_good(feed_url, f"no response within {timeout:g}s")
         except Exception as e:
-            print(f"⚠️  Failed to parse feed {feed_url}: {e}")
+            return _last_good(feed_url, e)
 
-    # De-duplicate by headline, trim to max
-    seen: set[str] = set()
-    unique: list[dict] = []
-    for item in all_entries:
-        key = item["headline"].strip().lower()
-        if key not in seen:
-            seen.add(key)
-            unique.append(item)
+    # gather() keeps feed order, so source balancing is unchanged.
+    feeds = await asyncio.gather(*(_one(url) for url in cfg.news_feeds))
+    all_entries = [
+        entry
+        for feed_url, feed in zip(cfg.news_feeds, feeds)
+        if feed is not None
+        for entry in _feed_entries(feed, feed_url, per_feed_limit)
+    ]
+
+    return await asyncio.to_thread(_finalize, all_entries, effective_max)
+
+
+def _last_good(feed_url: str, reason: object) -> dict | None:
+    """Fall back to the cached copy of a feed that failed or timed out."""
+    feed = cached_feed(feed_url)
+    note = "using last good copy" if feed is not None else "skipped"
+    print(f"⚠️  Failed to parse feed {feed_url}: {reason} — {note}")
+    return feed
+
+
+def _limits() -> tuple[int, int]:
+    """Return ``(effective_max, per_feed_limit)`` for the current config."""
+    multiplier = cfg.ranking_fetch_multiplier if cfg.ranking_enabled else 1
+    effective_max = cfg.news_max_items * multiplier
+    # Take at most 3 per feed to ensure source diversity
+    per_feed_limit = max(2, effective_max // max(len(cfg.news_feeds), 1) + 1)
+    return effective_max, per_feed_limit
+
+
+def _feed_entries(feed: dict, feed_url: str, per_feed_limit: int) -> list[dict]:
+    """Convert a cached feed snapshot into news item dicts."""
+    source_name = feed.get("title") or feed_url
+    source_name = _SOURCE_MAP.get(source_name, source_name)
+
+    items = [
+        {
+            "headline": entry.get("title", ""),
+            "summary": _clean_summary(
+                entry.get("summary", entry.get("description", ""))
+            ),
+            "source": source_name,
+            "url": entry.get("link", "#"),
+            "category": _extract_category(entry),
+        }
+        for entry in feed["entries"][:per_feed_limit]
+    ]
+    # Kept untranslated for local relevance ranking; not part of the payload.
+    for item in items:
+        item["_original"] = f"{item['headline']} {item['summary']} {item['category']}"
+    return items
+
+
+def _finalize(all_entries: list[dict], effective_max: int) -> list[dict]:
+    """De-duplicate, trim and translate the collected entries."""
+    # Collapse stories several feeds ran, before translating and ranking them
+    unique = cluster_stories(all_entries, cfg.news_dedup_threshold)
+    if len(unique) < len(all_entries):
+        print(f"  🔗  News: {len(all_entries)} stories → {len(unique)} after merging near-duplicates")
 
     result = unique[: effective_max]
 
-    # Translate headlines, summaries, and categories to Chinese
+    # Translate headlines, summaries, and categories to Chinese in one batch
+    fields = ("headline", "summary", "category")
+    translated = iter(translate_batch([item[f] for item in result for f in fields]))
     for item in result:
-        item["headline"] = translate_to_chinese(item["headline"])
-        item["summary"] = translate_to_chinese(item["summary"])
-        if item["category"]:
-            item["category"] = translate_to_chinese(item["category"])
+        for f in fields:
+            item[f] = next(translated)
 
     return result
 
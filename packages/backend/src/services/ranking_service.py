@@ -2,84 +2,105 @@
 Ranking service — uses Gemini to rank fetched items by relevance.
 
 After all services over-fetch items (controlled by ``ranking.fetchMultiplier``),
-this module sends the collected items to Gemini and asks it to return ranked
-indices.  The final lists are trimmed back to the configured limits.
+:mod:`relevance` scores them locally and keeps a shortlist of
+``ranking.shortlistMultiplier`` × each limit.  The shortlist goes to Gemini,
+which streams back its picks as schema-constrained JSON records, best
+first, and the final lists are trimmed back to the configured limits.
 
 Two LLM calls are made:
   1. **Current-events** — ranks news + Hacker News stories together.
   2. **Tech-content**  — ranks arXiv papers + GitHub trending repos together.
 
-If Gemini is unavailable or the call fails, the original ordering is kept
-(graceful fallback).
+The calls are independent: the orchestrator runs each one as soon as its
+two sections have been fetched (see :data:`RANKING_GROUPS`), so ranking
+news + HN overlaps the slow arXiv fetch.
+
+If Gemini is unavailable, the call fails or it misses the ranking
+deadline, the local ranking is used instead (graceful fallback).  A reply
+cut short keeps the picks that did arrive; the local ranking fills the
+remaining slots.
 """
 
 from __future__ import annotations
 
-import json
-import re
+import functools
 from typing import Any
 
 from ..config import cfg
 from . import gemini_client
+from .relevance import top_items
+
+# Each LLM call and the two sections it reorders and trims.
+RANKING_GROUPS: dict[str, tuple[str, str]] = {
+    "current_events": ("news", "hn"),
+    "tech_content": ("arxiv", "github_trending"),
+}
 
 
 # ── public API ────────────────────────────────────────────────
 
 
-def rank_sections(sections: dict[str, Any]) -> dict[str, Any]:
-    """Rank and trim over-fetched sections using LLM.
+def rank_group(group: str, sections: dict[str, Any]) -> dict[str, list[dict]]:
+    """Rank one group's two sections with a single LLM call.
 
-    *sections* is the dict returned by ``_fetch_all()``.  This function
-    mutates it in-place **and** returns it for convenience.
-    """
-    if not cfg.ranking_enabled:
-        return sections
+    Only the group's inputs are read, so the orchestrator can run it as
+    soon as those two sections are in.  Without a Gemini client the
+    lists are just trimmed.
 
+    Returns:
+        ``{section: ranked list}`` for the group's two sections.
+    """
     client = gemini_client.get_client()
     if client is None:
-        print("⚠️  Ranking skipped — no Gemini API key")
-        return _trim_to_limits(sections)
-
-    print("🏆  Ranking items with LLM …")
-
-    # ── Call 1: current-events (news + HN) ──
-    news: list[dict] = sections.get("news", [])
-    hn: list[dict] = sections.get("hn", [])
-    news, hn = _rank_current_events(client, news, hn)
-    sections["news"] = news
-    sections["hn"] = hn
-
-    # ── Call 2: tech-content (arXiv + GitHub trending) ──
-    arxiv_papers: list[dict] = sections.get("arxiv", [])
-    github: list[dict] = sections.get("github_trending", [])
-    arxiv_papers, github = _rank_tech_content(client, arxiv_papers, github)
-    sections["arxiv"] = arxiv_papers
-    sections["github_trending"] = github
-
-    print("  ✅  Ranking complete")
-    return sections
+        _warn_no_client()
+        return trim_group(group, sections)
+
+    keys = RANKING_GROUPS[group]
+    rank = _rank_current_events if group == "current_events" else _rank_tech_content
+    # Only the best local candidates go into the prompt.
+    shortlists = [
+        top_items(key, sections.get(key, []), _limit(key) * cfg.ranking_shortlist_multiplier)
+        for key in keys
+    ]
+    fetched = sum(len(sections.get(key, [])) for key in keys)
+    shortlisted = sum(len(items) for items in shortlists)
+    print(f"🏆  Ranking {' + '.join(keys)} with LLM ({shortlisted} of {fetched} candidates) …")
+    ranked = rank(client, *shortlists)
+    print(f"  ✅  Ranked {' + '.join(keys)}")
+    return dict(zip(keys, ranked, strict=True))
+
+
+def trim_group(group: str, sections: dict[str, Any]) -> dict[str, list[dict]]:
+    """Fallback for :func:`rank_group`: rank locally, cut to the limits."""
+    keys = RANKING_GROUPS[group]
+    trimmed = _trim_to_limits({key: sections.get(key, []) for key in keys})
+    return {key: trimmed[key] for key in keys}
 
 
 # ── internal helpers ──────────────────────────────────────────
 
 
-def _trim_to_limits(sections: dict[str, Any]) -> dict[str, Any]:
-    """Fallback: just cut each list to configured limits (no LLM)."""
-    news = sections.get("news", [])
-    sections["news"] = news[: cfg.news_max_items]
+@functools.cache
+def _warn_no_client() -> None:
+    print("⚠️  Ranking skipped — no Gemini API key")
 
-    hn = sections.get("hn", [])
-    sections["hn"] = hn[: cfg.hn_max_stories]
 
-    arxiv_papers = sections.get("arxiv", [])
-    total_arxiv_limit = sum(q.get("maxResults", 3) for q in cfg.arxiv_queries)
-    sections["arxiv"] = arxiv_papers[:total_arxiv_limit]
+def _trim_to_limits(sections: dict[str, Any]) -> dict[str, Any]:
+    """Fallback: rank each list locally and cut it to the configured limit (no LLM)."""
+    for key in ("news", "hn", "arxiv", "github_trending"):
+        sections[key] = top_items(key, sections.get(key, []), _limit(key))
+    return sections
 
-    gh = sections.get("github_trending", [])
-    total_gh_limit = cfg.github_trending_max_per_lang * len(cfg.github_trending_languages)
-    sections["github_trending"] = gh[:total_gh_limit]
 
-    return sections
+def _limit(section: str) -> int:
+    """How many items of *section* the newsletter shows."""
+    if section == "news":
+        return cfg.news_max_items
+    if section == "hn":
+        return cfg.hn_max_stories
+    if section == "arxiv":
+        return sum(q.get("maxResults", 3) for q in cfg.arxiv_queries)
+    return cfg.github_trending_max_per_lang * len(cfg.github_trending_languages)
 
 
 def _rank_current_events(
@@ -88,16 +109,17 @@ def _rank_current_events(
     hn: list[dict],
 ) -> tuple[list[dict], list[dict]]:
     """Rank news and HN stories together via one LLM call."""
-    news_limit = cfg.news_max_items
-    hn_limit = cfg.hn_max_stories
+    news_limit = _limit("news")
+    hn_limit = _limit("hn")
 
     # Build summaries for LLM
     items_text = ""
     items_text += "=== NEWS ===\n"
     for i, n in enumerate(news):
         headline = n.get("headline", n.get("title", ""))
-        source = n.get("source", "")
-        items_text += f"N{i}: [{source}] {headline}\n"
+        # Outlets that also ran the story hint at its importance.
+        sources = [n.get("source", ""), *(a["source"] for a in n.get("alternate_sources", []))]
+        items_text += f"N{i}: [{', '.join(sources)}] {headline}\n"
 
     items_text += "\n=== HACKER NEWS ===\n"
     for i, h in enumerate(hn):
@@ -112,16 +134,15 @@ def _rank_current_events(
         "3. 话题多样性（避免重复话题）\n\n"
         f"{items_text}\n"
         f"请从NEWS中选出最重要的 {news_limit} 条，从HACKER NEWS中选出最重要的 {hn_limit} 条。\n"
-        "请严格按以下JSON格式回复，不要多余内容：\n"
-        '{"news": [0, 2, 1], "hn": [3, 1, 0]}\n'
-        "其中数组内是原始编号（如N0, N2, …和H3, H1, …），按推荐顺序排列。"
+        "请按推荐顺序逐条回复选中的条目：list 为 \"news\" 或 \"hn\"，"
+        "index 为原始编号（N2 → news 2，H3 → hn 3）。"
     )
 
-    text = gemini_client.generate(client, prompt)
-    if text is None:
+    reply = gemini_client.generate_records(client, prompt, _pick_schema("news", "hn"))
+    if reply is None:
         return news[:news_limit], hn[:hn_limit]
 
-    indices = _parse_index_json(text)
+    indices = _indices(reply.records)
     ranked_news = _reorder(news, indices.get("news"), news_limit)
     ranked_hn = _reorder(hn, indices.get("hn"), hn_limit)
     return ranked_news, ranked_hn
@@ -133,8 +154,8 @@ def _rank_tech_content(
     github: list[dict],
 ) -> tuple[list[dict], list[dict]]:
     """Rank arXiv papers and GitHub trending repos together via one LLM call."""
-    total_arxiv_limit = sum(q.get("maxResults", 3) for q in cfg.arxiv_queries)
-    total_gh_limit = cfg.github_trending_max_per_lang * len(cfg.github_trending_languages)
+    total_arxiv_limit = _limit("arxiv")
+    total_gh_limit = _limit("github_trending")
 
     items_text = ""
     items_text += "=== ARXIV PAPERS ===\n"
@@ -159,50 +180,41 @@ def _rank_tech_content(
         f"{items_text}\n"
         f"请从ARXIV PAPERS中选出最重要的 {total_arxiv_limit} 篇，"
         f"从GITHUB TRENDING中选出最重要的 {total_gh_limit} 个项目。\n"
-        "请严格按以下JSON格式回复，不要多余内容：\n"
-        '{"arxiv": [0, 2, 1], "github": [3, 1, 0]}\n'
-        "其中数组内是原始编号（如A0, A2, …和G3, G1, …），按推荐顺序排列。"
+        "请按推荐顺序逐条回复选中的条目：list 为 \"arxiv\" 或 \"github\"，"
+        "index 为原始编号（A2 → arxiv 2，G3 → github 3）。"
     )
 
-    text = gemini_client.generate(client, prompt)
-    if text is None:
+    reply = gemini_client.generate_records(client, prompt, _pick_schema("arxiv", "github"))
+    if reply is None:
         return arxiv_papers[:total_arxiv_limit], github[:total_gh_limit]
 
-    indices = _parse_index_json(text)
+    indices = _indices(reply.records)
     ranked_arxiv = _reorder(arxiv_papers, indices.get("arxiv"), total_arxiv_limit)
     ranked_gh = _reorder(github, indices.get("github"), total_gh_limit)
     return ranked_arxiv, ranked_gh
 
 
-def _parse_index_json(text: str) -> dict[str, list[int]]:
-    """Extract the JSON object from possibly decorated LLM output."""
-    # Strip markdown code fences if present
-    text = re.sub(r"```(?:json)?\s*", "", text)
-    text = text.strip().rstrip("`")
-
-    # Find the outermost JSON object using brace matching
-    start = text.find("{")
-    if start == -1:
-        return {}
-    depth = 0
-    for i in range(start, len(text)):
-        if text[i] == "{":
-            depth += 1
-        elif text[i] == "}":
-            depth -= 1
-            if depth == 0:
-                json_str = text[start : i + 1]
-                break
-    else:
-        return {}
-
-    try:
-        data = json.loads(json_str)
-        return {
-            k: [int(x) for x in v] for k, v in data.items() if isinstance(v, list)
-        }
-    except (json.JSONDecodeError, ValueError, TypeError):
-        return {}
+def _pick_schema(*lists: str) -> dict[str, Any]:
+    """Schema of one streamed pick: the list it comes from and its number there."""
+    return {
+        "type": "OBJECT",
+        "properties": {
+            "list": {"type": "STRING", "enum": list(lists)},
+            "index": {"type": "INTEGER"},
+        },
+        "required": ["list", "index"],
+    }
+
+
+def _indices(picks: list[dict[str, Any]]) -> dict[str, list[int]]:
+    """Group streamed picks into ``{list: [index, …]}``, keeping reply order."""
+    indices: dict[str, list[int]] = {}
+    for pick in picks:
+        try:
+            indices.setdefault(str(pick["list"]), []).append(int(pick["index"]))
+        except (KeyError, TypeError, ValueError):
+            continue  # skip a malformed record
+    return indices
 
 
 def _reorder(items: list[dict], indices: list[int] | None, limit: int) -> list[dict]:
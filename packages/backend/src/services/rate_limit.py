@@ -0,0 +1,106 @@
+"""
+Token-bucket rate limiter — shared across threads and, optionally, processes.
+
+A bucket holds up to ``capacity`` tokens and refills at ``rate`` tokens per
+second.  :meth:`TokenBucket.acquire` only sleeps when the bucket is empty,
+so callers pay for the rate limit only when they actually hit it.
+
+When ``state_path`` is given, the bucket state lives in that file and is
+guarded with ``flock``, so every process on the machine (cron runs,
+parallel tenants, …) draws from the same bucket.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import IO
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover — non-POSIX: in-process limiting only
+    fcntl = None  # type: ignore[assignment]
+
+
+class TokenBucket:
+    """Thread-safe (and optionally process-safe) token bucket.
+
+    Args:
+        rate: Tokens added per second.
+        capacity: Maximum burst size.
+        state_path: Optional file shared by every process using this bucket.
+    """
+
+    def __init__(self, rate: float, capacity: float = 1.0, state_path: Path | None = None) -> None:
+        if rate <= 0 or capacity <= 0:
+            raise ValueError("rate and capacity must be positive")
+        self.rate = rate
+        self.capacity = capacity
+        self.state_path = state_path
+        self._lock = threading.Lock()
+        self._tokens = capacity
+        self._stamp = time.time()
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """Block until *tokens* are available, take them, and return the time waited."""
+        waited = 0.0
+        with self._lock:
+            while True:
+                with self._state() as state:
+                    self._refill(state)
+                    if state["tokens"] >= tokens:
+                        state["tokens"] -= tokens
+                        return waited
+                    delay = (tokens - state["tokens"]) / self.rate
+                time.sleep(delay)
+                waited += delay
+
+    def penalize(self, seconds: float) -> None:
+        """Empty the bucket so the next acquire waits at least *seconds*.
+
+        Use after the upstream signals it is overloaded (e.g. HTTP 429).
+        """
+        with self._lock, self._state() as state:
+            self._refill(state)
+            state["tokens"] = min(state["tokens"], 0.0) - seconds * self.rate
+
+    # ── internal helpers ─────────────────────
+
+    def _refill(self, state: dict[str, float]) -> None:
+        now = time.time()
+        elapsed = max(0.0, now - state["stamp"])
+        state["tokens"] = min(self.capacity, state["tokens"] + elapsed * self.rate)
+        state["stamp"] = now
+
+    @contextmanager
+    def _state(self) -> Iterator[dict[str, float]]:
+        """Yield the mutable bucket state, persisting it afterwards."""
+        if self.state_path is None or fcntl is None:
+            state = {"tokens": self._tokens, "stamp": self._stamp}
+            yield state
+            self._tokens, self._stamp = state["tokens"], state["stamp"]
+            return
+
+        self.state_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.state_path, "a+", encoding="utf-8") as fh:
+            fcntl.flock(fh, fcntl.LOCK_EX)
+            try:
+                state = self._read(fh)
+                yield state
+                fh.seek(0)
+                fh.truncate()
+                json.dump(state, fh)
+            finally:
+                fcntl.flock(fh, fcntl.LOCK_UN)
+
+    def _read(self, fh: IO[str]) -> dict[str, float]:
+        fh.seek(0)
+        try:
+            raw = json.loads(fh.read() or "{}")
+            return {"tokens": float(raw["tokens"]), "stamp": float(raw["stamp"])}
+        except (ValueError, KeyError, TypeError):
+            return {"tokens": self.capacity, "stamp": time.time()}
@@ -0,0 +1,104 @@
+"""
+Local relevance scoring — a fast, offline ranking for over-fetched sections.
+
+Each candidate is scored with Okapi BM25 against the interest profile
+(``ranking.interests``), using the section's own candidates as the
+corpus.  Where the source has a popularity signal (Hacker News points,
+GitHub stars gained today) it is blended in on a log scale.
+
+Ranking uses this to cut every list down to a shortlist before the
+Gemini prompt, and as the whole ranking when no API key is set.  Ties
+keep the fetched order, so without interests or popularity a section
+comes back exactly as fetched.
+"""
+
+from __future__ import annotations
+
+import math
+from collections import Counter
+from collections.abc import Callable
+
+from ..config import cfg
+from .tokens import words
+
+# BM25 term-frequency saturation and length normalisation.
+_K1 = 1.2
+_B = 0.75
+
+# Share of the score given to popularity, in sections that have it.
+_POPULARITY_WEIGHT = 0.5
+
+# The English text each section is matched on (news is translated in place,
+# so news_service keeps the original under ``_original``).
+_TEXT: dict[str, Callable[[dict], str]] = {
+    "news": lambda n: n.get("_original") or f"{n.get('headline', '')} {n.get('summary', '')}",
+    "hn": lambda h: h.get("title", ""),
+    "arxiv": lambda p: f"{p.get('title', '')} {p.get('category', '')}",
+    "github_trending": lambda g: (
+        f"{g.get('name', '').replace('/', ' ')} {g.get('description', '')} {g.get('language', '')}"
+    ),
+}
+
+_POPULARITY: dict[str, str] = {"hn": "points", "github_trending": "today_stars"}
+
+
+def top_items(section: str, items: list[dict], limit: int) -> list[dict]:
+    """Return the *limit* most relevant of *items*, best first.
+
+    Args:
+        section: Section name, which selects the text and popularity fields.
+        items: The section's fetched items, in fetched order.
+        limit: How many to keep.
+    """
+    scores = _relevance(section, items)
+    order = sorted(range(len(items)), key=lambda i: -scores[i])
+    return [items[i] for i in order[:limit]]
+
+
+# ── internal helpers ──────────────────────────────────────────
+
+
+def _relevance(section: str, items: list[dict]) -> list[float]:
+    """Scores in [0, 1]: BM25 against the interests, plus popularity if any."""
+    text = _TEXT[section]
+    scores = _normalised(_bm25([words(text(item)) for item in items], _interests()))
+
+    field = _POPULARITY.get(section)
+    if field is not None:
+        popularity = _normalised([math.log1p(max(0, item.get(field) or 0)) for item in items])
+        scores = [
+            (1 - _POPULARITY_WEIGHT) * s + _POPULARITY_WEIGHT * p
+            for s, p in zip(scores, popularity, strict=True)
+        ]
+    return scores
+
+
+def _bm25(docs: list[list[str]], query: frozenset[str]) -> list[float]:
+    """Okapi BM25 of each document against *query*, with *docs* as the corpus."""
+    if not docs or not query:
+        return [0.0] * len(docs)
+
+    avg_len = sum(len(doc) for doc in docs) / len(docs) or 1.0
+    freqs = [Counter(doc) for doc in docs]
+    df = Counter(term for tf in freqs for term in tf.keys() & query)
+    idf = {
+        term: math.log(1 + (len(docs) - n + 0.5) / (n + 0.5)) for term, n in df.items()
+    }
+
+    scores = []
+    for doc, tf in zip(docs, freqs, strict=True):
+        norm = _K1 * (1 - _B + _B * len(doc) / avg_len)
+        scores.append(
+            sum(weight * tf[term] * (_K1 + 1) / (tf[term] + norm) for term, weight in idf.items())
+        )
+    return scores
+
+
+def _interests() -> frozenset[str]:
+    return frozenset(word for phrase in cfg.ranking_interests for word in words(phrase))
+
+
+def _normalised(values: list[float]) -> list[float]:
+    """Scale *values* so the largest is 1 (all zeros stay zeros)."""
+    top = max(values, default=0.0)
+    return [v / top for v in values] if top > 0 else [0.0] * len(values)
@@ -0,0 +1,114 @@
+"""
+Section cache — each section's last good result, kept across runs.
+
+A section listed under ``sectionCache.ttlSeconds`` is stored after every
+successful, non-empty fetch.  On the next run:
+
+* a copy younger than its TTL is served as-is and the fetch is skipped
+  (cheap reruns);
+* an older copy is revalidated by fetching live, and is served instead
+  when that fetch fails, comes back empty or misses its deadline — as
+  long as it is younger than ``sectionCache.maxStaleSeconds``.
+
+Keys are task names (``astronomy@37.37,-122.04`` for keyed fan-out
+tasks) plus a digest of any arguments bound with ``functools.partial``
+and of the config settings the section reads, so each location or
+symbol set is cached separately and a config edit starts a fresh entry.
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import time
+from collections.abc import Callable
+from typing import Any
+
+from ..config import cfg
+from .cache_store import JsonCache
+
+_cache = JsonCache("sections")
+
+_RANKING = ("ranking_enabled", "ranking_fetch_multiplier")
+
+# The ``cfg`` fields each section's fetch reads, folded into its key.
+_SETTINGS: dict[str, tuple[str, ...]] = {
+    "weather": ("weather_location", "weather_grid_degrees", "timezone"),
+    "astronomy": ("weather_location", "timezone"),
+    "exchange_rates": ("exchange_rate_pairs", "exchange_rate_names"),
+    "stocks": ("stock_symbols", "stock_names"),
+    "news": ("news_feeds", "news_max_items", "news_dedup_threshold", *_RANKING),
+    "hn": ("hn_max_stories", *_RANKING),
+    "github_trending": ("github_trending_languages", "github_trending_max_per_lang", *_RANKING),
+    "arxiv": ("arxiv_queries", "arxiv_merge_queries", "gemini_model", *_RANKING),
+}
+
+
+class SectionCache:
+    """The cached copies for one run's tasks, read in a single query.
+
+    Args:
+        tasks: Task name → fetch function.  Tasks whose section has no
+            TTL are neither read nor stored.
+    """
+
+    def __init__(self, tasks: dict[str, Callable[[], Any]]) -> None:
+        self._keys = {
+            name: _key(name, fn)
+            for name, fn in tasks.items()
+            if cfg.section_cache_enabled and _ttl(name) is not None
+        }
+        self._entries = _cache.get_many(self._keys.values()) if self._keys else {}
+
+    def fresh(self, name: str) -> Any | None:
+        """Return the cached copy of *name* if it is younger than its TTL."""
+        entry = self._entry(name)
+        ttl = _ttl(name)
+        if entry is None or ttl is None or _age(entry) >= ttl:
+            return None
+        print(f"  💾  {name} (cached {_format_age(_age(entry))} ago)")
+        return entry[0]
+
+    def fallback(self, name: str, default: Any) -> Any:
+        """Return the last good copy of *name* if it is recent enough, else *default*."""
+        entry = self._entry(name)
+        if entry is None or _age(entry) >= cfg.section_cache_max_stale:
+            return default
+        print(f"  ♻️  {name}: using cached copy from {_format_age(_age(entry))} ago")
+        return entry[0]
+
+    def store(self, name: str, value: Any) -> None:
+        """Remember a successful result for later runs."""
+        if name in self._keys and value:
+            _cache.set(self._keys[name], value)
+
+    # ── internal helpers ─────────────────────
+
+    def _entry(self, name: str) -> tuple[Any, float] | None:
+        key = self._keys.get(name)
+        return self._entries.get(key) if key is not None else None
+
+
+def _key(name: str, fn: Callable[[], Any]) -> str:
+    parts: list[Any] = [getattr(cfg, attr) for attr in _SETTINGS.get(name.split("@")[0], ())]
+    if isinstance(fn, functools.partial) and (fn.args or fn.keywords):
+        parts += [fn.args, sorted(fn.keywords.items())]
+    if not parts:
+        return name
+    return f"{name}#{hashlib.sha1(repr(parts).encode()).hexdigest()[:12]}"
+
+
+def _ttl(name: str) -> float | None:
+    return cfg.section_cache_ttls.get(name.split("@")[0])
+
+
+def _age(entry: tuple[Any, float]) -> float:
+    return time.time() - entry[1]
+
+
+def _format_age(seconds: float) -> str:
+    if seconds < 3600:
+        return f"{seconds / 60:.0f}m"
+    if seconds < 86400:
+        return f"{seconds / 3600:.1f}h"
+    return f"{seconds / 86400:.1f}d"
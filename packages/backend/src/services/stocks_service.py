@@ -1,40 +1,34 @@
-"""Stocks service — uses yfinance (free, no API key)."""
+"""Stocks service — uses yfinance (free, no API key) via :mod:`market_data`."""
 
 from __future__ import annotations
 
 from ..config import cfg
+from .market_data import get_quotes
 
 
-def fetch_stocks() -> list[dict]:
-    """Fetch latest stock data for configured symbols."""
-    import yfinance as yf
-
+def fetch_stocks(symbols: list[str] | None = None) -> list[dict]:
+    """Fetch latest stock data for *symbols* (default: configured symbols)."""
+    symbols = cfg.stock_symbols if symbols is None else symbols
     results: list[dict] = []
-
-    for symbol in cfg.stock_symbols:
-        try:
-            ticker = yf.Ticker(symbol)
-            info = ticker.fast_info
-
-            price = info.last_price
-            prev_close = info.previous_close
-
-            if price is None or prev_close is None:
-                continue
-
-            change = price - prev_close
-            change_pct = (change / prev_close) * 100 if prev_close else 0
-
-            results.append(
-                {
-                    "symbol": symbol,
-                    "company_name": cfg.stock_names.get(symbol, symbol),
-                    "price": round(price, 2),
-                    "change": round(change, 2),
-                    "change_percent": round(change_pct, 2),
-                }
-            )
-        except Exception as e:
-            print(f"⚠️  Failed to fetch stock {symbol}: {e}")
+    quotes = get_quotes(symbols)
+
+    for symbol in symbols:
+        quote = quotes.get(symbol)
+        if quote is None or quote.previous_close is None:
+            continue
+
+        price, prev_close = quote.price, quote.previous_close
+        change = price - prev_close
+        change_pct = (change / prev_close) * 100 if prev_close else 0
+
+        results.append(
+            {
+                "symbol": symbol,
+                "company_name": cfg.stock_names.get(symbol, symbol),
+                "price": round(price, 2),
+                "change": round(change, 2),
+                "change_percent": round(change_pct, 2),
+            }
+        )
 
     return results
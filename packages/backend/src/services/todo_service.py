@@ -8,44 +8,80 @@ Retries once on failure; returns an empty list if both attempts fail
 
 from __future__ import annotations
 
+import asyncio
 import os
 import time
 
+import httpx
 import requests
 
 from ..config import cfg
+from . import tracing
+from .http_client import SharedAsyncClient
+
+_MAX_ATTEMPTS = 2
+_RETRY_DELAY = 2.0  # seconds between attempts
 
 
 def fetch_todo_tasks() -> list[dict]:
     """Fetch top recommended tasks. Returns [] on failure (section skipped)."""
-    base = os.environ.get("TODO_API_BASE", "https://daily.ziyixi.science")
-    url = f"{base}/api/recommendation"
-    params = {"top": 5}
+    url, params = _recommendation_request()
     auth = (cfg.todo_api_user, cfg.todo_api_password)
 
     if not cfg.todo_api_user or not cfg.todo_api_password:
         print("    ⚠️  TODO_API_USER / TODO_API_PASSWORD not set — skipping")
         return []
 
-    max_attempts = 2
-    for attempt in range(1, max_attempts + 1):
+    for attempt in range(1, _MAX_ATTEMPTS + 1):
         try:
-            resp = requests.get(url, params=params, auth=auth, timeout=45)
+            with tracing.span(f"GET {httpx.URL(url).host}", "http", url=url) as info:
+                resp = requests.get(url, params=params, auth=auth, timeout=45)
+                info["status"] = resp.status_code
             resp.raise_for_status()
-            data = resp.json()
-            tasks = data.get("tasks", [])
-            return [
-                {
-                    "rank": t.get("rank", i + 1),
-                    "title": t.get("title", ""),
-                    "reason": t.get("reason", ""),
-                }
-                for i, t in enumerate(tasks)
-            ]
+            return _to_tasks(resp.json())
         except Exception as e:
-            print(f"    ⚠️  Todo fetch attempt {attempt}/{max_attempts} failed: {e}")
-            if attempt < max_attempts:
-                time.sleep(2)
+            print(f"    ⚠️  Todo fetch attempt {attempt}/{_MAX_ATTEMPTS} failed: {e}")
+            if attempt < _MAX_ATTEMPTS:
+                time.sleep(_RETRY_DELAY)
 
     # All attempts failed — return empty so the section is not rendered
     return []
+
+
+async def fetch_todo_tasks_async(http: SharedAsyncClient) -> list[dict]:
+    """Async variant of :func:`fetch_todo_tasks` on the shared client."""
+    url, params = _recommendation_request()
+    auth = httpx.BasicAuth(cfg.todo_api_user, cfg.todo_api_password)
+
+    if not cfg.todo_api_user or not cfg.todo_api_password:
+        print("    ⚠️  TODO_API_USER / TODO_API_PASSWORD not set — skipping")
+        return []
+
+    for attempt in range(1, _MAX_ATTEMPTS + 1):
+        try:
+            resp = await http.get(url, params=params, auth=auth, timeout=45)
+            resp.raise_for_status()
+            return _to_tasks(resp.json())
+        except Exception as e:
+            print(f"    ⚠️  Todo fetch attempt {attempt}/{_MAX_ATTEMPTS} failed: {e}")
+            if attempt < _MAX_ATTEMPTS:
+                await asyncio.sleep(_RETRY_DELAY)
+
+    return []
+
+
+def _recommendation_request() -> tuple[str, dict[str, int]]:
+    base = os.environ.get("TODO_API_BASE", "https://daily.ziyixi.science")
+    return f"{base}/api/recommendation", {"top": 5}
+
+
+def _to_tasks(data: dict) -> list[dict]:
+    tasks = data.get("tasks", [])
+    return [
+        {
+            "rank": t.get("rank", i + 1),
+            "title": t.get("title", ""),
+            "reason": t.get("reason", ""),
+        }
+        for i, t in enumerate(tasks)
+    ]
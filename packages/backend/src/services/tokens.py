@@ -0,0 +1,24 @@
+"""
+Word tokenizer shared by local relevance ranking and news clustering.
+
+Text is lowercased and split on ``\\w+`` runs, and a trailing plural
+``s`` is dropped from longer words, so "Models" and "model" match.
+"""
+
+from __future__ import annotations
+
+import re
+
+_WORD = re.compile(r"\w+")
+
+
+def words(text: str, stopwords: frozenset[str] = frozenset()) -> list[str]:
+    """Return the words of *text* in order, singularised, without *stopwords*.
+
+    *stopwords* are matched before the plural ``s`` is dropped.
+    """
+    return [_singular(word) for word in _WORD.findall(text.lower()) if word not in stopwords]
+
+
+def _singular(word: str) -> str:
+    return word[:-1] if len(word) > 3 and word.endswith("s") and not word.endswith("ss") else word
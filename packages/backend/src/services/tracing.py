@@ -0,0 +1,220 @@
+"""
+Run tracing — nested timing spans written as a Chrome trace.
+
+Wrap any stage in :func:`span`; spans nest through a context variable, so
+an HTTP request made inside a section is recorded as that section's
+child.  Each thread and each asyncio task gets its own lane, which keeps
+overlapping work readable.  :func:`write_trace` dumps everything in the
+Chrome trace-event format — open it in ``chrome://tracing`` or
+https://ui.perfetto.dev — with a per-section summary under ``otherData``.
+Sections abandoned at their deadline are listed there too (see
+:func:`record_late`).
+
+Recording is cheap (one dict per span), so it is always on.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import itertools
+import json
+import os
+import sys
+import threading
+import time
+from collections import defaultdict
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future
+from contextlib import contextmanager
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, ParamSpec, TypeVar
+
+if TYPE_CHECKING:
+    import asyncio
+
+_P = ParamSpec("_P")
+_R = TypeVar("_R")
+
+_epoch = time.perf_counter()
+_lock = threading.Lock()
+_events: list[dict[str, Any]] = []
+_lanes: dict[int, int] = {}
+_lane_names: dict[int, str] = {}
+_ids = itertools.count(1)
+_late: list[dict[str, Any]] = []
+
+# (span id, section) of the innermost open span in this context.
+_current: contextvars.ContextVar[tuple[int, str] | None] = contextvars.ContextVar(
+    "trace_span", default=None
+)
+
+
+@contextmanager
+def span(name: str, cat: str = "stage", **args: Any) -> Iterator[dict[str, Any]]:
+    """Time the enclosed block as one span.
+
+    Yields the span's ``args`` dict so the caller can attach results
+    (status code, item count, …) before the span closes.  A span that
+    exits with an exception records it under ``args["error"]``.
+
+    Args:
+        name: Short label shown on the timeline.
+        cat: Category — ``section``, ``http``, ``gemini``, ``translate``, ….
+        **args: Extra fields stored with the span.
+    """
+    parent = _current.get()
+    span_id = next(_ids)
+    # Sections are the top level; everything below inherits its section.
+    section = name if cat == "section" else (parent[1] if parent else "")
+    if parent:
+        args["parent"] = parent[0]
+    if section:
+        args["section"] = section
+
+    token = _current.set((span_id, section))
+    lane = _lane()
+    start = time.perf_counter()
+    try:
+        yield args
+    except BaseException as exc:
+        args["error"] = f"{type(exc).__name__}: {exc}"
+        raise
+    finally:
+        end = time.perf_counter()
+        _current.reset(token)
+        event = {
+            "name": name,
+            "cat": cat,
+            "ph": "X",
+            "ts": round((start - _epoch) * 1e6),
+            "dur": round((end - start) * 1e6),
+            "pid": os.getpid(),
+            "tid": lane,
+            "id": span_id,
+            "args": args,
+        }
+        with _lock:
+            _events.append(event)
+
+
+def in_context(fn: Callable[_P, _R]) -> Callable[_P, _R]:
+    """Bind *fn* to the caller's context so its spans nest when run on a worker thread.
+
+    ``ThreadPoolExecutor`` does not carry context variables across; wrap
+    the callable before submitting it.
+    """
+    ctx = contextvars.copy_context()
+
+    def run(*args: _P.args, **kwargs: _P.kwargs) -> _R:
+        return ctx.copy().run(fn, *args, **kwargs)
+
+    return run
+
+
+def record_late(
+    section: str, deadline: float, future: Future[Any] | asyncio.Future[Any] | None = None
+) -> None:
+    """Note that *section* missed its *deadline* (seconds) and was abandoned.
+
+    When the abandoned work's *future* is given, the entry is updated
+    once it finishes — ``late_by_s`` is how far past the deadline the
+    result arrived, ``null`` if the report was written first.
+    """
+    missed_at = time.perf_counter()
+    entry: dict[str, Any] = {"section": section, "deadline_s": round(deadline, 1), "late_by_s": None}
+    with _lock:
+        _late.append(entry)
+    if future is not None:
+        future.add_done_callback(
+            lambda f: entry.update(
+                late_by_s=round(time.perf_counter() - missed_at, 1),
+                outcome="cancelled" if f.cancelled() else "error" if f.exception() else "ok",
+            )
+        )
+
+
+def late_sections() -> list[dict[str, Any]]:
+    """Return the sections abandoned at their deadline so far."""
+    with _lock:
+        return [dict(entry) for entry in _late]
+
+
+def reset() -> None:
+    """Discard every recorded span (used between runs and in tests)."""
+    with _lock:
+        _events.clear()
+        _late.clear()
+        _lanes.clear()
+        _lane_names.clear()
+
+
+def events() -> list[dict[str, Any]]:
+    """Return a snapshot of the recorded spans, oldest first."""
+    with _lock:
+        return sorted(_events, key=lambda e: e["ts"])
+
+
+def summary() -> dict[str, Any]:
+    """Aggregate the recorded spans per section and per category.
+
+    Returns:
+        ``{"sections": {name: ms}, "categories": {cat: {"count", "total_ms"}},
+        "late_sections": [...]}``.
+    """
+    sections: dict[str, float] = {}
+    categories: dict[str, dict[str, float]] = defaultdict(lambda: {"count": 0, "total_ms": 0.0})
+    for event in events():
+        ms = event["dur"] / 1000
+        if event["cat"] == "section":
+            sections[event["name"]] = round(ms, 1)
+        bucket = categories[event["cat"]]
+        bucket["count"] += 1
+        bucket["total_ms"] = round(bucket["total_ms"] + ms, 1)
+    return {
+        "sections": sections,
+        "categories": dict(categories),
+        "late_sections": late_sections(),
+    }
+
+
+def write_trace(path: Path) -> Path:
+    """Write the recorded spans to *path* in Chrome trace-event format."""
+    pid = os.getpid()
+    with _lock:
+        names = dict(_lane_names)
+    meta = [
+        {"name": "thread_name", "ph": "M", "pid": pid, "tid": lane, "args": {"name": label}}
+        for lane, label in names.items()
+    ]
+    trace = {
+        "traceEvents": meta + events(),
+        "displayTimeUnit": "ms",
+        "otherData": summary(),
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(trace, ensure_ascii=False), encoding="utf-8")
+    return path
+
+
+# ── internal helpers ──────────────────────────────────────────
+
+
+def _lane() -> int:
+    """Return a small integer lane for the current asyncio task or thread."""
+    # No task can be running unless asyncio is loaded; don't import it here.
+    # Another thread may be halfway through importing it, hence getattr.
+    current_task = getattr(sys.modules.get("asyncio"), "current_task", None)
+    task = None
+    if current_task is not None:
+        try:
+            task = current_task()
+        except RuntimeError:
+            pass
+
+    key = id(task) if task is not None else threading.get_ident()
+    with _lock:
+        lane = _lanes.get(key)
+        if lane is None:
+            lane = _lanes[key] = len(_lanes) + 1
+            _lane_names[lane] = task.get_name() if task else threading.current_thread().name
+        return lane
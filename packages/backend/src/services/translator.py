@@ -1,7 +1,30 @@
-"""Translator utility — translates text to Chinese using Google Translate."""
+"""Translator utility — translates text to Chinese using Google Translate.
+
+:func:`translate_batch` is the main entry point: it de-duplicates its
+inputs, skips text that is already Chinese, serves repeats from an
+on-disk cache, and packs the remaining strings into a few
+newline-joined requests instead of one request per string.
+"""
 
 from __future__ import annotations
 
+import hashlib
+import re
+from collections.abc import Sequence
+
+from . import tracing
+from .cache_store import JsonCache
+
+_TARGET = "zh-CN"
+
+# Google's web endpoint rejects payloads over 5000 characters.
+_MAX_CHARS_PER_REQUEST = 4500
+
+# Han characters only — Japanese kana and Korean Hangul still need translating.
+_HAN = re.compile(r"[\u3400-\u4dbf\u4e00-\u9fff\uf900-\ufaff]")
+
+_cache = JsonCache("translations")
+
 
 def translate_to_chinese(text: str) -> str:
     """Translate text to Chinese (Simplified) using deep-translator.
@@ -15,13 +38,109 @@ def translate_to_chinese(text: str) -> str:
     Returns:
         The translated text, or the original text on failure.
     """
+    return translate_batch([text])[0]
+
+
+def translate_batch(texts: Sequence[str]) -> list[str]:
+    """Translate many strings to Chinese (Simplified) in as few calls as possible.
+
+    Empty strings and text that is already Chinese are returned as-is.
+    Any string whose translation fails is also returned unchanged.
+
+    Args:
+        texts: The strings to translate.
+
+    Returns:
+        Translations in the same order as *texts*.
+    """
+    pending = [t for t in dict.fromkeys(texts) if _needs_translation(t)]
+    if not pending:
+        return list(texts)
+
+    keys = {t: _cache_key(t) for t in pending}
+    cached = _cache.get_many(keys.values())
+    translated: dict[str, str] = {t: cached[k][0] for t, k in keys.items() if k in cached}
+
+    misses = [t for t in pending if t not in translated]
+    if misses:
+        fresh = _translate_remote(misses)
+        _cache.set_many({keys[t]: result for t, result in fresh.items()})
+        translated.update(fresh)
+
+    return [translated.get(t, t) for t in texts]
+
+
+# ── internal helpers ──────────────────────────────────────────
+
+
+def _needs_translation(text: str) -> bool:
+    """Return False for empty text and text that is already mostly Chinese.
+
+    Anything else — Latin, Cyrillic, Arabic, kana, Hangul — is sent with
+    ``source="auto"``.
+    """
     if not text or not text.strip():
-        return text
+        return False
+    han = len(_HAN.findall(text))
+    letters = sum(c.isalpha() for c in text)
+    return han == 0 or 2 * han < letters
+
 
+def _cache_key(text: str) -> str:
+    return hashlib.sha256(f"{_TARGET}\0{text}".encode()).hexdigest()
+
+
+def _translate_remote(texts: list[str]) -> dict[str, str]:
+    """Translate *texts* in newline-packed chunks; omit failures from the result."""
     try:
         from deep_translator import GoogleTranslator
+    except ImportError:
+        return {}
+
+    translator = GoogleTranslator(source="auto", target=_TARGET)
+    results: dict[str, str] = {}
+
+    for chunk in _pack(texts):
+        # Newlines separate the packed strings, so flatten any inside them.
+        lines = [" ".join(t.split()) for t in chunk]
+        try:
+            with tracing.span("translate", "translate", strings=len(chunk)):
+                out = translator.translate("\n".join(lines)) or ""
+        except Exception:
+            continue  # leave this chunk untranslated
+
+        parts = out.split("\n")
+        if len(parts) == len(chunk):
+            results.update(
+                (src, part.strip()) for src, part in zip(chunk, parts) if part.strip()
+            )
+            continue
+
+        # Packing was not preserved — go one by one.
+        for src, line in zip(chunk, lines):
+            try:
+                with tracing.span("translate", "translate", strings=1):
+                    single = translator.translate(line)
+                if single:
+                    results[src] = single
+            except Exception:
+                continue
+
+    return results
+
 
-        result = GoogleTranslator(source="auto", target="zh-CN").translate(text)
-        return result or text
-    except Exception:
-        return text
+def _pack(texts: list[str]) -> list[list[str]]:
+    """Group *texts* into chunks that fit in one request."""
+    chunks: list[list[str]] = []
+    current: list[str] = []
+    size = 0
+    for text in texts:
+        length = min(len(text), _MAX_CHARS_PER_REQUEST) + 1
+        if current and size + length > _MAX_CHARS_PER_REQUEST:
+            chunks.append(current)
+            current, size = [], 0
+        current.append(text)
+        size += length
+    if current:
+        chunks.append(current)
+    return chunks
@@ -2,11 +2,17 @@
 
 from __future__ import annotations
 
+import datetime
 import os
+from collections.abc import Iterable, Sequence
+from zoneinfo import ZoneInfo
 
-import httpx
+from ..config import Location, cfg
+from .cache_store import JsonCache
+from .http_client import SharedAsyncClient, traced_get
 
-from ..config import cfg
+# Raw Open-Meteo forecasts, keyed by grid cell and forecast hour.
+_cache = JsonCache("weather_cells")
 
 # WMO weather code → (Chinese description, emoji)
 _WMO_CODES: dict[int, tuple[str, str]] = {
@@ -50,23 +56,112 @@ def _wind_description(speed_kmh: float) -> str:
         return f"大风，风速{speed_kmh:.0f}公里/时"
 
 
-def fetch_weather() -> dict:
-    """Fetch current weather + 3-day forecast from Open-Meteo (°C)."""
+def fetch_weather(location: Location | None = None) -> dict:
+    """Fetch current weather + 3-day forecast from Open-Meteo (°C).
+
+    Defaults to the configured location.
+    """
+    return fetch_weather_many([location or cfg.weather_location])[0]
+
+
+async def fetch_weather_async(http: SharedAsyncClient, location: Location | None = None) -> dict:
+    """Async variant of :func:`fetch_weather` on the shared client."""
+    return (await fetch_weather_many_async(http, [location or cfg.weather_location]))[0]
+
+
+def fetch_weather_many(locations: Sequence[Location]) -> list[dict]:
+    """Fetch the weather section for every location in one Open-Meteo request.
+
+    Locations are snapped to ``weather.gridDegrees`` cells, and each
+    cell's forecast is cached for the current hour, so nearby
+    recipients — and reruns within the hour — share one lookup.
+
+    Returns:
+        One weather dict per location, in order.
+    """
+    cells = [_cell(loc) for loc in locations]
+    forecasts = _cached_forecasts(cells)
+    missing = list(dict.fromkeys(c for c in cells if c not in forecasts))
+    if missing:
+        url, params = _forecast_request(missing)
+        resp = traced_get(url, params=params, timeout=10)
+        resp.raise_for_status()
+        forecasts.update(_store_forecasts(missing, resp.json()))
+    return [_build_weather(forecasts[cell], loc) for loc, cell in zip(locations, cells, strict=True)]
+
+
+async def fetch_weather_many_async(
+    http: SharedAsyncClient, locations: Sequence[Location]
+) -> list[dict]:
+    """Async variant of :func:`fetch_weather_many` on the shared client."""
+    cells = [_cell(loc) for loc in locations]
+    forecasts = _cached_forecasts(cells)
+    missing = list(dict.fromkeys(c for c in cells if c not in forecasts))
+    if missing:
+        url, params = _forecast_request(missing)
+        resp = await http.get(url, params=params, timeout=10)
+        resp.raise_for_status()
+        forecasts.update(_store_forecasts(missing, resp.json()))
+    return [_build_weather(forecasts[cell], loc) for loc, cell in zip(locations, cells, strict=True)]
+
+
+# ── internal helpers ──────────────────────────────────────────
+
+
+def _cell(location: Location) -> tuple[float, float]:
+    """Snap a location to the centre of its forecast grid cell."""
+    step = cfg.weather_grid_degrees
+    if step <= 0:
+        return location.latitude, location.longitude
+    return round(round(location.latitude / step) * step, 4), round(
+        round(location.longitude / step) * step, 4
+    )
+
+
+def _cell_key(cell: tuple[float, float]) -> str:
+    """Cache key: the cell plus the current forecast hour."""
+    hour = datetime.datetime.now(ZoneInfo(cfg.timezone)).strftime("%Y-%m-%dT%H")
+    return f"{cell[0]:.4f},{cell[1]:.4f}@{hour}"
+
+
+def _cached_forecasts(cells: Iterable[tuple[float, float]]) -> dict[tuple[float, float], dict]:
+    keys = {_cell_key(cell): cell for cell in cells}
+    return {keys[key]: data for key, (data, _) in _cache.get_many(keys).items()}
+
+
+def _store_forecasts(
+    cells: list[tuple[float, float]], data: dict | list[dict]
+) -> dict[tuple[float, float], dict]:
+    """Split a (possibly multi-location) response per cell and cache each part."""
+    # Open-Meteo answers a single coordinate with an object, several with a list.
+    parts = data if isinstance(data, list) else [data]
+    if len(parts) != len(cells):
+        raise ValueError(f"Open-Meteo returned {len(parts)} forecasts for {len(cells)} locations")
+    forecasts = dict(zip(cells, parts, strict=True))
+    _cache.set_many({_cell_key(cell): part for cell, part in forecasts.items()})
+    return forecasts
+
+
+def _forecast_request(
+    cells: list[tuple[float, float]],
+) -> tuple[str, dict[str, str | int | float]]:
+    """Return the Open-Meteo forecast URL and query parameters for *cells*."""
     base = os.environ.get("WEATHER_API_BASE", "https://api.open-meteo.com")
     url = f"{base}/v1/forecast"
     params: dict[str, str | int | float] = {
-        "latitude": cfg.weather_lat,
-        "longitude": cfg.weather_lon,
+        # Comma-separated lists fetch several locations in one request.
+        "latitude": ",".join(str(lat) for lat, _ in cells),
+        "longitude": ",".join(str(lon) for _, lon in cells),
         "current": "temperature_2m,weather_code,wind_speed_10m",
         "daily": "temperature_2m_max,temperature_2m_min,weather_code",
         "timezone": cfg.timezone,
         "forecast_days": 4,  # today + 3 days
     }
+    return url, params
 
-    resp = httpx.get(url, params=params, timeout=10)
-    resp.raise_for_status()
-    data = resp.json()
 
+def _build_weather(data: dict, location: Location) -> dict:
+    """Turn an Open-Meteo forecast response into the weather section dict."""
     current = data["current"]
     daily = data["daily"]
 
@@ -86,7 +181,6 @@ def fetch_weather() -> dict:
 
     # Build 3-day forecast (days 1, 2, 3)
     forecast_days = []
-    import datetime
     today = datetime.date.today()
     weekday_names = ["周一", "周二", "周三", "周四", "周五", "周六", "周日"]
     for i in range(1, 4):
@@ -104,7 +198,7 @@ def fetch_weather() -> dict:
         })
 
     return {
-        "location": cfg.weather_location_name,
+        "location": location.name,
         "condition": condition,
         "icon": icon,
         "temp_current": temp_current,
@@ -0,0 +1,85 @@
+"""
+Unit tests for merged arXiv queries (no network — searches are faked).
+
+Usage:
+  uv run pytest tests/test_arxiv_queries.py
+"""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+
+from src.services import arxiv_service
+
+
+def _result(n: int, title: str, categories: list[str], summary: str = "") -> SimpleNamespace:
+    return SimpleNamespace(
+        entry_id=f"http://arxiv.org/abs/2601.{n:05d}",
+        title=title,
+        summary=summary or f"Abstract of {title}.",
+        categories=categories,
+        authors=[SimpleNamespace(name="A. Author")],
+    )
+
+
+@pytest.mark.parametrize(
+    ("query", "terms"),
+    [
+        ("cat:cs.CL", [("cat", "cs.CL")]),
+        (
+            'cat:cs.LG AND abs:"large language model"',
+            [("cat", "cs.LG"), ("abs", "large language model")],
+        ),
+        ("ti:diffusion  AND  all:video", [("ti", "diffusion"), ("all", "video")]),
+        ("cat:cs.CL OR cat:cs.LG", []),
+        ("cat:cs.CL ANDNOT ti:survey", []),
+        ("(cat:cs.CL AND ti:agents)", []),
+        ("au:hinton", []),
+    ],
+)
+def test_parse_terms(query: str, terms: list[tuple[str, str]]) -> None:
+    assert arxiv_service._parse_terms(query) == terms
+
+
+def test_matches_checks_every_term() -> None:
+    result = _result(1, "Scaling Laws for Agents", ["cs.LG", "cs.AI"], "We train large models.")
+
+    assert arxiv_service._matches(result, [("cat", "cs.AI"), ("ti", "scaling")])
+    assert arxiv_service._matches(result, [("abs", "LARGE MODEL")])
+    assert arxiv_service._matches(result, [("all", "agents")])  # title or abstract
+    assert not arxiv_service._matches(result, [("cat", "cs.CL")])
+    assert not arxiv_service._matches(result, [("ti", "large")])  # abstract only
+    assert not arxiv_service._matches(result, [("all", "caling")])  # word start only
+
+
+def test_merged_search_is_split_back_out_by_label(monkeypatch: pytest.MonkeyPatch) -> None:
+    queries = [
+        {"label": "NLP", "query": "cat:cs.CL", "maxResults": 2},
+        {"label": "Vision", "query": "cat:cs.CV AND ti:diffusion", "maxResults": 1},
+    ]
+    found = [
+        _result(1, "Parsing with LLMs", ["cs.CL"]),
+        _result(2, "Diffusion captions", ["cs.CV", "cs.CL"]),  # both: first label wins
+        _result(3, "Video diffusion", ["cs.CV"]),
+        _result(4, "Another parser", ["cs.CL"]),  # NLP quota already used
+        _result(5, "Segmenting cells", ["cs.CV"]),  # matches neither
+    ]
+    searches: list[tuple[str, int]] = []
+
+    def search(query: str, max_results: int, label: str) -> list[SimpleNamespace]:
+        searches.append((query, max_results))
+        return found
+
+    monkeypatch.setattr(arxiv_service, "_search_with_backoff", search)
+
+    papers = arxiv_service._fetch_merged(queries, multiplier=1)
+
+    merged = "(cat:cs.CL) OR (cat:cs.CV AND ti:diffusion)"
+    assert searches == [(merged, 3 * arxiv_service._MERGE_HEADROOM)]
+    assert [(p["category"], p["title"]) for p in papers] == [
+        ("NLP", "Parsing with LLMs"),
+        ("NLP", "Diffusion captions"),
+        ("Vision", "Video diffusion"),
+    ]
@@ -0,0 +1,119 @@
+"""
+Unit tests for chunked arXiv summarisation (no network — Gemini is faked).
+
+Usage:
+  uv run pytest tests/test_arxiv_summaries.py
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import re
+import threading
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+from src.config import cfg
+from src.services import arxiv_service, gemini_client
+from src.services.cache_store import JsonCache
+
+
+def _paper(i: int) -> dict:
+    return {
+        "title": f"Paper {i}",
+        "title_cn": "",
+        "summary": "",
+        "_abstract": "We study scaling. " * 30,
+        "url": f"http://arxiv.org/abs/2601.0000{i}",
+        "category": "LLM",
+    }
+
+
+def test_papers_are_chunked_and_only_missing_ones_are_resent(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    prompts: list[str] = []
+    lock = threading.Lock()
+
+    def generate_records(
+        client: object, prompt: str, schema: dict, *, on_record: Callable[[dict], None]
+    ) -> gemini_client.Reply:
+        with lock:
+            prompts.append(prompt)
+            first_try = len(prompts) <= 3
+        records = []
+        for index, title in re.findall(r"\[(\d+)\] 标题：(.+)", prompt):
+            if title == "Paper 3" and first_try:
+                break  # the reply is cut short before this paper
+            records.append({"index": int(index), "title_cn": f"{title} 中文", "summary": "摘要"})
+            on_record(records[-1])
+        return gemini_client.Reply(records, cfg.gemini_model)
+
+    monkeypatch.setattr(arxiv_service, "cfg", dataclasses.replace(cfg, arxiv_summary_chunk_tokens=700))
+    monkeypatch.setattr(arxiv_service, "_summary_cache", JsonCache("arxiv_summaries", tmp_path / "c.db"))
+    monkeypatch.setattr(gemini_client, "generate_records", generate_records)
+
+    papers = arxiv_service._summarize_batch_gemini([_paper(i) for i in range(5)], client=object())
+
+    assert len(prompts) == 4  # three chunks, then Paper 3 alone
+    assert re.findall(r"标题：(Paper \d)", prompts[-1]) == ["Paper 3"]
+    assert [p["title_cn"] for p in papers] == [f"Paper {i} 中文" for i in range(5)]
+    assert all(p["summary"] for p in papers)
+    keys = [arxiv_service._summary_key(p, cfg.gemini_model) for p in papers]
+    assert len(arxiv_service._summary_cache.get_many(keys)) == 5
+
+
+def _answer_as(model: str, calls: list[str]) -> Callable[..., gemini_client.Reply]:
+    """A fake ``generate_records`` that summarises every paper as *model*."""
+
+    def generate_records(
+        client: object, prompt: str, schema: dict, *, on_record: Callable[[dict], None]
+    ) -> gemini_client.Reply:
+        calls.append(prompt)
+        records = [
+            {"index": int(index), "title_cn": f"{title} {model}", "summary": "摘要"}
+            for index, title in re.findall(r"\[(\d+)\] 标题：(.+)", prompt)
+        ]
+        for record in records:
+            on_record(record)
+        return gemini_client.Reply(records, model)
+
+    return generate_records
+
+
+def test_fallback_model_summaries_are_cached_under_that_model(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    fallback = gemini_client.model_chain()[-1]
+    calls: list[str] = []
+    monkeypatch.setattr(arxiv_service, "_summary_cache", JsonCache("arxiv_summaries", tmp_path / "c.db"))
+    monkeypatch.setattr(gemini_client, "generate_records", _answer_as(fallback, calls))
+
+    arxiv_service._summarize_batch_gemini([_paper(0)], client=object())
+
+    cache = arxiv_service._summary_cache
+    assert cache.get(arxiv_service._summary_key(_paper(0), cfg.gemini_model)) is None
+    assert cache.get(arxiv_service._summary_key(_paper(0), fallback)) is not None
+
+    # The next run reuses it without calling Gemini.
+    again = arxiv_service._summarize_batch_gemini([_paper(0)], client=object())
+    assert len(calls) == 1
+    assert again[0]["title_cn"] == f"Paper 0 {fallback}"
+
+
+def test_cached_summary_by_the_configured_model_wins_over_a_fallback_one(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    cache = JsonCache("arxiv_summaries", tmp_path / "c.db")
+    for model in gemini_client.model_chain():
+        cache.set(arxiv_service._summary_key(_paper(0), model), {"title_cn": model, "summary": "摘要"})
+    calls: list[str] = []
+    monkeypatch.setattr(arxiv_service, "_summary_cache", cache)
+    monkeypatch.setattr(gemini_client, "generate_records", _answer_as("unused", calls))
+
+    papers = arxiv_service._summarize_batch_gemini([_paper(0)], client=object())
+
+    assert not calls
+    assert papers[0]["title_cn"] == cfg.gemini_model
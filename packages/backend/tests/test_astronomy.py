@@ -0,0 +1,37 @@
+"""
+Unit tests for the precomputed sun tables.
+
+Usage:
+  uv run pytest tests/test_astronomy.py
+"""
+
+from __future__ import annotations
+
+import datetime
+from zoneinfo import ZoneInfo
+
+from astral import Observer
+from astral.sun import sun
+
+from src.services import astronomy_service as astro
+
+_TZ = "America/Los_Angeles"
+
+
+def test_table_matches_the_solver() -> None:
+    table = astro._compute_table(37.3688, -122.0363, _TZ, 2026)
+    assert len(table) == 2 * astro._DAYS
+    assert table[365] == table[astro._DAYS + 365] == astro._NO_EVENT  # no Dec 32nd
+
+    # Includes both DST switch days.
+    for day in (datetime.date(2026, 1, 1), datetime.date(2026, 3, 8), datetime.date(2026, 11, 1)):
+        expected = sun(Observer(37.3688, -122.0363), date=day, tzinfo=ZoneInfo(_TZ))
+        index = day.timetuple().tm_yday - 1
+        assert astro._clock(table[index]) == expected["sunrise"].strftime("%H:%M")
+        assert astro._clock(table[astro._DAYS + index]) == expected["sunset"].strftime("%H:%M")
+
+
+def test_polar_night_has_no_events() -> None:
+    table = astro._compute_table(78.2, 15.6, "Europe/Oslo", 2026)
+    winter_solstice = datetime.date(2026, 12, 21).timetuple().tm_yday - 1
+    assert table[winter_solstice] == astro._NO_EVENT
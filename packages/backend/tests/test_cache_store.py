@@ -0,0 +1,50 @@
+"""
+Unit tests for the persistent JSON cache store.
+
+Usage:
+  uv run pytest tests/test_cache_store.py
+"""
+
+from __future__ import annotations
+
+import time
+from pathlib import Path
+
+from src.services.cache_store import JsonCache
+
+
+def test_roundtrip_and_timestamp(tmp_path: Path) -> None:
+    """Stored values come back unchanged with a recent timestamp."""
+    cache = JsonCache("items", tmp_path / "cache.sqlite3")
+    before = time.time()
+    cache.set("42", {"title": "你好", "score": 7})
+
+    hit = cache.get("42")
+    assert hit is not None
+    value, stored_at = hit
+    assert value == {"title": "你好", "score": 7}
+    assert stored_at >= before
+    assert cache.get("missing") is None
+
+
+def test_get_many_and_namespaces(tmp_path: Path) -> None:
+    """Bulk reads return only hits, and namespaces do not collide."""
+    path = tmp_path / "cache.sqlite3"
+    a = JsonCache("alpha", path)
+    b = JsonCache("beta", path)
+    a.set_many({str(i): i for i in range(1200)})
+    b.set("1", "other")
+
+    found = a.get_many(["1", "2", "1199", "nope"])
+    assert {k: v for k, (v, _) in found.items()} == {"1": 1, "2": 2, "1199": 1199}
+    assert b.get_many(["1"])["1"][0] == "other"
+    assert b.get("2") is None
+
+
+def test_unwritable_path_is_a_miss(tmp_path: Path) -> None:
+    """A cache that cannot be opened degrades to misses instead of raising."""
+    blocker = tmp_path / "file"
+    blocker.write_text("x")
+    cache = JsonCache("items", blocker / "cache.sqlite3")
+    cache.set("k", 1)
+    assert cache.get("k") is None
@@ -0,0 +1,80 @@
+"""
+Unit tests for multi-recipient fan-out profiles.
+
+Usage:
+  uv run pytest tests/test_fanout.py
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from src.config import Location, cfg
+from src.fanout import SECTION_NAMES, load_profiles, sections_for
+
+_NYC = {"latitude": 40.7128, "longitude": -74.006, "location": "New York, NY"}
+
+
+def test_profiles_inherit_top_level_settings() -> None:
+    ziyi, alex = load_profiles([
+        {"name": "Ziyi", "email": "you@example.com"},
+        {
+            "name": "Alex",
+            "email": "Alex.Smith@example.com",
+            "sections": ["weather", "stocks"],
+            "weather": _NYC,
+            "stocks": {"symbols": ["AAPL"]},
+        },
+    ])
+
+    assert ziyi.sections == frozenset(SECTION_NAMES) - {"todo_tasks"}
+    assert ziyi.location == cfg.weather_location
+    assert ziyi.stock_symbols == tuple(cfg.stock_symbols)
+    assert alex.sections == {"weather", "stocks"}
+    assert alex.location == Location(40.7128, -74.006, "New York, NY")
+    assert alex.stock_symbols == ("AAPL",)
+    assert alex.slug == "alex-smith-example-com"
+
+
+def test_without_recipients_the_configured_one_gets_every_section() -> None:
+    (profile,) = load_profiles([])
+
+    assert profile.email == cfg.recipient_email
+    assert profile.sections == frozenset(SECTION_NAMES)
+
+
+def test_unknown_section_is_rejected() -> None:
+    with pytest.raises(ValueError, match="weather_radar"):
+        load_profiles([{"email": "a@example.com", "sections": ["weather_radar"]}])
+
+
+@pytest.mark.parametrize("second", ["a.b@example.com", "A-B@Example.com"])
+def test_profiles_that_would_share_an_output_file_are_rejected(second: str) -> None:
+    with pytest.raises(ValueError, match="a-b-example-com.json"):
+        load_profiles([{"email": "a.b@example.com"}, {"email": second}])
+
+
+def test_sections_are_cut_from_the_shared_results() -> None:
+    (alex,) = load_profiles([{
+        "email": "alex@example.com",
+        "sections": ["weather", "stocks", "hn", "news"],
+        "weather": _NYC,
+        "stocks": {"symbols": ["MSFT", "AAPL", "NVDA"]},
+    }])
+    shared = {
+        "weather@all": {"40.7128,-74.0060": {"city": "NYC"}, "37.3700,-122.0400": {"city": "SV"}},
+        "astronomy@40.7128,-74.0060": {"sunrise": "07:00"},
+        "stocks": [{"symbol": "AAPL"}, {"symbol": "MSFT"}, {"symbol": "GOOG"}],
+        "hn": [{"title": "story"}],
+        "arxiv": [{"title": "paper"}],
+    }
+
+    sections = sections_for(alex, shared)
+
+    assert sections == {
+        "weather": {"city": "NYC"},
+        "astronomy": {"sunrise": "07:00"},
+        "stocks": [{"symbol": "MSFT"}, {"symbol": "AAPL"}],  # the profile's order
+        "hn": [{"title": "story"}],
+        "news": [],  # missing from the shared results
+    }
@@ -0,0 +1,82 @@
+"""
+Unit tests for conditional-GET feed caching, against the fake server (no network).
+
+Usage:
+  uv run pytest tests/test_feed_cache.py
+"""
+
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import threading
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+import httpx
+import pytest
+
+from src.services import feed_cache
+from src.services.cache_store import JsonCache
+from src.services.http_client import SharedAsyncClient
+
+_SERVER = Path(__file__).resolve().parents[3] / "tests" / "fake-server" / "server.py"
+
+
+@pytest.fixture(scope="module")
+def fake_server() -> Iterator[str]:
+    """Serve the fake-server fixtures on a free local port; yield its base URL."""
+    spec = importlib.util.spec_from_file_location("fake_server", _SERVER)
+    assert spec is not None and spec.loader is not None
+    server_mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(server_mod)
+
+    server = server_mod.ThreadingHTTPServer(("127.0.0.1", 0), server_mod.FakeHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.mark.parametrize("engine", ["threads", "async"])
+def test_second_fetch_is_a_304_that_reuses_the_cached_entries(
+    engine: str,
+    fake_server: str,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(feed_cache, "_cache", JsonCache("feeds", tmp_path / "feeds.db"))
+    parses: list[bytes] = []
+    real_parse = feed_cache.feedparser.parse
+
+    def parse(content: bytes, **kwargs: Any) -> Any:
+        parses.append(content)
+        return real_parse(content, **kwargs)
+
+    monkeypatch.setattr(feed_cache.feedparser, "parse", parse)
+    statuses: list[int] = []
+    real_handle = feed_cache._handle_response
+
+    def handle(url: str, resp: httpx.Response, cached: dict | None) -> dict:
+        statuses.append(resp.status_code)
+        return real_handle(url, resp, cached)
+
+    monkeypatch.setattr(feed_cache, "_handle_response", handle)
+    url = f"{fake_server}/rss/feed"
+
+    if engine == "async":
+
+        async def fetch_twice() -> list[dict]:
+            async with SharedAsyncClient() as http:
+                return [await feed_cache.fetch_feed_async(http, url) for _ in range(2)]
+
+        first, second = asyncio.run(fetch_twice())
+    else:
+        first, second = feed_cache.fetch_feed(url), feed_cache.fetch_feed(url)
+
+    assert statuses == [200, 304]
+    assert first["entries"]
+    assert second == first
+    assert len(parses) == 1  # the 304 reply is not reparsed
@@ -0,0 +1,125 @@
+"""
+Unit tests for streamed, schema-constrained Gemini replies (no network).
+
+Usage:
+  uv run pytest tests/test_gemini_stream.py
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import threading
+from collections.abc import Iterator
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from src.config import cfg
+from src.services import gemini_client
+from src.services.rate_limit import TokenBucket
+
+
+class _FakeModels:
+    """Streams *chunks* of reply text, then raises if *fail* is set or stalls on *stall*."""
+
+    def __init__(
+        self, chunks: list[str], fail: bool = False, stall: threading.Event | None = None
+    ) -> None:
+        self.chunks = chunks
+        self.fail = fail
+        self.stall = stall
+        self.calls = 0
+
+    def generate_content_stream(self, **kwargs: Any) -> Iterator[SimpleNamespace]:
+        self.calls += 1
+        assert kwargs["config"]["response_schema"]["type"] == "ARRAY"
+        for text in self.chunks:
+            yield SimpleNamespace(text=text)
+        if self.stall is not None:
+            self.stall.wait(5)
+        if self.fail:
+            raise ConnectionError("stream reset")
+
+
+@pytest.fixture(autouse=True)
+def _no_pacing(monkeypatch: pytest.MonkeyPatch) -> list[float]:
+    sleeps: list[float] = []
+    monkeypatch.setattr(gemini_client, "_limiter", TokenBucket(rate=1000, capacity=10))
+    monkeypatch.setattr(gemini_client.time, "sleep", sleeps.append)
+    return sleeps
+
+
+def test_records_are_parsed_as_they_arrive_and_kept_when_the_stream_breaks() -> None:
+    models = _FakeModels(
+        ['```json\n[{"index": 0, "title": "a {b}"}', ', {"ind', 'ex": 1, "nested": {"x": [1]}}', ', {"index": 2'],
+        fail=True,
+    )
+    seen: list[dict[str, Any]] = []
+
+    reply = gemini_client.generate_records(
+        SimpleNamespace(models=models), "prompt", {"type": "OBJECT"}, on_record=seen.append
+    )
+
+    assert reply is not None
+    assert reply.model == cfg.gemini_model
+    assert reply.records == seen == [
+        {"index": 0, "title": "a {b}"},
+        {"index": 1, "nested": {"x": [1]}},
+    ]
+    assert models.calls == 1  # partial success — not retried
+
+
+def test_empty_reply_is_logged_and_retried_with_backoff(
+    _no_pacing: list[float], capsys: pytest.CaptureFixture[str]
+) -> None:
+    models = _FakeModels(["[]"])
+
+    records = gemini_client.generate_records(
+        SimpleNamespace(models=models), "prompt", {"type": "OBJECT"}, models=["m"]
+    )
+
+    assert records is None
+    assert models.calls == 3
+    assert _no_pacing == [1.0, 2.0]
+    assert capsys.readouterr().out.count("no records in reply") == 3
+
+
+def test_reply_names_the_fallback_model_that_answered(_no_pacing: list[float]) -> None:
+    replies = {"first": _FakeModels(["[]"]), "second": _FakeModels(['[{"index": 0}]'])}
+    models = SimpleNamespace(
+        generate_content_stream=lambda **kw: replies[kw["model"]].generate_content_stream(**kw)
+    )
+
+    reply = gemini_client.generate_records(
+        SimpleNamespace(models=models), "p", {"type": "OBJECT"}, models=["first", "second"]
+    )
+
+    assert reply == gemini_client.Reply([{"index": 0}], "second")
+    assert replies["first"].calls == 3
+
+
+def test_stalled_stream_is_cut_off_and_keeps_its_records(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(gemini_client, "cfg", dataclasses.replace(cfg, gemini_stream_timeout=0.2))
+    stall = threading.Event()
+    models = _FakeModels(['[{"index": 0}, {"ind'], stall=stall)
+
+    reply = gemini_client.generate_records(SimpleNamespace(models=models), "p", {"type": "OBJECT"})
+    stall.set()
+
+    assert reply is not None
+    assert reply.records == [{"index": 0}]
+    assert models.calls == 1
+
+
+def test_errors_from_on_record_are_not_treated_as_stream_failures() -> None:
+    models = _FakeModels(['[{"index": 0}]'])
+
+    def on_record(record: dict[str, Any]) -> None:
+        raise KeyError("caller bug")
+
+    with pytest.raises(KeyError):
+        gemini_client.generate_records(
+            SimpleNamespace(models=models), "p", {"type": "OBJECT"}, on_record=on_record
+        )
+    assert models.calls == 1
@@ -0,0 +1,86 @@
+"""
+Unit tests for the GitHub trending page parser.
+
+Usage:
+  uv run pytest tests/test_github_trending.py
+"""
+
+from __future__ import annotations
+
+import re
+
+from src.services.github_trending_service import _parse_trending_page, _parse_with_soup
+
+# Trimmed from a real trending page: icons, nested spans and entities included.
+_ARTICLE = """
+<article class="Box-row">
+  <div class="float-right d-flex"><a href="/login?return_to=%2Fowner%2Frepo{i}"
+    class="btn-sm btn BtnGroup-item"><svg height="16"><path d="M8 .25a"></path></svg> Star</a></div>
+  <h2 class="h3 lh-condensed">
+    <a data-hydro-click="{{&quot;event_type&quot;:&quot;x&quot;}}" href="/owner/repo{i}" class="Link">
+      <svg class="octicon"><path d="M2 2.5A2.5"></path></svg>
+      <span data-view-component="true" class="text-normal">
+        owner /
+</span>
+      repo{i}
+</a>  </h2>
+    <p class="col-9 color-fg-muted my-1 pr-4">
+      Fast &amp; small <g-emoji class="g-emoji" alias="rocket">🚀</g-emoji> thing
+    </p>
+  <div class="f6 color-fg-muted mt-2">
+      <a href="/owner/repo{i}/stargazers" class="Link Link--muted d-inline-block mr-3">
+        <svg aria-label="star" class="octicon"><path d="M8 .25"></path></svg>
+        12,345
+</a>
+      <a href="/owner/repo{i}/forks" class="Link Link--muted d-inline-block mr-3"><svg></svg> 678</a>
+      <span class="d-inline-block float-sm-right">
+        <svg class="octicon"><path d="M8 .25"></path></svg>
+        1,234 stars today
+      </span>
+  </div>
+</article>
+"""
+
+_PAGE = "<html><body>" + "".join(_ARTICLE.format(i=i) for i in range(5)) + "</body></html>"
+
+
+def test_fast_parser_extracts_fields() -> None:
+    repo = _parse_trending_page(_PAGE, "python")[0]
+    assert repo["name"] == "owner/repo0"
+    assert repo["url"] == "https://github.com/owner/repo0"
+    assert repo["description"] == "Fast & small 🚀 thing"
+    assert repo["stars"] == 12345
+    assert repo["today_stars"] == 1234
+    assert repo["language"] == "Python"
+
+
+def test_fast_parser_stops_at_limit_and_matches_soup() -> None:
+    fast = _parse_trending_page(_PAGE, "go", limit=3)
+    assert [r["name"] for r in fast] == ["owner/repo0", "owner/repo1", "owner/repo2"]
+
+    slow = _parse_with_soup(_PAGE, "go")[:3]
+    assert [(r["name"], r["stars"], r["today_stars"]) for r in fast] == [
+        (r["name"], r["stars"], r["today_stars"]) for r in slow
+    ]
+
+
+def test_missing_star_markup_leaves_the_rest_of_the_repo() -> None:
+    page = _PAGE.replace("/stargazers", "/watchers").replace("Link--muted", "Link--secondary")
+
+    repos = _parse_trending_page(page, "python")
+
+    assert [r["name"] for r in repos] == [f"owner/repo{i}" for i in range(5)]
+    assert {r["stars"] for r in repos} == {0}
+    assert repos[0]["today_stars"] == 1234
+
+
+def test_soup_is_used_when_no_repo_has_stars() -> None:
+    # Single-quoted hrefs slip past the fast parser's star extractor.
+    page = re.sub(r'href="(/owner/repo\d+/stargazers)"', r"href='\1'", _PAGE)
+
+    repos = _parse_trending_page(page, "go", limit=2)
+
+    assert [(r["name"], r["stars"]) for r in repos] == [
+        ("owner/repo0", 12345),
+        ("owner/repo1", 12345),
+    ]
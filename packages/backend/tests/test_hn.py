@@ -0,0 +1,100 @@
+"""
+Unit tests for the Hacker News item cache (no network — item fetches are faked).
+
+Usage:
+  uv run pytest tests/test_hn.py
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from pathlib import Path
+
+import httpx
+import pytest
+
+from src.services import hn_service
+from src.services.cache_store import JsonCache
+from src.services.http_client import SharedAsyncClient
+
+
+@pytest.fixture(autouse=True)
+def _tmp_cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> JsonCache:
+    cache = JsonCache("hn_items", tmp_path / "cache.sqlite3")
+    monkeypatch.setattr(hn_service, "_item_cache", cache)
+    return cache
+
+
+def _item(sid: int, score: int) -> dict:
+    return {"id": sid, "title": f"Story {sid}", "score": score, "descendants": 3, "kids": [1, 2]}
+
+
+def _age(cache: JsonCache, sid: int, seconds: float) -> None:
+    with cache._connect() as conn:
+        conn.execute(
+            "UPDATE hn_items SET stored_at = ? WHERE key = ?", (time.time() - seconds, str(sid))
+        )
+
+
+def test_cached_items_are_split_by_the_score_ttl(_tmp_cache: JsonCache) -> None:
+    _tmp_cache.set_many({"1": _item(1, 10), "2": _item(2, 20)})
+    _age(_tmp_cache, 2, hn_service.cfg.hn_score_ttl + 60)
+
+    fresh, stale = hn_service._lookup_cached([1, 2, 3])
+
+    assert list(fresh) == [1]
+    assert list(stale) == [2]
+
+
+def test_only_stale_and_missing_items_are_fetched(
+    _tmp_cache: JsonCache, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _tmp_cache.set_many({"1": _item(1, 10), "2": _item(2, 20)})
+    _age(_tmp_cache, 2, hn_service.cfg.hn_score_ttl + 60)
+    requested: list[int] = []
+
+    def get_item(client: httpx.Client, sid: int) -> dict:
+        requested.append(sid)
+        return _item(sid, 100 + sid)
+
+    monkeypatch.setattr(hn_service, "_get_item", get_item)
+
+    items = hn_service.fetch_items([1, 2, 3])
+
+    assert sorted(requested) == [2, 3]
+    assert {sid: item["score"] for sid, item in items.items()} == {1: 10, 2: 102, 3: 103}
+    assert "kids" not in items[3]  # only the cached fields are kept
+    cached = _tmp_cache.get("2")
+    assert cached is not None and cached[0]["score"] == 102
+
+
+def test_failed_refetch_serves_the_stale_copy(
+    _tmp_cache: JsonCache, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _tmp_cache.set("2", _item(2, 20))
+    _age(_tmp_cache, 2, hn_service.cfg.hn_score_ttl + 60)
+    monkeypatch.setattr(hn_service, "_get_item", lambda client, sid: None)
+
+    items = hn_service.fetch_items([2, 3])
+
+    assert items == {2: _item(2, 20)}  # 3 has no copy to fall back to
+
+
+def test_async_fetch_serves_the_stale_copy_on_an_error(_tmp_cache: JsonCache) -> None:
+    _tmp_cache.set("2", _item(2, 20))
+    _age(_tmp_cache, 2, hn_service.cfg.hn_score_ttl + 60)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/2.json"):
+            return httpx.Response(503)
+        return httpx.Response(200, json=_item(4, 40))
+
+    async def fetch() -> dict[int, dict]:
+        async with SharedAsyncClient(transport=httpx.MockTransport(handler)) as http:
+            return await hn_service.fetch_items_async(http, [2, 4])
+
+    items = asyncio.run(fetch())
+
+    assert items[2] == _item(2, 20)
+    assert items[4]["score"] == 40
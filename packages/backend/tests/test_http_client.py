@@ -0,0 +1,78 @@
+"""
+Unit tests for the shared async HTTP client and the asyncio fetch engine (no network).
+
+Usage:
+  uv run pytest tests/test_http_client.py
+"""
+
+from __future__ import annotations
+
+import asyncio
+import dataclasses
+import functools
+import time
+from collections import Counter
+
+import httpx
+import pytest
+
+from src import pipeline, services
+from src.config import cfg
+from src.services import todo_service
+from src.services.http_client import USER_AGENT, SharedAsyncClient
+from src.services.section_cache import SectionCache
+
+
+def test_each_host_is_limited_to_its_own_slots() -> None:
+    in_flight: Counter[str] = Counter()
+    peak: Counter[str] = Counter()
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        host = request.url.host
+        in_flight[host] += 1
+        peak[host] = max(peak[host], in_flight[host])
+        await asyncio.sleep(0.02)
+        in_flight[host] -= 1
+        return httpx.Response(200, json={"host": host})
+
+    async def fetch_all() -> list[httpx.Response]:
+        client = SharedAsyncClient(max_per_host=2, transport=httpx.MockTransport(handler))
+        async with client as http:
+            urls = [f"https://{host}.example/{i}" for host in ("a", "b") for i in range(6)]
+            return await asyncio.gather(*(http.get(url) for url in urls))
+
+    responses = asyncio.run(fetch_all())
+
+    assert [r.json()["host"] for r in responses] == ["a.example"] * 6 + ["b.example"] * 6
+    assert peak == {"a.example": 2, "b.example": 2}
+
+
+def test_async_engine_runs_coroutines_on_the_shared_client(monkeypatch: pytest.MonkeyPatch) -> None:
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json={"tasks": [{"title": "Write tests", "reason": "r"}]})
+
+    monkeypatch.setattr(
+        services,
+        "SharedAsyncClient",
+        functools.partial(SharedAsyncClient, transport=httpx.MockTransport(handler)),
+    )
+    monkeypatch.setattr(
+        todo_service, "cfg", dataclasses.replace(cfg, todo_api_user="u", todo_api_password="p")
+    )
+    tasks = {"todo_tasks": lambda: pytest.fail("should run as a coroutine"), "bridged": lambda: "ok"}
+    sections: dict[str, object] = {}
+    run = pipeline._Run(tasks, {}, sections, SectionCache({}), time.monotonic())
+
+    asyncio.run(pipeline._fetch_async(tasks, run))
+
+    assert sections == {
+        "todo_tasks": [{"rank": 1, "title": "Write tests", "reason": "r"}],
+        "bridged": "ok",
+    }
+    (request,) = requests
+    assert request.url.path == "/api/recommendation"
+    assert request.headers["User-Agent"] == USER_AGENT
+    assert request.headers["Authorization"].startswith("Basic ")
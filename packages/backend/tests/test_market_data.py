@@ -0,0 +1,72 @@
+"""
+Unit tests for batched market quotes (no network — downloads are faked).
+
+Usage:
+  uv run pytest tests/test_market_data.py
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import math
+
+import pandas as pd
+import pytest
+
+from src.config import cfg
+from src.services import exchange_rate_service, market_data, stocks_service
+from src.services.market_data import Quote
+
+
+def _frame(closes: dict[str, list[float]]) -> pd.DataFrame:
+    """Daily bars shaped like ``yf.download(..., group_by="ticker")``."""
+    days = pd.date_range("2026-01-05", periods=3, freq="D")
+    columns = pd.MultiIndex.from_product([list(closes), ["Open", "Close"]])
+    frame = pd.DataFrame(index=days, columns=columns, dtype=float)
+    for symbol, values in closes.items():
+        frame[(symbol, "Close")] = values
+        frame[(symbol, "Open")] = values
+    return frame
+
+
+def test_quote_is_the_last_close_against_the_one_before() -> None:
+    frame = _frame({
+        "AAPL": [180.0, 182.5, math.nan],  # today's bar not in yet
+        "USDCNY=X": [7.1, 7.2, 7.25],
+        "NEW": [math.nan, math.nan, 12.0],  # first day of trading
+        "GONE": [math.nan] * 3,
+    })
+
+    assert market_data._quote_from_frame(frame, "AAPL") == Quote(182.5, 180.0)
+    assert market_data._quote_from_frame(frame, "USDCNY=X") == Quote(7.25, 7.2)
+    assert market_data._quote_from_frame(frame, "NEW") == Quote(12.0, None)
+    assert market_data._quote_from_frame(frame, "GONE") is None
+    assert market_data._quote_from_frame(frame, "MISSING") is None
+
+
+def test_stocks_and_exchange_rates_share_one_download(monkeypatch: pytest.MonkeyPatch) -> None:
+    profile = dataclasses.replace(
+        cfg, stock_symbols=["AAPL", "MSFT"], exchange_rate_pairs=["USD/CNY"]
+    )
+    for module in (market_data, stocks_service, exchange_rate_service):
+        monkeypatch.setattr(module, "cfg", profile)
+    monkeypatch.setattr(market_data, "_quotes", {})
+    downloads: list[list[str]] = []
+
+    def download(symbols: list[str]) -> dict[str, Quote]:
+        downloads.append(symbols)
+        return {s: Quote(100.0 + i, 99.0) for i, s in enumerate(symbols)}
+
+    monkeypatch.setattr(market_data, "_download", download)
+
+    stocks = stocks_service.fetch_stocks()
+    rates = exchange_rate_service.fetch_exchange_rates()
+
+    assert downloads == [["AAPL", "MSFT", "USDCNY=X"]]
+    assert [s["symbol"] for s in stocks] == ["AAPL", "MSFT"]
+    assert len(rates) == 1
+
+    # Past the TTL, the next caller downloads again.
+    market_data._quotes["MSFT"] = (market_data._quotes["MSFT"][0], -market_data._QUOTE_TTL)
+    market_data.get_quotes(["AAPL"])
+    assert downloads[1:] == [["MSFT"]]
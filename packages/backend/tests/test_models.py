@@ -0,0 +1,60 @@
+"""
+Unit tests for the typed payload models and the JSON encoder.
+
+Usage:
+  uv run pytest tests/test_models.py
+"""
+
+from __future__ import annotations
+
+import json
+
+from src import models
+
+_SECTIONS = {
+    "weather": {
+        "location": "Sunnyvale",
+        "condition": "晴",
+        "icon": "☀️",
+        "temp_current": 20,
+        "temp_high": 24,
+        "temp_low": 12,
+        "summary": "…",
+        "forecasts": [{"label": "周一", "icon": "☀️", "condition": "晴", "high": 25, "low": 13}],
+    },
+    "astronomy": {
+        "sunrise": "07:10", "sunset": "18:20", "day_length": "11h", "golden_hour": "17:40",
+        "note": "",
+    },
+    "hn": [
+        {"title": "T", "title_cn": "标题", "url": "u", "points": 1, "comment_count": 2,
+         "hn_url": "h"},
+    ],
+    "arxiv": [
+        {"title": "P", "title_cn": "", "summary": "s", "_abstract": "internal",
+         "authors": "A", "url": "u", "category": "LLM"},
+    ],
+}
+
+
+def test_payload_uses_camel_case_and_drops_internal_keys() -> None:
+    payload = json.loads(models.encode(models.build_newsletter(_SECTIONS, "d", "Ziyi")))
+
+    assert payload["recipientName"] == "Ziyi"
+    assert payload["weather"]["tempCurrent"] == 20
+    assert payload["weather"]["forecasts"][0]["high"] == 25
+    assert payload["weather"]["goldenHour"] == "17:40"
+    assert payload["hnStories"][0] == {
+        "title": "T", "titleCn": "标题", "url": "u", "points": 1, "commentCount": 2, "hnUrl": "h",
+    }
+    assert "Abstract" not in payload["arxivPapers"][0]
+    assert payload["topNews"] == [] and payload["todoTasks"] == []
+
+
+def test_failed_weather_and_missing_astronomy() -> None:
+    payload = json.loads(models.encode(models.build_newsletter({}, "d", "Ziyi")))
+    assert payload["weather"] == {}
+
+    weather_only = {"weather": _SECTIONS["weather"]}
+    payload = json.loads(models.encode(models.build_newsletter(weather_only, "d", "Ziyi")))
+    assert "sunrise" not in payload["weather"]
@@ -0,0 +1,79 @@
+"""
+Unit tests for near-duplicate news clustering.
+
+Usage:
+  uv run pytest tests/test_news_clusters.py
+"""
+
+from __future__ import annotations
+
+import json
+
+from src import models
+from src.services.news_clusters import cluster_stories
+
+
+def _story(source: str, headline: str, summary: str = "") -> dict:
+    return {
+        "headline": headline,
+        "summary": summary,
+        "source": source,
+        "url": f"https://{source.lower().replace(' ', '')}.example/{len(headline)}",
+        "category": "World",
+    }
+
+
+def test_same_event_from_several_feeds_becomes_one_story() -> None:
+    stories = [
+        _story("NPR", "Earthquake kills at least 100 in eastern Turkey"),
+        _story(
+            "New York Times",
+            "Israel and Hamas agree to ceasefire deal in Gaza",
+            "The agreement, brokered by Qatar and Egypt, would pause fighting and free hostages.",
+        ),
+        _story(
+            "BBC News",
+            "Turkey earthquake death toll rises to 100",
+            "A magnitude 7.1 earthquake struck eastern Turkey early on Monday.",
+        ),
+        _story(
+            "Al Jazeera",
+            "Gaza ceasefire: Israel and Hamas reach agreement",
+            "Hostages would be released under the deal brokered by Egypt and Qatar.",
+        ),
+        _story("The Guardian", "Trump meets Xi in Beijing for trade talks"),
+        _story("Reuters", "Trump meets Putin in Alaska"),
+    ]
+
+    merged = cluster_stories(stories, threshold=0.3)
+
+    assert [s["source"] for s in merged] == ["BBC News", "New York Times", "The Guardian", "Reuters"]
+    # The quake story keeps the BBC copy, which has a summary.
+    assert merged[0]["alternate_sources"] == [{"source": "NPR", "url": stories[0]["url"]}]
+    assert [a["source"] for a in merged[1]["alternate_sources"]] == ["Al Jazeera"]
+    assert "alternate_sources" not in merged[2]
+
+
+def test_stories_from_one_feed_only_merge_on_identical_headlines() -> None:
+    stories = [
+        _story("Test News Feed", "Test headline for integration testing", "A test summary."),
+        _story("Test News Feed", "Another test headline", "Another test summary."),
+        _story("Test News Feed", "another test headline", "Repeated."),
+    ]
+
+    assert [s["headline"] for s in cluster_stories(stories, threshold=0.3)] == [
+        "Test headline for integration testing",
+        "Another test headline",
+    ]
+
+
+def test_alternate_sources_reach_the_payload() -> None:
+    story = cluster_stories(
+        [_story("NPR", "Same headline", "a"), _story("BBC News", "same headline", "b")], 0.3
+    )
+    payload = json.loads(models.encode(models.build_newsletter({"news": story}, "d", "Ziyi")))
+
+    assert payload["topNews"][0]["source"] == "NPR"
+    assert payload["topNews"][0]["alternateSources"] == [
+        {"source": "BBC News", "url": story[0]["alternate_sources"][0]["url"]}
+    ]
@@ -0,0 +1,104 @@
+"""
+Unit tests for the section → stage fetch pipeline.
+
+Usage:
+  uv run pytest tests/test_pipeline.py
+"""
+
+from __future__ import annotations
+
+import asyncio
+import dataclasses
+import threading
+import time
+from functools import partial
+from typing import Any
+
+import pytest
+
+from src import pipeline, services
+from src.config import cfg
+from src.services import tracing
+from src.services.section_cache import SectionCache
+
+
+def _upper(inputs: dict[str, Any]) -> dict[str, Any]:
+    return {key: value.upper() for key, value in inputs.items()}
+
+
+def _fail(inputs: dict[str, Any]) -> dict[str, Any]:
+    raise RuntimeError("stage failed")
+
+
+def _run(engine: str, tasks: dict[str, Any], stages: dict[str, pipeline.Stage]) -> dict[str, Any]:
+    sections: dict[str, Any] = {}
+    run = pipeline._Run(tasks, stages, sections, SectionCache({}), time.monotonic())
+    if engine == "async":
+        asyncio.run(pipeline._fetch_async(tasks, run))
+    else:
+        pipeline._fetch_threaded(tasks, run)
+    return sections
+
+
+@pytest.mark.parametrize("engine", ["threads", "async"])
+def test_stage_does_not_wait_for_unrelated_sections(engine: str) -> None:
+    staged = threading.Event()
+
+    def stage(inputs: dict[str, Any]) -> dict[str, Any]:
+        staged.set()
+        return _upper(inputs)
+
+    def slow() -> str:
+        # Only finishes once the stage has run, so the stage cannot have waited for it.
+        assert staged.wait(timeout=5)
+        return "slow"
+
+    tasks = {"fast": lambda: "fast", "slow": slow}
+    sections = _run(engine, tasks, {"upper": pipeline.Stage(("fast",), stage, _upper)})
+    assert sections == {"fast": "FAST", "slow": "slow"}
+
+
+def test_failed_stage_applies_its_fallback() -> None:
+    stages = {"broken": pipeline.Stage(("fast",), _fail, lambda inputs: {"fast": "fallback"})}
+    sections = _run("threads", {"fast": lambda: "fast"}, stages)
+    assert sections == {"fast": "fallback"}
+
+
+@pytest.mark.parametrize("engine", ["threads", "async"])
+def test_section_past_its_deadline_is_abandoned_on_a_daemon_thread(
+    engine: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(pipeline, "cfg", dataclasses.replace(cfg, section_budgets={"arxiv": 0.2}))
+    tracing.reset()
+    release, finished = threading.Event(), threading.Event()
+    daemon: list[bool] = []
+
+    def slow() -> list[str]:
+        daemon.append(threading.current_thread().daemon)
+        release.wait(timeout=5)
+        finished.set()
+        return ["late paper"]
+
+    sections = _run(engine, {"arxiv": slow, "fast": lambda: "fast"}, {})
+
+    assert sections == {"arxiv": pipeline.empty_section("arxiv"), "fast": "fast"}
+    assert daemon == [True]  # cannot hold the process open at exit
+    assert tracing.late_sections() == [{"section": "arxiv", "deadline_s": 0.2, "late_by_s": None}]
+
+    release.set()
+    assert finished.wait(timeout=5)
+    deadline = time.monotonic() + 5
+    while tracing.late_sections()[0]["late_by_s"] is None and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert tracing.late_sections()[0]["outcome"] == "ok"
+
+
+def test_lazy_services_are_resolved_through_partials() -> None:
+    task = partial(pipeline.lazy("fetch_todo_tasks"), pipeline.lazy("fetch_news"), limit=3)
+
+    resolved = pipeline._resolve(task)
+
+    assert isinstance(resolved, partial)
+    assert resolved.func is services.fetch_todo_tasks
+    assert resolved.args == (services.fetch_news,)
+    assert resolved.keywords == {"limit": 3}
@@ -0,0 +1,41 @@
+"""
+Unit tests for the shared token-bucket rate limiter.
+
+Usage:
+  uv run pytest tests/test_rate_limit.py
+"""
+
+from __future__ import annotations
+
+import time
+from pathlib import Path
+
+from src.services.rate_limit import TokenBucket
+
+
+def test_burst_is_free_then_waits() -> None:
+    """Tokens within capacity are immediate; the next one waits ~1/rate."""
+    bucket = TokenBucket(rate=20, capacity=2)
+    assert bucket.acquire() == 0
+    assert bucket.acquire() == 0
+
+    start = time.monotonic()
+    waited = bucket.acquire()
+    assert waited > 0
+    assert time.monotonic() - start >= 0.04
+
+
+def test_state_file_is_shared(tmp_path: Path) -> None:
+    """Two buckets on the same state file draw from the same tokens."""
+    path = tmp_path / "bucket.json"
+    a = TokenBucket(rate=10, capacity=1, state_path=path)
+    b = TokenBucket(rate=10, capacity=1, state_path=path)
+    assert a.acquire() == 0
+    assert b.acquire() > 0
+
+
+def test_penalize_delays_next_acquire() -> None:
+    """A penalty empties the bucket for roughly the given time."""
+    bucket = TokenBucket(rate=100, capacity=5)
+    bucket.penalize(0.05)
+    assert bucket.acquire() >= 0.05
@@ -0,0 +1,50 @@
+"""
+Unit tests for local relevance ranking.
+
+Usage:
+  uv run pytest tests/test_relevance.py
+"""
+
+from __future__ import annotations
+
+import dataclasses
+
+import pytest
+
+from src.config import cfg
+from src.services import relevance
+
+
+@pytest.fixture(autouse=True)
+def _interests(monkeypatch: pytest.MonkeyPatch) -> None:
+    profile = dataclasses.replace(cfg, ranking_interests=["large language models", "GPU"])
+    monkeypatch.setattr(relevance, "cfg", profile)
+
+
+def test_items_matching_interests_come_first_and_ties_keep_fetched_order() -> None:
+    papers = [
+        {"title": "A survey of graph colouring", "category": "Math"},
+        {"title": "Serving large language models on one GPU", "category": "LLM"},
+        {"title": "Protein folding at scale", "category": "Bio"},
+        {"title": "Language models as planners", "category": "LLM"},
+    ]
+
+    ranked = relevance.top_items("arxiv", papers, limit=3)
+
+    assert [p["title"] for p in ranked] == [
+        "Serving large language models on one GPU",
+        "Language models as planners",
+        "A survey of graph colouring",
+    ]
+
+
+def test_popularity_is_blended_with_relevance() -> None:
+    stories = [
+        {"title": "Show HN: a tiny text editor", "points": 12},
+        {"title": "Ask HN: favourite keyboards?", "points": 480},
+        {"title": "GPU kernels explained", "points": 40},
+    ]
+
+    ranked = relevance.top_items("hn", stories, limit=3)
+
+    assert [s["points"] for s in ranked] == [40, 480, 12]
@@ -0,0 +1,74 @@
+"""
+Unit tests for the stale-while-revalidate section cache.
+
+Usage:
+  uv run pytest tests/test_section_cache.py
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import functools
+import time
+from pathlib import Path
+
+import pytest
+
+from src.config import cfg
+from src.pipeline import lazy
+from src.services import section_cache
+from src.services.cache_store import JsonCache
+from src.services.section_cache import SectionCache
+
+
+def _fetch(*args: object) -> list[str]:
+    return []
+
+
+@pytest.fixture(autouse=True)
+def _tmp_cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> JsonCache:
+    cache = JsonCache("sections", tmp_path / "cache.sqlite3")
+    monkeypatch.setattr(section_cache, "_cache", cache)
+    return cache
+
+
+def test_fresh_copy_is_served_and_stale_one_is_a_fallback(_tmp_cache: JsonCache) -> None:
+    SectionCache({"news": _fetch}).store("news", ["headline"])
+    assert SectionCache({"news": _fetch}).fresh("news") == ["headline"]
+
+    # Older than the news TTL, but well inside maxStaleSeconds.
+    with _tmp_cache._connect() as conn:
+        conn.execute("UPDATE sections SET stored_at = ?", (time.time() - 6 * 3600,))
+    cache = SectionCache({"news": _fetch})
+    assert cache.fresh("news") is None
+    assert cache.fallback("news", []) == ["headline"]
+
+
+def test_uncached_sections_and_bound_arguments() -> None:
+    cache = SectionCache({"todo_tasks": _fetch})
+    cache.store("todo_tasks", ["task"])
+    assert SectionCache({"todo_tasks": _fetch}).fallback("todo_tasks", []) == []
+
+    # The same section with other arguments is a different entry.
+    SectionCache({"stocks": functools.partial(_fetch, ["AAPL"])}).store("stocks", ["AAPL"])
+    assert SectionCache({"stocks": functools.partial(_fetch, ["NVDA"])}).fresh("stocks") is None
+    assert SectionCache({"stocks": functools.partial(_fetch, ["AAPL"])}).fresh("stocks") == ["AAPL"]
+
+
+def test_config_edit_starts_a_new_entry(monkeypatch: pytest.MonkeyPatch) -> None:
+    SectionCache({"news": _fetch}).store("news", ["headline"])
+    hn_key = section_cache._key("hn", _fetch)
+    edited = dataclasses.replace(cfg, news_feeds=[*cfg.news_feeds, "https://example.com/rss"])
+    monkeypatch.setattr(section_cache, "cfg", edited)
+
+    assert SectionCache({"news": _fetch}).fallback("news", []) == []
+    assert section_cache._key("hn", _fetch) == hn_key  # hn reads no news setting
+
+
+def test_lazy_arguments_give_the_same_key_in_every_run() -> None:
+    locations = {"37.3700,-122.0400": None}
+    first, second = (
+        functools.partial(_fetch, lazy("fetch_weather_many"), locations) for _ in range(2)
+    )
+
+    assert section_cache._key("weather@all", first) == section_cache._key("weather@all", second)
@@ -0,0 +1,64 @@
+"""
+Unit tests for run tracing spans and the Chrome-trace report.
+
+Usage:
+  uv run pytest tests/test_tracing.py
+"""
+
+from __future__ import annotations
+
+import json
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+
+from src.services import tracing
+
+
+def test_spans_nest_across_worker_threads(tmp_path: Path) -> None:
+    """Children opened in a pool thread link to the section that submitted them."""
+    tracing.reset()
+
+    def child() -> None:
+        with tracing.span("GET example.com", "http"):
+            pass
+
+    with tracing.span("news", "section") as info:
+        with ThreadPoolExecutor(2) as pool:
+            pool.submit(tracing.in_context(child)).result()
+        info["items"] = 3
+
+    events = {e["name"]: e for e in tracing.events()}
+    assert events["GET example.com"]["args"]["section"] == "news"
+    assert events["GET example.com"]["args"]["parent"] == events["news"]["id"]
+    assert events["news"]["args"]["items"] == 3
+
+    path = tracing.write_trace(tmp_path / "run-trace.json")
+    trace = json.loads(path.read_text())
+    assert {e["ph"] for e in trace["traceEvents"]} == {"X", "M"}
+    assert trace["otherData"]["categories"]["http"]["count"] == 1
+    assert "news" in trace["otherData"]["sections"]
+
+
+def test_failed_span_records_error() -> None:
+    tracing.reset()
+    try:
+        with tracing.span("gemini.generate", "gemini"):
+            raise ValueError("quota")
+    except ValueError:
+        pass
+
+    (event,) = tracing.events()
+    assert event["args"]["error"] == "ValueError: quota"
+
+
+def test_late_section_is_updated_when_it_finishes() -> None:
+    tracing.reset()
+    future: Future[int] = Future()
+    tracing.record_late("arxiv", 180, future)
+    assert tracing.summary()["late_sections"] == [
+        {"section": "arxiv", "deadline_s": 180, "late_by_s": None}
+    ]
+
+    future.set_result(1)
+    (entry,) = tracing.late_sections()
+    assert entry["outcome"] == "ok" and entry["late_by_s"] is not None
@@ -0,0 +1,56 @@
+"""
+Unit tests for batched translation (no network — Google Translate is faked).
+
+Usage:
+  uv run pytest tests/test_translator.py
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from src.services import translator
+from src.services.cache_store import JsonCache
+
+
+class _FakeTranslator:
+    """Stands in for deep_translator.GoogleTranslator; records each request."""
+
+    calls: list[str] = []
+
+    def __init__(self, **_: str) -> None:
+        pass
+
+    def translate(self, text: str) -> str:
+        self.calls.append(text)
+        return "\n".join(f"译{line}" for line in text.split("\n"))
+
+
+@pytest.fixture(autouse=True)
+def _fake_backend(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    _FakeTranslator.calls = []
+    monkeypatch.setattr("deep_translator.GoogleTranslator", _FakeTranslator)
+    monkeypatch.setattr(translator, "_cache", JsonCache("translations", tmp_path / "c.sqlite3"))
+
+
+def test_batch_packs_dedups_and_skips_chinese() -> None:
+    """Unique non-Chinese strings go out in a single packed request."""
+    out = translator.translate_batch(["Hello", "", "你好世界", "Hello", "Two\nlines"])
+    assert out == ["译Hello", "", "你好世界", "译Hello", "译Two lines"]
+    assert _FakeTranslator.calls == ["Hello\nTwo lines"]
+
+
+def test_repeats_are_served_from_cache() -> None:
+    """A second batch with the same text makes no request."""
+    translator.translate_batch(["Daily news"])
+    _FakeTranslator.calls.clear()
+    assert translator.translate_to_chinese("Daily news") == "译Daily news"
+    assert _FakeTranslator.calls == []
+
+
+def test_non_latin_scripts_are_translated_and_only_mostly_han_text_is_skipped() -> None:
+    texts = ["Привет мир", "안녕하세요", "こんにちは", "東京タワーについての記事", "用Rust写的数据库"]
+    out = translator.translate_batch(texts)
+    assert out == ["译Привет мир", "译안녕하세요", "译こんにちは", "译東京タワーについての記事", "用Rust写的数据库"]
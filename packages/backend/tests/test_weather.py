@@ -0,0 +1,61 @@
+"""
+Unit tests for the batched, grid-cached weather fetch.
+
+Usage:
+  uv run pytest tests/test_weather.py
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from src.config import Location
+from src.services import weather_service
+from src.services.cache_store import JsonCache
+
+_FORECAST = json.loads(
+    (Path(__file__).resolve().parents[3] / "tests/fake-server/fixtures/weather.json").read_text()
+)
+
+
+class _Response:
+    def __init__(self, data: Any) -> None:
+        self._data = data
+
+    def raise_for_status(self) -> None:
+        pass
+
+    def json(self) -> Any:
+        return self._data
+
+
+def test_nearby_locations_share_one_batched_request(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(weather_service, "_cache", JsonCache("weather_cells", tmp_path / "c.db"))
+    requests: list[dict[str, Any]] = []
+
+    def fake_get(url: str, *, params: dict[str, Any], **kw: Any) -> _Response:
+        requests.append(params)
+        return _Response([_FORECAST] * len(params["latitude"].split(",")))
+
+    monkeypatch.setattr(weather_service, "traced_get", fake_get)
+    locations = [
+        Location(37.3688, -122.0363, "Sunnyvale"),
+        Location(37.3541, -121.9552, "Santa Clara"),  # same 0.1° cell
+        Location(40.7128, -74.0060, "New York"),
+    ]
+
+    weather = weather_service.fetch_weather_many(locations)
+    assert [w["location"] for w in weather] == ["Sunnyvale", "Santa Clara", "New York"]
+    assert len(weather[0]["forecasts"]) == 3
+    assert requests == [requests[0]]
+    assert requests[0]["latitude"] == "37.4,40.7"
+
+    # Cached for the hour: no second request.
+    weather_service.fetch_weather_many(locations[:1])
+    assert len(requests) == 1
@@ -75,17 +75,7 @@ export function TopNews({ news }: TopNewsProps) {
               </Text>
 
               {/* Source */}
-              <Text
-                style={{
-                  fontFamily: tokens.fontSans,
-                  fontSize: "10px",
-                  color: tokens.inkMuted,
-                  margin: "0",
-                  fontStyle: "italic" as const,
-                }}
-              >
-                — {lead.source}
-              </Text>
+              <SourceLine item={lead} />
             </td>
           </tr>
         </tbody>
@@ -169,17 +159,7 @@ export function TopNews({ news }: TopNewsProps) {
                   >
                     {item.summary}
                   </Text>
-                  <Text
-                    style={{
-                      fontFamily: tokens.fontSans,
-                      fontSize: "10px",
-                      color: tokens.inkMuted,
-                      margin: "0",
-                      fontStyle: "italic" as const,
-                    }}
-                  >
-                    — {item.source}
-                  </Text>
+                  <SourceLine item={item} />
                 </td>
               </tr>
             </tbody>
@@ -189,3 +169,30 @@ export function TopNews({ news }: TopNewsProps) {
     </Section>
   );
 }
+
+/** "— Reuters · 另见 BBC News、NPR", linking the other outlets that ran the story. */
+function SourceLine({ item }: { item: NewsItem }) {
+  const alternates = item.alternateSources ?? [];
+  return (
+    <Text
+      style={{
+        fontFamily: tokens.fontSans,
+        fontSize: "10px",
+        color: tokens.inkMuted,
+        margin: "0",
+        fontStyle: "italic" as const,
+      }}
+    >
+      — {item.source}
+      {alternates.length > 0 && " · 另见 "}
+      {alternates.map((alt, i) => (
+        <React.Fragment key={alt.url}>
+          {i > 0 && "、"}
+          <Link href={alt.url} style={{ color: tokens.inkMuted }}>
+            {alt.source}
+          </Link>
+        </React.Fragment>
+      ))}
+    </Text>
+  );
+}
@@ -41,6 +41,10 @@ export const fakeData: NewsletterProps = {
       source: "Reuters",
       url: "https://example.com/fusion-breakthrough",
       category: "科学",
+      alternateSources: [
+        { source: "BBC News", url: "https://example.com/fusion-bbc" },
+        { source: "NPR", url: "https://example.com/fusion-npr" },
+      ],
     },
     {
       headline: "美联储暗示因就业数据强劲暂停降息",
@@ -33,6 +33,12 @@ export interface WeatherForecast {
   astroNote?: string;
 }
 
+/** Another outlet's link to the same story. */
+export interface NewsSource {
+  source: string;
+  url: string;
+}
+
 /** A top-news headline item. */
 export interface NewsItem {
   headline: string;
@@ -40,6 +46,7 @@ export interface NewsItem {
   source: string;      // e.g. "Reuters"
   url: string;
   category: string;    // e.g. "Technology", "World"
+  alternateSources?: NewsSource[];  // other feeds that ran the same story
 }
 
 /** A stock or ETF quote. */
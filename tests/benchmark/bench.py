@@ -0,0 +1,258 @@
+"""End-to-end fetch benchmark against the fake server.
+
+Generates synthetic fixtures, starts the fake server with injected
+latency, then runs the backend's ``main()`` once per scenario
+(fetch mode × ranking fetch multiplier × worker count) with a cold
+cache.  For every run it records wall time, the child's peak RSS and the
+request counts from the fake server's ``/__log``, and compares them with
+``baseline.json``.
+
+Usage (from packages/backend):
+  uv run python ../../tests/benchmark/bench.py
+  uv run python ../../tests/benchmark/bench.py --modes async --multipliers 3 --repeat 3
+  uv run python ../../tests/benchmark/bench.py --update-baseline
+
+Exits non-zero when a scenario regresses beyond the tolerances.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+from pathlib import Path
+from typing import Any
+
+from fixtures import generate
+
+_ROOT = Path(__file__).resolve().parents[2]
+_BACKEND = _ROOT / "packages" / "backend"
+_SERVER = _ROOT / "tests" / "fake-server" / "server.py"
+_BASELINE = Path(__file__).resolve().parent / "baseline.json"
+
+# Injected latency, keyed by path prefix (see tests/fake-server/server.py).
+_LATENCY = {
+    "*": {"delayMs": 30, "jitterMs": 20},
+    "/v0/item/": {"delayMs": 60, "jitterMs": 40},
+    "/rss/": {"delayMs": 120, "jitterMs": 80},
+    "/trending": {"delayMs": 200, "jitterMs": 100},
+}
+
+# Runs src.main with Google Translate stubbed out: the fake server has no
+# translation endpoint, so every string keeps its source text.
+_OFFLINE_MAIN = """
+from src.services import translator
+translator._translate_remote = lambda texts: {}
+from src.main import main
+main()
+"""
+
+# Allowed slack before a metric counts as a regression.
+_TOLERANCE = {"wall_s": 0.25, "peak_rss_mb": 0.20, "requests": 0.0}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the fetch pipeline")
+    parser.add_argument("--modes", default="threads,async", help="fetch.mode values")
+    parser.add_argument("--multipliers", default="1,3,10", help="ranking fetch multipliers")
+    parser.add_argument(
+        "--workers", default="4,10",
+        help="worker counts (FETCH_MAX_WORKERS and HN_MAX_CONCURRENCY)",
+    )
+    parser.add_argument("--repeat", type=int, default=1, help="runs per scenario (median kept)")
+    parser.add_argument("--hn-stories", type=int, default=30, help="HN_MAX_STORIES")
+    parser.add_argument("--feeds", type=int, default=40, help="synthetic RSS feeds")
+    parser.add_argument(
+        "--server-mode", default="threads", choices=["threads", "asyncio"],
+        help="fake server FAKE_SERVER_MODE",
+    )
+    parser.add_argument("--baseline", type=Path, default=_BASELINE)
+    parser.add_argument("--update-baseline", action="store_true")
+    args = parser.parse_args()
+
+    scenarios = [
+        {"mode": mode, "multiplier": int(m), "workers": int(w)}
+        for mode in args.modes.split(",")
+        for m in args.multipliers.split(",")
+        for w in args.workers.split(",")
+    ]
+
+    with tempfile.TemporaryDirectory(prefix="newsletter-bench-") as tmp:
+        work = Path(tmp)
+        feeds = generate(work / "fixtures", feeds=args.feeds)
+        port = _free_port()
+        server = _start_server(work / "fixtures", port, args.server_mode)
+        try:
+            results = {}
+            for sc in scenarios:
+                key = _scenario_key(sc)
+                runs = [
+                    _run_once(sc, port, feeds, args.hn_stories, work / f"{key}-{i}")
+                    for i in range(args.repeat)
+                ]
+                results[key] = _median(runs)
+                _print_result(key, results[key])
+        finally:
+            server.terminate()
+            server.wait()
+
+    if args.update_baseline:
+        args.baseline.write_text(json.dumps(results, indent=2) + "\n", encoding="utf-8")
+        print(f"💾  Baseline written to {args.baseline}")
+        return
+
+    if not args.baseline.exists():
+        print(f"⚠️  No baseline at {args.baseline} — run with --update-baseline")
+        return
+
+    regressions = _compare(results, json.loads(args.baseline.read_text(encoding="utf-8")))
+    if regressions:
+        print()
+        print("❌  Regressions:")
+        for line in regressions:
+            print(f"    {line}")
+        sys.exit(1)
+    print()
+    print("✅  No regressions against baseline")
+
+
+# ── internal helpers ──────────────────────────────────────────
+
+
+def _scenario_key(sc: dict[str, Any]) -> str:
+    return f"{sc['mode']}-x{sc['multiplier']}-w{sc['workers']}"
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return int(sock.getsockname()[1])
+
+
+def _start_server(fixtures: Path, port: int, mode: str) -> subprocess.Popen[bytes]:
+    env = {
+        **os.environ,
+        "FAKE_SERVER_MODE": mode,
+        "FAKE_SERVER_PORT": str(port),
+        "FAKE_FIXTURES_DIR": str(fixtures),
+        "FAKE_ROUTES": json.dumps(_LATENCY),
+    }
+    proc = subprocess.Popen(
+        [sys.executable, str(_SERVER)],
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    deadline = time.monotonic() + 10
+    while time.monotonic() < deadline:
+        try:
+            urllib.request.urlopen(f"http://127.0.0.1:{port}/health", timeout=1)
+            return proc
+        except OSError:
+            time.sleep(0.1)
+    proc.terminate()
+    raise RuntimeError("fake server did not start")
+
+
+def _run_once(
+    sc: dict[str, Any], port: int, feeds: list[str], hn_stories: int, out_dir: Path
+) -> dict[str, Any]:
+    """Run the backend once and return its metrics."""
+    base = f"http://127.0.0.1:{port}"
+    env = {k: v for k, v in os.environ.items() if k != "GEMINI_API_KEY"}
+    env.update({
+        "WEATHER_API_BASE": base,
+        "HN_API_BASE": base,
+        "GITHUB_TRENDING_BASE": base,
+        "TODO_API_BASE": base,
+        "NEWS_FEEDS": ",".join(f"{base}/rss/{name}" for name in feeds),
+        "TODO_API_USER": "bench",
+        "TODO_API_PASSWORD": "bench",
+        # Libraries without an HTTP base URL cannot be pointed at the fake server.
+        "SKIP_STOCKS": "true",
+        "SKIP_EXCHANGE_RATES": "true",
+        "SKIP_ASTRONOMY": "true",
+        "SKIP_ARXIV": "true",
+        # Over-fetch as for ranking; without an API key the lists are trimmed locally.
+        "RANKING_ENABLED": "true",
+        "RANKING_FETCH_MULTIPLIER": str(sc["multiplier"]),
+        "HN_MAX_STORIES": str(hn_stories),
+        "FETCH_MODE": sc["mode"],
+        "FETCH_MAX_WORKERS": str(sc["workers"]),
+        "HN_MAX_CONCURRENCY": str(sc["workers"]),
+        "CACHE_DIR": str(out_dir / "cache"),
+    })
+
+    out_dir.mkdir(parents=True, exist_ok=True)
+    _server_log(port, reset=True)
+    start = time.perf_counter()
+    proc = subprocess.Popen(
+        [sys.executable, "-c", _OFFLINE_MAIN, "--output", str(out_dir / "newsletter-data.json")],
+        cwd=_BACKEND,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    # wait4 gives this child's own rusage, not the running max over all children.
+    _, status, usage = os.wait4(proc.pid, 0)
+    wall = time.perf_counter() - start
+    proc.returncode = os.waitstatus_to_exitcode(status)
+    if proc.returncode != 0:
+        raise RuntimeError(f"{_scenario_key(sc)}: backend exited with {proc.returncode}")
+
+    log = _server_log(port)
+    return {
+        "wall_s": round(wall, 2),
+        "peak_rss_mb": round(usage.ru_maxrss / 1024, 1),  # Linux reports KiB
+        "requests": log["total"],
+        "requests_by_route": {route: r["count"] for route, r in log["routes"].items()},
+    }
+
+
+def _server_log(port: int, *, reset: bool = False) -> dict[str, Any]:
+    """Read (or clear) the fake server's per-route request log."""
+    path = "/__log/reset" if reset else "/__log"
+    with urllib.request.urlopen(f"http://127.0.0.1:{port}{path}", timeout=5) as resp:
+        return json.loads(resp.read())
+
+
+def _median(runs: list[dict[str, Any]]) -> dict[str, Any]:
+    if len(runs) == 1:
+        return runs[0]
+    result = dict(runs[0])
+    for metric in ("wall_s", "peak_rss_mb"):
+        result[metric] = round(statistics.median(r[metric] for r in runs), 2)
+    return result
+
+
+def _print_result(key: str, result: dict[str, Any]) -> None:
+    print(
+        f"  {key:<22} {result['wall_s']:>7.2f}s  {result['peak_rss_mb']:>7.1f} MB"
+        f"  {result['requests']:>5} requests"
+    )
+
+
+def _compare(results: dict[str, Any], baseline: dict[str, Any]) -> list[str]:
+    """Return one line per metric that exceeds its baseline plus tolerance."""
+    regressions: list[str] = []
+    for key, result in results.items():
+        base = baseline.get(key)
+        if base is None:
+            print(f"⚠️  {key}: not in baseline")
+            continue
+        for metric, slack in _TOLERANCE.items():
+            limit = base[metric] * (1 + slack)
+            if result[metric] > limit:
+                regressions.append(f"{key} {metric}: {result[metric]} > {base[metric]} (+{slack:.0%})")
+    return regressions
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+"""Synthetic fixtures — large, deterministic payloads for the fake server.
+
+Writes a fixture directory the fake server can serve via
+``FAKE_FIXTURES_DIR``: hundreds of HN items, dozens of RSS feeds and a
+long GitHub trending page, instead of the handful of canned responses
+under ``tests/fake-server/fixtures``.
+
+Usage:
+  python fixtures.py /tmp/bench-fixtures
+  python fixtures.py /tmp/bench-fixtures --hn-items 1000 --feeds 60
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import shutil
+from pathlib import Path
+from xml.sax.saxutils import escape
+
+_CANNED = Path(__file__).resolve().parent.parent / "fake-server" / "fixtures"
+
+_WORDS = [
+    "rust", "python", "kernel", "compiler", "database", "latency", "cache", "vector",
+    "model", "graph", "open", "source", "release", "security", "browser", "protocol",
+    "quantum", "chip", "energy", "climate", "market", "policy", "election", "research",
+    "study", "startup", "network", "storage", "cloud",
+]
+
+
+def generate(
+    out_dir: Path,
+    *,
+    hn_items: int = 500,
+    feeds: int = 40,
+    entries_per_feed: int = 30,
+    trending_repos: int = 150,
+    seed: int = 7,
+) -> list[str]:
+    """Write the synthetic fixture set to *out_dir*.
+
+    Returns:
+        The feed names, served by the fake server at ``/rss/<name>``.
+    """
+    rng = random.Random(seed)
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    # Endpoints whose size does not matter keep their canned fixture.
+    for name in ("weather.json", "todo.json"):
+        shutil.copy(_CANNED / name, out_dir / name)
+
+    ids = list(range(1, hn_items + 1))
+    (out_dir / "hn_topstories.json").write_text(json.dumps(ids), encoding="utf-8")
+    for sid in ids:
+        item = {
+            "id": sid,
+            "title": _sentence(rng, 8),
+            "url": f"https://example.com/hn/{sid}",
+            "score": rng.randint(10, 2000),
+            "descendants": rng.randint(0, 800),
+        }
+        (out_dir / f"hn_item_{sid}.json").write_text(json.dumps(item), encoding="utf-8")
+
+    names = [f"feed-{i:02d}" for i in range(feeds)]
+    for name in names:
+        (out_dir / f"rss_{name}.xml").write_text(
+            _rss(rng, name, entries_per_feed), encoding="utf-8"
+        )
+
+    (out_dir / "github_trending.html").write_text(
+        _trending(rng, trending_repos), encoding="utf-8"
+    )
+    return names
+
+
+# ── internal helpers ──────────────────────────────────────────
+
+
+def _sentence(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(_WORDS) for _ in range(words)).capitalize()
+
+
+def _rss(rng: random.Random, name: str, entries: int) -> str:
+    items = "\n".join(
+        f"""    <item>
+      <title>{escape(_sentence(rng, 9))}</title>
+      <description>{escape(_sentence(rng, 40))}</description>
+      <link>https://example.com/{name}/{i}</link>
+      <category>{escape(rng.choice(_WORDS).title())}</category>
+    </item>"""
+        for i in range(entries)
+    )
+    return f"""<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0">
+  <channel>
+    <title>Synthetic {name}</title>
+{items}
+  </channel>
+</rss>
+"""
+
+
+def _trending(rng: random.Random, repos: int) -> str:
+    rows = "\n".join(
+        f"""  <article class="Box-row">
+    <h2><a href="/org-{i}/repo-{i}">org-{i} / repo-{i}</a></h2>
+    <p>{escape(_sentence(rng, 14))}</p>
+    <a href="/org-{i}/repo-{i}/stargazers" class="Link--muted d-inline-block mr-3">{rng.randint(100, 90000):,}</a>
+    <span class="d-inline-block float-sm-right">{rng.randint(5, 3000)} stars today</span>
+  </article>"""
+        for i in range(repos)
+    )
+    return f"""<html>
+<body>
+<div class="application-main">
+{rows}
+</div>
+</body>
+</html>
+"""
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Write synthetic fake-server fixtures")
+    parser.add_argument("out_dir", type=Path)
+    parser.add_argument("--hn-items", type=int, default=500)
+    parser.add_argument("--feeds", type=int, default=40)
+    parser.add_argument("--trending-repos", type=int, default=150)
+    args = parser.parse_args()
+
+    names = generate(
+        args.out_dir,
+        hn_items=args.hn_items,
+        feeds=args.feeds,
+        trending_repos=args.trending_repos,
+    )
+    print(f"🧪  Wrote {args.hn_items} HN items, {len(names)} feeds to {args.out_dir}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,180 @@
+"""Cold-start benchmark for the backend, from ``python -X importtime``.
+
+Measures two things in fresh interpreters:
+
+* ``import``  — ``import src.main`` alone: the fixed cost every run pays.
+* ``skip-all`` — ``python -m src.main`` with every section disabled via
+  ``SKIP_*``: interpreter start, config, imports and payload writing,
+  with no network at all.
+
+Each is repeated and the median kept.  The skip-all run also lists the
+heavy third-party packages it loaded; a section disabled via ``SKIP_*``
+should not load its libraries, so any listed package counts as a
+regression.  Results are compared with ``startup_baseline.json``.
+
+Usage (from packages/backend):
+  uv run python ../../tests/benchmark/startup.py
+  uv run python ../../tests/benchmark/startup.py --repeat 15 --top 20
+  uv run python ../../tests/benchmark/startup.py --update-baseline
+
+Exits non-zero when a scenario regresses beyond the tolerances.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Any
+
+_ROOT = Path(__file__).resolve().parents[2]
+_BACKEND = _ROOT / "packages" / "backend"
+_BASELINE = Path(__file__).resolve().parent / "startup_baseline.json"
+
+_SECTIONS = [
+    "weather", "news", "stocks", "hn", "astronomy", "github_trending",
+    "arxiv", "exchange_rates", "todo_tasks",
+]
+
+# Libraries behind individual sections; none should load when all are skipped.
+_HEAVY = [
+    "bs4", "feedparser", "astral", "arxiv", "httpx", "requests", "yfinance",
+    "google.genai", "deep_translator",
+]
+
+# Allowed slack before a metric counts as a regression.
+_TOLERANCE = {"import_ms": 0.25, "wall_ms": 0.25}
+
+# "import time:  self [us] | cumulative | imported package"
+_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \| (\s*)(\S+)")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark backend cold start")
+    parser.add_argument("--repeat", type=int, default=7, help="runs per scenario (median kept)")
+    parser.add_argument("--top", type=int, default=10, help="slowest top-level packages to list")
+    parser.add_argument("--baseline", type=Path, default=_BASELINE)
+    parser.add_argument("--update-baseline", action="store_true")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="newsletter-startup-") as tmp:
+        scenarios = {
+            "import": [sys.executable, "-X", "importtime", "-c", "import src.main"],
+            "skip-all": [
+                sys.executable, "-X", "importtime", "-m", "src.main",
+                "--output", str(Path(tmp) / "newsletter-data.json"),
+            ],
+        }
+        env = {
+            **os.environ,
+            **{f"SKIP_{name.upper()}": "true" for name in _SECTIONS},
+            "RANKING_ENABLED": "false",
+            "SECTION_CACHE_ENABLED": "false",
+            "CACHE_DIR": str(Path(tmp) / "cache"),
+        }
+        results: dict[str, Any] = {}
+        for key, cmd in scenarios.items():
+            runs = [_run_once(cmd, env) for _ in range(args.repeat)]
+            results[key] = {
+                "import_ms": round(statistics.median(r["import_ms"] for r in runs), 1),
+                "wall_ms": round(statistics.median(r["wall_ms"] for r in runs), 1),
+                "heavy": runs[0]["heavy"],
+            }
+            _print_result(key, results[key], runs[0]["packages"], args.top)
+
+    if args.update_baseline:
+        args.baseline.write_text(json.dumps(results, indent=2) + "\n", encoding="utf-8")
+        print(f"💾  Baseline written to {args.baseline}")
+        return
+
+    regressions = [
+        f"skip-all loaded {name}" for name in results["skip-all"]["heavy"]
+    ]
+    if args.baseline.exists():
+        regressions += _compare(results, json.loads(args.baseline.read_text(encoding="utf-8")))
+    else:
+        print(f"⚠️  No baseline at {args.baseline} — run with --update-baseline")
+
+    if regressions:
+        print()
+        print("❌  Regressions:")
+        for line in regressions:
+            print(f"    {line}")
+        sys.exit(1)
+    print()
+    print("✅  No regressions against baseline")
+
+
+# ── internal helpers ──────────────────────────────────────────
+
+
+def _run_once(cmd: list[str], env: dict[str, str]) -> dict[str, Any]:
+    """Run *cmd* in a fresh interpreter and parse its ``-X importtime`` report."""
+    start = time.perf_counter()
+    proc = subprocess.run(
+        cmd, cwd=_BACKEND, env=env, capture_output=True, text=True, check=False
+    )
+    wall = time.perf_counter() - start
+    if proc.returncode != 0:
+        raise RuntimeError(f"{' '.join(cmd[3:])} exited with {proc.returncode}:\n{proc.stderr}")
+
+    imports = _parse(proc.stderr)
+    # Modules are reported as they finish loading, so every top-level
+    # import after ``site`` belongs to the command, not interpreter start-up.
+    names = list(imports)
+    after_site = names[names.index("site") + 1 :] if "site" in imports else names
+    own = sum(imports[name][1] for name in after_site if imports[name][2] == 0)
+    packages: dict[str, int] = defaultdict(int)
+    for name, (self_us, _, _) in imports.items():
+        packages[name.split(".")[0]] += self_us
+    return {
+        "import_ms": own / 1000,
+        "wall_ms": wall * 1000,
+        "packages": dict(packages),
+        "heavy": [h for h in _HEAVY if h in imports],
+    }
+
+
+def _parse(stderr: str) -> dict[str, tuple[int, int, int]]:
+    """Return ``{module: (self_us, cumulative_us, depth)}`` in load order."""
+    imports: dict[str, tuple[int, int, int]] = {}
+    for line in stderr.splitlines():
+        match = _LINE.match(line)
+        if match:
+            self_us, cum_us, indent, name = match.groups()
+            imports[name] = (int(self_us), int(cum_us), len(indent) // 2)
+    return imports
+
+
+def _print_result(key: str, result: dict[str, Any], packages: dict[str, int], top: int) -> None:
+    print(f"  {key:<10} imports {result['import_ms']:>7.1f} ms   wall {result['wall_ms']:>7.1f} ms")
+    slowest = sorted(packages.items(), key=lambda kv: -kv[1])[:top]
+    for name, us in slowest:
+        print(f"      {name:<24} {us / 1000:>6.1f} ms")
+
+
+def _compare(results: dict[str, Any], baseline: dict[str, Any]) -> list[str]:
+    """Return one line per metric that exceeds its baseline plus tolerance."""
+    regressions: list[str] = []
+    for key, result in results.items():
+        base = baseline.get(key)
+        if base is None:
+            print(f"⚠️  {key}: not in baseline")
+            continue
+        for metric, slack in _TOLERANCE.items():
+            limit = base[metric] * (1 + slack)
+            if result[metric] > limit:
+                regressions.append(f"{key} {metric}: {result[metric]} > {base[metric]} (+{slack:.0%})")
+    return regressions
+
+
+if __name__ == "__main__":
+    main()
@@ -2,71 +2,326 @@
 
 Provides deterministic, canned responses so the newsletter pipeline
 can be tested end-to-end without hitting real external services.
+Fixtures are loaded into memory at startup, and requests are served
+concurrently — on a thread per connection, or on one asyncio loop — so
+backend concurrency changes show up when load-testing against it.
 
 Usage:
   python server.py          # starts on port 8080
   FAKE_SERVER_PORT=9090 python server.py
+
+Environment:
+  FAKE_SERVER_MODE    "threads" (default) or "asyncio"
+  FAKE_FIXTURES_DIR   serve fixtures from another directory (e.g. the
+                      synthetic ones written by tests/benchmark/fixtures.py)
+  FAKE_ROUTES         JSON behaviour keyed by path prefix, longest prefix
+                      wins, "*" is the default.  Per route:
+                        delayMs, jitterMs   injected latency
+                        errorRate           fraction answered with 500
+                        rateLimitRate       fraction answered with 429
+                        retryAfterS         Retry-After sent with a 429 (default 1)
+                        conditional         honour ETag / Last-Modified with 304
+                                            (default true)
+                      '{"*": {"delayMs": 20}, "/v0/item/": {"delayMs": 80, "errorRate": 0.05}}'
+
+Request log:
+  GET /__log          per-route request counts, status codes and timings
+  GET /__log/reset    clear the log (e.g. between benchmark runs)
 """
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import json
 import os
-from http.server import BaseHTTPRequestHandler, HTTPServer
+import random
+import re
+import threading
+import time
+from collections.abc import Mapping
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
+from typing import Any, NamedTuple
+from urllib.parse import parse_qs
 
-_FIXTURES = Path(__file__).parent / "fixtures"
+_FIXTURES = Path(os.getenv("FAKE_FIXTURES_DIR", str(Path(__file__).parent / "fixtures")))
 _PORT = int(os.getenv("FAKE_SERVER_PORT", "8080"))
+_MODE = os.getenv("FAKE_SERVER_MODE", "threads").lower()
+_ROUTE_SETTINGS: dict[str, dict[str, Any]] = json.loads(os.getenv("FAKE_ROUTES", "{}"))
+
+# Fixtures never change while the server runs, so one timestamp serves
+# as Last-Modified for all of them.
+_STARTED = formatdate(time.time(), usegmt=True)
+
+_ROUTES: dict[str, tuple[str, str]] = {
+    "/v1/forecast": ("weather.json", "application/json"),
+    "/v0/topstories.json": ("hn_topstories.json", "application/json"),
+    "/api/recommendation": ("todo.json", "application/json"),
+    "/health": ("", "text/plain"),
+}
+
+# Parameterised routes: the match fills in the fixture name; the label
+# groups them in the request log.
+_PATTERNS: list[tuple[re.Pattern[str], str, str, str]] = [
+    (re.compile(r"/v0/item/(\d+)\.json"), "hn_item_{0}.json", "application/json",
+     "/v0/item/{id}.json"),
+    (re.compile(r"/trending(?:/[\w.+#-]*)?"), "github_trending.html", "text/html",
+     "/trending/{lang}"),
+    (re.compile(r"/rss/([\w-]+)"), "rss_{0}.xml", "application/xml", "/rss/{feed}"),
+]
+
+
+class Fixture(NamedTuple):
+    body: bytes
+    etag: str
+
+
+class Response(NamedTuple):
+    status: int
+    headers: dict[str, str]
+    body: bytes
+
+
+def _load_fixtures(directory: Path) -> dict[str, Fixture]:
+    """Read every fixture into memory once, with its ETag."""
+    fixtures: dict[str, Fixture] = {}
+    for path in directory.iterdir():
+        if path.is_file():
+            body = path.read_bytes()
+            fixtures[path.name] = Fixture(body, '"' + hashlib.sha1(body).hexdigest() + '"')
+    return fixtures
+
+
+_FIXTURE_DATA = _load_fixtures(_FIXTURES)
+
+
+# ── Request log ───────────────────────────────
+
+
+class RequestLog:
+    """Thread-safe per-route request counts, status codes and timings."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._routes: dict[str, dict[str, Any]] = {}
+
+    def record(self, route: str, status: int, elapsed: float) -> None:
+        ms = elapsed * 1000
+        with self._lock:
+            entry = self._routes.setdefault(
+                route, {"count": 0, "status": {}, "totalMs": 0.0, "maxMs": 0.0}
+            )
+            entry["count"] += 1
+            entry["status"][str(status)] = entry["status"].get(str(status), 0) + 1
+            entry["totalMs"] += ms
+            entry["maxMs"] = max(entry["maxMs"], ms)
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            routes = {
+                route: {
+                    **entry,
+                    "status": dict(entry["status"]),
+                    "totalMs": round(entry["totalMs"], 1),
+                    "maxMs": round(entry["maxMs"], 1),
+                    "meanMs": round(entry["totalMs"] / entry["count"], 1),
+                }
+                for route, entry in sorted(self._routes.items())
+            }
+        return {"total": sum(r["count"] for r in routes.values()), "routes": routes}
+
+    def reset(self) -> None:
+        with self._lock:
+            self._routes.clear()
+
+
+_LOG = RequestLog()
+
+
+# ── Routing (shared by both serving modes) ────
+
+
+def _resolve(path: str) -> tuple[str, str, str] | None:
+    """Map a request path to ``(fixture, content_type, log_label)``, or None if unknown."""
+    if path in _ROUTES:
+        fixture, content_type = _ROUTES[path]
+        return fixture, content_type, path
+    for pattern, fixture, content_type, label in _PATTERNS:
+        match = pattern.fullmatch(path)
+        if match:
+            name = fixture.format(*match.groups())
+            return (name, content_type, label) if name in _FIXTURE_DATA else None
+    return None
+
+
+def _settings(path: str) -> dict[str, Any]:
+    """Return the FAKE_ROUTES entry that applies to *path*."""
+    prefixes = [p for p in _ROUTE_SETTINGS if p != "*" and path.startswith(p)]
+    key = max(prefixes, key=len) if prefixes else "*"
+    return _ROUTE_SETTINGS.get(key, {})
 
 
-def _load_fixture(name: str) -> str:
-    """Load a fixture file by name."""
-    return (_FIXTURES / name).read_text(encoding="utf-8")
+def _delay(settings: Mapping[str, Any]) -> float:
+    """Return the injected latency in seconds."""
+    delay_ms = settings.get("delayMs", 0) + random.uniform(0, settings.get("jitterMs", 0))
+    return delay_ms / 1000
+
+
+def _handle(path: str, headers: Mapping[str, str], query: str = "") -> tuple[Response, str]:
+    """Build the response for a GET of *path*; also return the log label."""
+    if path == "/__log":
+        return _json(200, _LOG.snapshot()), ""
+    if path == "/__log/reset":
+        _LOG.reset()
+        return _json(200, {"ok": True}), ""
+
+    route = _resolve(path)
+    if route is None:
+        return _json(404, {"error": f"Unknown path: {path}"}), "(unknown)"
+    fixture, content_type, label = route
+    settings = _settings(path)
+
+    roll = random.random()
+    if roll < settings.get("rateLimitRate", 0):
+        retry_after = str(settings.get("retryAfterS", 1))
+        resp = _json(429, {"error": "rate limited"})
+        resp.headers["Retry-After"] = retry_after
+        return resp, label
+    if roll < settings.get("rateLimitRate", 0) + settings.get("errorRate", 0):
+        return _json(500, {"error": "injected failure"}), label
+
+    data = _FIXTURE_DATA[fixture] if fixture else Fixture(b"OK", "")
+    if label == "/v1/forecast":
+        data = _batched_forecast(data, query)
+    out_headers = {"Content-Type": content_type}
+    if data.etag:
+        out_headers["ETag"] = data.etag
+        out_headers["Last-Modified"] = _STARTED
+        if settings.get("conditional", True) and _not_modified(headers, data.etag):
+            return Response(304, out_headers, b""), label
+    return Response(200, out_headers, data.body), label
+
+
+def _batched_forecast(data: Fixture, query: str) -> Fixture:
+    """Answer a multi-location Open-Meteo request with one forecast per coordinate."""
+    latitudes = parse_qs(query).get("latitude", [""])[0]
+    count = latitudes.count(",") + 1
+    if count == 1:
+        return data
+    body = b"[" + b",".join([data.body] * count) + b"]"
+    return Fixture(body, '"' + hashlib.sha1(body).hexdigest() + '"')
+
+
+def _not_modified(headers: Mapping[str, str], etag: str) -> bool:
+    """Honour conditional GETs (If-None-Match / If-Modified-Since)."""
+    if_none_match = headers.get("If-None-Match")
+    if if_none_match is not None:
+        return etag in [t.strip() for t in if_none_match.split(",")]
+    return headers.get("If-Modified-Since") == _STARTED
+
+
+def _json(status: int, payload: Any) -> Response:
+    body = json.dumps(payload).encode("utf-8")
+    return Response(status, {"Content-Type": "application/json"}, body)
+
+
+# ── Threaded serving ──────────────────────────
 
 
 class FakeHandler(BaseHTTPRequestHandler):
     """HTTP handler that returns canned responses for each API endpoint."""
 
+    protocol_version = "HTTP/1.1"  # keep-alive, like the real APIs
+
     def do_GET(self) -> None:
-        path = self.path.split("?")[0]  # strip query params
-
-        routes: dict[str, tuple[str, str]] = {
-            "/v1/forecast": ("weather.json", "application/json"),
-            "/v0/topstories.json": ("hn_topstories.json", "application/json"),
-            "/v0/item/1.json": ("hn_item_1.json", "application/json"),
-            "/v0/item/2.json": ("hn_item_2.json", "application/json"),
-            "/v0/item/3.json": ("hn_item_3.json", "application/json"),
-            "/v0/item/4.json": ("hn_item_4.json", "application/json"),
-            "/v0/item/5.json": ("hn_item_5.json", "application/json"),
-            "/trending": ("github_trending.html", "text/html"),
-            "/trending/python": ("github_trending.html", "text/html"),
-            "/trending/go": ("github_trending.html", "text/html"),
-            "/api/recommendation": ("todo.json", "application/json"),
-            "/rss/feed": ("rss_feed.xml", "application/xml"),
-            "/health": ("", "text/plain"),
-        }
-
-        if path in routes:
-            fixture, content_type = routes[path]
-            body = _load_fixture(fixture) if fixture else "OK"
-            self._respond(200, body, content_type)
-        else:
-            self._respond(404, json.dumps({"error": f"Unknown path: {path}"}), "application/json")
-
-    def _respond(self, code: int, body: str, content_type: str) -> None:
-        self.send_response(code)
-        self.send_header("Content-Type", content_type)
+        start = time.perf_counter()
+        path, _, query = self.path.partition("?")
+
+        delay = _delay(_settings(path))
+        if delay > 0:
+            time.sleep(delay)
+
+        resp, label = _handle(path, {k.title(): v for k, v in self.headers.items()}, query)
+        self.send_response(resp.status)
+        for name, value in resp.headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(resp.body)))
         self.end_headers()
-        self.wfile.write(body.encode("utf-8"))
+        self.wfile.write(resp.body)
+
+        if label:
+            _LOG.record(label, resp.status, time.perf_counter() - start)
 
     def log_message(self, format: str, *args: object) -> None:
         """Minimal logging."""
         print(f"[fake-server] {args[0]}")
 
 
+# ── asyncio serving ───────────────────────────
+
+_REASONS = {
+    200: "OK",
+    304: "Not Modified",
+    404: "Not Found",
+    429: "Too Many Requests",
+    500: "Internal Server Error",
+}
+
+
+async def _serve_connection(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+    """Serve keep-alive GET requests on one connection until the client closes it."""
+    try:
+        while True:
+            request_line = await reader.readline()
+            if not request_line:
+                break
+            start = time.perf_counter()
+            _, target, version = request_line.decode("latin-1").split()
+
+            headers: dict[str, str] = {}
+            while (line := await reader.readline()) not in (b"\r\n", b"\n", b""):
+                name, _, value = line.decode("latin-1").partition(":")
+                headers[name.strip().title()] = value.strip()
+
+            path, _, query = target.partition("?")
+            delay = _delay(_settings(path))
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+            resp, label = _handle(path, headers, query)
+            head = [f"HTTP/1.1 {resp.status} {_REASONS.get(resp.status, '')}"]
+            head += [f"{k}: {v}" for k, v in resp.headers.items()]
+            head.append(f"Content-Length: {len(resp.body)}")
+            writer.write(("\r\n".join(head) + "\r\n\r\n").encode("latin-1") + resp.body)
+            await writer.drain()
+
+            if label:
+                _LOG.record(label, resp.status, time.perf_counter() - start)
+            print(f"[fake-server] {request_line.decode('latin-1').strip()}")
+
+            if headers.get("Connection", "").lower() == "close" or version == "HTTP/1.0":
+                break
+    except (ConnectionError, ValueError):
+        pass
+    finally:
+        writer.close()
+
+
+async def _serve_asyncio() -> None:
+    server = await asyncio.start_server(_serve_connection, "0.0.0.0", _PORT)
+    async with server:
+        await server.serve_forever()
+
+
 def main() -> None:
-    server = HTTPServer(("0.0.0.0", _PORT), FakeHandler)
-    print(f"🧪  Fake server listening on port {_PORT}")
+    print(f"🧪  Fake server listening on port {_PORT} ({_MODE}, {len(_FIXTURE_DATA)} fixtures)")
+    if _MODE == "asyncio":
+        asyncio.run(_serve_asyncio())
+        return
+    server = ThreadingHTTPServer(("0.0.0.0", _PORT), FakeHandler)
+    server.daemon_threads = True
     server.serve_forever()
 
 